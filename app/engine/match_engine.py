@@ -1,10 +1,32 @@
 import random
 import json
 from dataclasses import dataclass, field
-from typing import Optional, List
+from functools import lru_cache
+from typing import Optional, List, NamedTuple
 from app.models.player import Player, PlayerRole, BowlingType, PlayerTrait
 
 
+@lru_cache(maxsize=None)
+def _parse_traits(traits: str) -> frozenset:
+    """Parse a player's traits JSON once; every later ball reuses the set"""
+    return frozenset(json.loads(traits))
+
+
+class PlayerLite(NamedTuple):
+    """Database-free stand-in for Player in offline simulations.
+    Carries only the fields the engine reads; optional ones default to
+    None, as on a Player that was never saved."""
+    id: int
+    name: str
+    role: PlayerRole
+    bowling_type: BowlingType
+    batting: int
+    bowling: int
+    power: int = 50
+    traits: Optional[str] = None  # JSON list, as on Player
+    batting_intent: Optional[str] = None
+
+
 @dataclass
 class MatchContext:
     """Dynamic match context affecting all calculations"""
@@ -119,6 +141,8 @@ class InningsState:
     this_over: list = field(default_factory=list)  # list of outcomes for current over
 
     extras: int = 0
+    total_fours: int = 0   # innings-wide boundary tallies, kept alongside
+    total_sixes: int = 0   # each batter's own fours/sixes
     batting_team_id: Optional[int] = None
 
     @property
@@ -181,7 +205,37 @@ class MatchEngine:
         ("stumped", 0.02),
     ]
 
-    def __init__(self):
+    # Batting roll variance per aggression mode.
+    # Defend: Lower variance (safer, fewer big shots, fewer wickets)
+    # Balanced: Normal variance
+    # Attack: Higher variance (more big shots possible, but also more wickets)
+    AGGRESSION_MULTIPLIERS = {"defend": 0.7, "balanced": 1.0, "attack": 1.4}
+
+    # Base bonus for defend (safer), penalty for attack (riskier)
+    AGGRESSION_ADJUSTMENTS = {"defend": 8, "balanced": 0, "attack": -5}
+
+    # Batting intent variance modifier - affects variance based on player's natural style
+    # Higher variance = more boundaries possible, but also more risk of getting out
+    INTENT_MULTIPLIERS = {
+        "anchor": 0.75,          # Low variance - consistent run accumulation
+        "accumulator": 0.95,     # Slightly below average variance
+        "aggressive": 1.15,      # Above average variance
+        "power_hitter": 1.25,    # High variance - boom or bust
+    }
+
+    # Intent-based floor adjustment - slight safety net differences
+    # Anchors play percentage cricket, power hitters commit to shots
+    INTENT_FLOOR_BONUS = {
+        "anchor": 3,             # Anchors play safe - better defense
+        "accumulator": 0,        # Standard baseline
+        "aggressive": 0,         # Rely on variance, not floor
+        "power_hitter": 0,       # Rely on variance, not floor penalty
+    }
+
+    def __init__(self, rng=random):
+        # Any random.Random-compatible source; simulation scripts pass a
+        # seeded random.Random per worker so streams stay independent
+        self.rng = rng
         self.innings1: Optional[InningsState] = None
         self.innings2: Optional[InningsState] = None
         self.current_innings: Optional[InningsState] = None
@@ -209,7 +263,7 @@ class MatchEngine:
         if not batter.traits:
             return 0
         
-        traits = json.loads(batter.traits)
+        traits = _parse_traits(batter.traits)
         bonus = 0
         
         if PlayerTrait.CLUTCH.value in traits and context.is_pressure_cooker:
@@ -226,7 +280,7 @@ class MatchEngine:
         if not bowler.traits:
             return 0
 
-        traits = json.loads(bowler.traits)
+        traits = _parse_traits(bowler.traits)
         bonus = 0
 
         if PlayerTrait.CLUTCH.value in traits and context.is_pressure_cooker:
@@ -287,8 +341,14 @@ class MatchEngine:
     ) -> BallOutcome:
         """New interactive ball calculation system"""
         context = innings_state.context
-        batter_state = innings_state.batter_states.setdefault(batter.id, BatterState(player_id=batter.id))
-        bowler_state = innings_state.bowler_states.setdefault(bowler.id, BowlerState(player_id=bowler.id))
+        # Look up before creating: setdefault would build a throwaway state
+        # object on every ball
+        batter_state = innings_state.batter_states.get(batter.id)
+        if batter_state is None:
+            batter_state = innings_state.batter_states[batter.id] = BatterState(player_id=batter.id)
+        bowler_state = innings_state.bowler_states.get(bowler.id)
+        if bowler_state is None:
+            bowler_state = innings_state.bowler_states[bowler.id] = BowlerState(player_id=bowler.id)
 
         # Step 1: Calculate Bowling Difficulty (The Target Score)
         # Scale bowling to 78% for balanced T20-like scoring rates
@@ -300,34 +360,13 @@ class MatchEngine:
         bowling_difficulty += self._apply_bowler_traits(bowler, context)
 
         # Step 2: The Batsman's Action (The Roll)
-        # Defend: Lower variance (safer, fewer big shots, fewer wickets)
-        # Balanced: Normal variance
-        # Attack: Higher variance (more big shots possible, but also more wickets)
-        skill_multiplier = {"defend": 0.7, "balanced": 1.0, "attack": 1.4}[aggression]
-
-        # Apply batting intent modifier - affects variance based on player's natural style
-        # Higher variance = more boundaries possible, but also more risk of getting out
-        intent_multipliers = {
-            "anchor": 0.75,          # Low variance - consistent run accumulation
-            "accumulator": 0.95,     # Slightly below average variance
-            "aggressive": 1.15,      # Above average variance
-            "power_hitter": 1.25,    # High variance - boom or bust
-        }
+        # Variance and floor come from the aggression mode and the batter's
+        # natural intent (see the tables on the class)
         batter_intent = getattr(batter, 'batting_intent', 'accumulator')
-        skill_multiplier *= intent_multipliers.get(batter_intent, 1.0)
-
-        # Intent-based floor adjustment - slight safety net differences
-        # Anchors play percentage cricket, power hitters commit to shots
-        intent_floor_bonus = {
-            "anchor": 3,             # Anchors play safe - better defense
-            "accumulator": 0,        # Standard baseline
-            "aggressive": 0,         # Rely on variance, not floor
-            "power_hitter": 0,       # Rely on variance, not floor penalty
-        }
-
-        # Base bonus for defend (safer), penalty for attack (riskier)
-        base_adjustment = {"defend": 8, "balanced": 0, "attack": -5}[aggression]
-        base_adjustment += intent_floor_bonus.get(batter_intent, 0)
+        skill_multiplier = self.AGGRESSION_MULTIPLIERS[aggression]
+        skill_multiplier *= self.INTENT_MULTIPLIERS.get(batter_intent, 1.0)
+        base_adjustment = self.AGGRESSION_ADJUSTMENTS[aggression]
+        base_adjustment += self.INTENT_FLOOR_BONUS.get(batter_intent, 0)
 
         # CRITICAL FIX: Minimum effective batting to prevent tail-ender massacre
         # Even tail-enders can block and survive - they don't get out every ball
@@ -338,7 +377,7 @@ class MatchEngine:
         # Base is 1/3 of batting, variable portion is 2/3 * multiplier
         batting_base = effective_batting // 3 + base_adjustment
         batting_variable = int(effective_batting * 2 // 3 * skill_multiplier)
-        batting_roll = batting_base + random.randint(0, batting_variable)
+        batting_roll = batting_base + self.rng.randint(0, batting_variable)
         batting_roll += self._apply_batter_traits(batter, context, batter_state)
 
         # Apply run rate governors to keep scores in 50-260 range
@@ -365,16 +404,16 @@ class MatchEngine:
             attack_boundary_threshold = boundary_threshold - 8  # Lower threshold in attack mode
             if margin >= boundary_threshold or (aggression == "attack" and margin >= attack_boundary_threshold):
                 # Boundary - threshold adjusted based on run rate
-                is_six = random.random() < (batter.power / 170)
+                is_six = self.rng.random() < (batter.power / 170)
                 outcome.runs = 6 if is_six else 4
                 outcome.is_boundary = True
                 outcome.is_six = is_six
                 outcome.commentary = f"BOOM! {batter.name} hits it for {'SIX' if is_six else 'FOUR'}!"
             elif margin >= 6:
-                outcome.runs = random.choice([2, 2, 3])
+                outcome.runs = self.rng.choice([2, 2, 3])
                 outcome.commentary = f"Good shot! {batter.name} gets {outcome.runs} runs."
             else:
-                outcome.runs = random.choice([0, 1, 1, 1])  # Singles with occasional dot
+                outcome.runs = self.rng.choice([0, 1, 1, 1])  # Singles with occasional dot
                 outcome.commentary = f"{batter.name} pushes for {outcome.runs}." if outcome.runs else f"{batter.name} defends."
         else:
             # Bowler Wins - calibrated for ~3-5% wicket rate per ball
@@ -383,28 +422,28 @@ class MatchEngine:
             if margin_abs >= 38:  # Increased from 34 for fewer clean wickets
                 # Clean Wicket - batter completely beaten
                 outcome.is_wicket = True
-                outcome.dismissal_type = random.choice(["bowled", "lbw"])
+                outcome.dismissal_type = self.rng.choice(["bowled", "lbw"])
                 outcome.commentary = f"WICKET! {bowler.name} {'cleans him up' if outcome.dismissal_type == 'bowled' else 'traps him in front'}!"
             elif margin_abs >= 22:  # Edge zone now -22 to -38 (was -20 to -34)
                 # Edge / Catch Chance - 25% catch success (reduced from 28%)
-                if random.random() < 0.25:
+                if self.rng.random() < 0.25:
                     outcome.is_wicket = True
-                    outcome.dismissal_type = random.choice(["caught", "caught_behind"])
+                    outcome.dismissal_type = self.rng.choice(["caught", "caught_behind"])
                     outcome.commentary = f"OUT! {batter.name} edges it to {'the keeper' if outcome.dismissal_type == 'caught_behind' else 'a fielder'}!"
                 else:
                     # Beaten/dropped - can still get runs off edges
-                    outcome.runs = random.choice([0, 0, 1, 1])
-                    if random.random() < 0.25:
+                    outcome.runs = self.rng.choice([0, 0, 1, 1])
+                    if self.rng.random() < 0.25:
                         outcome.commentary = f"CHANCE! But the catch goes down!"
                     else:
                         outcome.commentary = f"{batter.name} is beaten but survives!"
             elif margin_abs >= 12:  # Increased from 10
                 # Beaten but survives - mix of dots and singles
-                outcome.runs = random.choice([0, 0, 1, 1, 1])
+                outcome.runs = self.rng.choice([0, 0, 1, 1, 1])
                 outcome.commentary = f"{batter.name} is beaten but survives!" if outcome.runs == 0 else f"Pushed into a gap for a single!"
             else:
                 # Close contest - bowler slightly ahead but batter rotates strike
-                outcome.runs = random.choice([0, 1, 1, 1, 2])
+                outcome.runs = self.rng.choice([0, 1, 1, 1, 2])
                 outcome.commentary = f"{batter.name} defends solidly." if outcome.runs == 0 else f"{batter.name} works it away for {outcome.runs}."
 
         return outcome
@@ -421,7 +460,7 @@ class MatchEngine:
 
         # Check for extras first
         # Simplified extras: 2% chance of wide/no ball
-        extra_roll = random.random()
+        extra_roll = self.rng.random()
         if extra_roll < 0.015:
             return BallOutcome(
                 runs=1,
@@ -430,7 +469,7 @@ class MatchEngine:
             )
         if extra_roll < 0.02:
             # No ball can still be hit
-            runs = random.choices([0, 1, 2, 4, 6], weights=[0.3, 0.3, 0.1, 0.2, 0.1])[0]
+            runs = self.rng.choices([0, 1, 2, 4, 6], weights=[0.3, 0.3, 0.1, 0.2, 0.1])[0]
             return BallOutcome(
                 runs=runs + 1,
                 is_no_ball=True,
@@ -494,7 +533,7 @@ class MatchEngine:
 
         # Weighted selection by bowling skill
         weights = [b.bowling for b in available]
-        return random.choices(available, weights=weights)[0]
+        return self.rng.choices(available, weights=weights)[0]
 
     def simulate_over(self, innings: InningsState, aggression: str = "balanced") -> list[BallOutcome]:
         """Simulate a single over"""
@@ -522,9 +561,12 @@ class MatchEngine:
 
         innings.this_over = []
 
+        # Batters by id, built once per over rather than scanned for every ball
+        batters = {p.id: p for p in innings.batting_team}
+
         while balls_bowled < 6 and not innings.is_innings_complete:
             # Get current batter
-            striker = next(p for p in innings.batting_team if p.id == innings.striker_id)
+            striker = batters[innings.striker_id]
 
             # Simulate ball
             outcome = self._simulate_ball(striker, bowler, innings, fielders, aggression)
@@ -542,8 +584,10 @@ class MatchEngine:
                 batter_innings.runs += outcome.runs
                 if outcome.is_boundary and not outcome.is_six:
                     batter_innings.fours += 1
+                    innings.total_fours += 1
                 if outcome.is_six:
                     batter_innings.sixes += 1
+                    innings.total_sixes += 1
 
                 # Update batter state
                 b_state = innings.batter_states[striker.id]
@@ -596,7 +640,7 @@ class MatchEngine:
                     # Bring in next batter
                     if innings.next_batter_index < len(innings.batting_order):
                         next_batter_id = innings.batting_order[innings.next_batter_index]
-                        next_batter = next(p for p in innings.batting_team if p.id == next_batter_id)
+                        next_batter = batters[next_batter_id]
                         innings.striker_id = next_batter_id
                         innings.batter_innings[next_batter_id] = BatterInnings(player=next_batter)
 
@@ -8,6 +8,7 @@ from __future__ import annotations
 import random
 import json
 from dataclasses import dataclass, field, asdict
+from functools import lru_cache
 from typing import Optional, List, Dict, Tuple, Union, TYPE_CHECKING, Any
 
 from app.engine.dna import (
@@ -510,14 +511,20 @@ def safety_net(innings: InningsState) -> float:
 
 # --- Trait modifiers ---
 
-def _get_traits(player) -> list:
-    """Parse trait list from player's JSON traits field."""
-    if not player.traits:
-        return []
+@lru_cache(maxsize=None)
+def _parse_traits(traits: str) -> frozenset:
+    """Parse a traits JSON string once; later balls reuse the set."""
     try:
-        return json.loads(player.traits)
+        return frozenset(json.loads(traits))
     except (json.JSONDecodeError, TypeError):
-        return []
+        return frozenset()
+
+
+def _get_traits(player) -> frozenset:
+    """Trait set from player's JSON traits field."""
+    if not player.traits:
+        return frozenset()
+    return _parse_traits(player.traits)
 
 
 def trait_modifier_batter(batter, innings: InningsState) -> float:
@@ -991,9 +998,10 @@ class MatchEngineV2:
         fielders = [p for p in innings.bowling_team if p.id != bowler.id]
         innings.this_over = []
         innings.delivery_counts_this_over = {}
+        batters = {p.id: p for p in innings.batting_team}
 
         while balls_bowled < 6 and not innings.is_innings_complete:
-            striker = next(p for p in innings.batting_team if p.id == innings.striker_id)
+            striker = batters[innings.striker_id]
 
             outcome = self._simulate_ball(striker, bowler, innings, fielders, aggression)
             outcomes.append(outcome)
@@ -1091,7 +1099,7 @@ class MatchEngineV2:
                     # Bring in next batter
                     if innings.next_batter_index < len(innings.batting_order):
                         next_batter_id = innings.batting_order[innings.next_batter_index]
-                        next_batter = next(p for p in innings.batting_team if p.id == next_batter_id)
+                        next_batter = batters[next_batter_id]
                         innings.striker_id = next_batter_id
                         innings.batter_innings[next_batter_id] = BatterInnings(player=next_batter)
                         innings.batter_states[next_batter_id] = BatterState(player_id=next_batter_id)
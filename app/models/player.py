@@ -93,27 +93,37 @@ class Player(Base):
     base_price: Mapped[int] = mapped_column(Integer, default=2000000)  # In INR
     sold_price: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
+    def _parsed_dna(self, cache_attr: str, raw: Optional[str], parse):
+        """parse(json.loads(raw)), reused until the JSON column changes.
+        The match engine reads DNA on every ball; the cache is keyed on the
+        exact string, so assigning new JSON (e.g. after training) re-parses.
+
+        Every access returns the same object, not a copy. A caller that
+        mutates it must write the JSON back (as training_engine_v2 does),
+        otherwise the player's DNA silently diverges from the database."""
+        cached = self.__dict__.get(cache_attr)
+        if cached is not None and cached[0] is raw:
+            return cached[1]
+        dna = None
+        if raw:
+            try:
+                dna = parse(json.loads(raw))
+            except (json.JSONDecodeError, TypeError):
+                dna = None
+        self.__dict__[cache_attr] = (raw, dna)
+        return dna
+
     @property
     def batting_dna(self):
-        """Deserialize BatterDNA from JSON."""
-        if not self.batting_dna_json:
-            return None
-        try:
-            from app.engine.dna import BatterDNA
-            return BatterDNA.from_dict(json.loads(self.batting_dna_json))
-        except (json.JSONDecodeError, TypeError):
-            return None
+        """Deserialize BatterDNA from JSON (shared instance; see _parsed_dna)."""
+        from app.engine.dna import BatterDNA
+        return self._parsed_dna("_batting_dna_cache", self.batting_dna_json, BatterDNA.from_dict)
 
     @property
     def bowler_dna(self):
-        """Deserialize PacerDNA or SpinnerDNA from JSON."""
-        if not self.bowler_dna_json:
-            return None
-        try:
-            from app.engine.dna import bowler_dna_from_dict
-            return bowler_dna_from_dict(json.loads(self.bowler_dna_json))
-        except (json.JSONDecodeError, TypeError):
-            return None
+        """Deserialize PacerDNA or SpinnerDNA from JSON (shared instance; see _parsed_dna)."""
+        from app.engine.dna import bowler_dna_from_dict
+        return self._parsed_dna("_bowler_dna_cache", self.bowler_dna_json, bowler_dna_from_dict)
 
     @property
     def overall_rating(self) -> int:
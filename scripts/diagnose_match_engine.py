@@ -13,6 +13,8 @@ from app.models.player import Player, PlayerRole, BowlingType, BattingStyle
 from statistics import mean, stdev
 from collections import Counter
 
+_EMPTY_TRAITS = json.dumps([])
+
 
 def create_player(player_id: int, name: str, role: PlayerRole, batting: int, bowling: int, power: int = 50) -> Player:
     """Create a player without database"""
@@ -37,7 +39,7 @@ def create_player(player_id: int, name: str, role: PlayerRole, batting: int, bow
         temperament=60,
         consistency=60,
         form=1.0,
-        traits=json.dumps([]),
+        traits=_EMPTY_TRAITS,
         base_price=5000000,
     )
     player.id = player_id
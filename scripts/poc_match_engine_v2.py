@@ -3,23 +3,35 @@
 Match Engine v2 POC — Standalone simulation script.
 No dependencies on the existing codebase. Pure Python + stdlib.
 
-Run: python scripts/poc_match_engine_v2.py [num_matches]
+Run: python scripts/poc_match_engine_v2.py [num_matches] [--smoke | --full]
+
+--smoke cuts every category's ball count by 10x (and defaults to 10 matches)
+for quick iteration. Count thresholds are sized for the full run, so smoke
+mode reports failures but always exits 0; only --full (the default), with
+the release-gating sample sizes, sets a failing exit status.
 """
 
 import random
 import math
+import multiprocessing
 import sys
+import io
+from contextlib import redirect_stdout
 from dataclasses import dataclass, field
 from typing import Optional, Dict, List, Tuple
-from statistics import mean, stdev, median
-from collections import Counter
+from array import array
+from collections import ChainMap, Counter
+from bisect import bisect_right
+from functools import lru_cache
+from statistics import NormalDist
+from itertools import accumulate
 
 
 # ================================================================
 # 1. DATA CLASSES
 # ================================================================
 
-@dataclass
+@dataclass(slots=True)
 class BatterDNA:
     vs_pace: int = 50
     vs_bounce: int = 50
@@ -35,7 +47,7 @@ class BatterDNA:
                 + self.off_side + self.leg_side) / 6
 
 
-@dataclass
+@dataclass(slots=True)
 class PacerDNA:
     speed: int = 135      # kph, 120-155
     swing: int = 50
@@ -50,7 +62,7 @@ class PacerDNA:
         return max(0, min(100, (self.speed - 115) * 2.5))
 
 
-@dataclass
+@dataclass(slots=True)
 class SpinnerDNA:
     turn: int = 50
     flight: int = 50
@@ -61,7 +73,7 @@ class SpinnerDNA:
         return (self.turn + self.flight + self.variation + self.control) / 4
 
 
-@dataclass
+@dataclass(slots=True)
 class PitchDNA:
     name: str = "balanced"
     pace_assist: int = 55
@@ -71,16 +83,23 @@ class PitchDNA:
     deterioration: int = 35
 
 
-@dataclass
+@dataclass(slots=True)
 class Delivery:
     name: str
     bowler_weights: Dict[str, float]
     batter_weights: Dict[str, float]
     exec_difficulty: int
     dismissal_weights: Dict[str, float] = field(default_factory=dict)
+    # Derived from dismissal_weights for random.choices(cum_weights=...)
+    dismissal_types: List[str] = field(init=False, repr=False)
+    dismissal_cum_weights: List[float] = field(init=False, repr=False)
 
+    def __post_init__(self):
+        self.dismissal_types = list(self.dismissal_weights.keys())
+        self.dismissal_cum_weights = list(accumulate(self.dismissal_weights.values()))
 
-@dataclass
+
+@dataclass(slots=True)
 class Player:
     name: str
     role: str                                   # batsman / bowler / all_rounder / wicket_keeper
@@ -89,6 +108,36 @@ class Player:
     bowling_type: str = "none"                  # pace / medium / off_spin / leg_spin / left_arm_spin
     traits: List[str] = field(default_factory=list)
     tier: str = "good"
+    # Derived once from bowler_dna; innings and verification loops read
+    # these instead of re-checking the DNA type and rebuilding the list
+    is_pacer: bool = field(init=False, repr=False, compare=False)
+    repertoire: List[Delivery] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.is_pacer = isinstance(self.bowler_dna, PacerDNA)
+        self.repertoire = get_repertoire(self)
+
+
+# Closed sets of outcome names; innings tally them into int vectors indexed
+# by position so aggregation is element-wise sums, not dict merges.
+DISMISSAL_TYPES = ("bowled", "caught", "caught_behind", "hit_wicket", "lbw", "stumped", "top_edge")
+CONTACT_TYPES = ("perfect", "good", "decent", "defended", "beaten", "edge", "clean_beat")
+DISMISSAL_IDX = {name: i for i, name in enumerate(DISMISSAL_TYPES)}
+CONTACT_IDX = {name: i for i, name in enumerate(CONTACT_TYPES)}
+
+# Ball log codes: one byte per ball, bits 0-2 runs (no-balls max out at 7),
+# then wicket / boundary / six / extra (wide or no-ball) flags
+BALL_RUNS = 0b111
+BALL_WICKET = 1 << 3
+BALL_BOUNDARY = 1 << 4
+BALL_SIX = 1 << 5
+BALL_EXTRA = 1 << 6
+
+
+def ball_code(runs: int, is_wicket: bool = False, is_boundary: bool = False,
+              is_six: bool = False, is_extra: bool = False) -> int:
+    return (runs | (BALL_WICKET if is_wicket else 0) | (BALL_BOUNDARY if is_boundary else 0)
+            | (BALL_SIX if is_six else 0) | (BALL_EXTRA if is_extra else 0))
 
 
 @dataclass
@@ -149,9 +198,16 @@ class InningsState:
     batter_records: Dict[str, BatterInningsRecord] = field(default_factory=dict)
     bowler_records: Dict[str, BowlerSpellRecord] = field(default_factory=dict)
     bowler_overs_count: Dict[str, int] = field(default_factory=dict)
+    # Read by prepare_ball only when no explicit balls_faced is passed;
+    # simulate_innings passes it from the striker's record instead
     balls_faced: Dict[str, int] = field(default_factory=dict)
 
-    all_results: List[BallResult] = field(default_factory=list)
+    # Packed ball log (see ball_code) and the log index each over starts at
+    ball_log: array = field(default_factory=lambda: array("B"))
+    over_starts: List[int] = field(default_factory=list)
+    # Running tallies, indexed like DISMISSAL_TYPES / CONTACT_TYPES
+    dismissal_counts: List[int] = field(default_factory=lambda: [0] * len(DISMISSAL_TYPES))
+    contact_counts: List[int] = field(default_factory=lambda: [0] * len(CONTACT_TYPES))
 
     @property
     def run_rate(self):
@@ -286,9 +342,9 @@ def clamp(val, lo=0, hi=100):
     return max(lo, min(hi, val))
 
 
-def gen_attr(base, variance=12, minimum=5):
+def gen_attr(base, variance=12, minimum=5, rng=random):
     """Generate attribute with variance, clamped 5-100."""
-    return clamp(base + random.randint(-variance, variance), minimum, 100)
+    return clamp(base + rng.randint(-variance, variance), minimum, 100)
 
 
 def speed_to_factor(speed_kph):
@@ -363,6 +419,28 @@ def get_sigma(overs: int) -> float:
     return 14.0         # Death overs: high variance boom/bust
 
 
+BALL_AGE_STATS = ("swing", "turn", "flight")
+
+
+@dataclass
+class OverContext:
+    """Per-over constants: fatigue, sigma and ball age don't change mid-over.
+    attack memoises this over's bowler's compressed attack rating per delivery."""
+    fatigue: float
+    sigma: float
+    ball_age: Dict[str, float]
+    attack: Dict[str, float] = field(default_factory=dict)
+
+
+def make_over_context(innings: InningsState, bowler: Player) -> OverContext:
+    overs = innings.overs
+    return OverContext(
+        fatigue=get_fatigue(innings.bowler_overs_count.get(bowler.name, 0)),
+        sigma=get_sigma(overs),
+        ball_age={stat: ball_age_modifier(overs, stat) for stat in BALL_AGE_STATS},
+    )
+
+
 def get_settled_modifier(balls_faced: int) -> float:
     if balls_faced <= 5:
         return -3.0    # New batter vulnerable but not helpless
@@ -384,121 +462,123 @@ def get_deterioration_mod(pitch: PitchDNA, is_second_innings: bool) -> float:
 # 5. PLAYER GENERATION
 # ================================================================
 
-def apply_weaknesses(dna: BatterDNA, num_weaknesses: int = None):
+def apply_weaknesses(dna: BatterDNA, num_weaknesses: int = None, rng=random):
     """Force 1-2 weak attributes on every batter."""
     if num_weaknesses is None:
-        num_weaknesses = random.choices([1, 2], weights=[55, 45])[0]
+        num_weaknesses = rng.choices([1, 2], weights=[55, 45])[0]
 
     candidates = ["vs_pace", "vs_bounce", "vs_spin", "vs_deception", "off_side", "leg_side"]
-    weak_stats = random.sample(candidates, num_weaknesses)
+    weak_stats = rng.sample(candidates, num_weaknesses)
 
     avg_val = dna.avg()
     for stat in weak_stats:
-        reduction = random.randint(15, 25)
+        reduction = rng.randint(15, 25)
         new_val = clamp(int(avg_val - reduction), 10, 100)
         setattr(dna, stat, new_val)
 
     dna.weaknesses = weak_stats
 
 
-def generate_batsman(name: str, base: int, tier: str = "good") -> Player:
+def generate_batsman(name: str, base: int, tier: str = "good", rng=random) -> Player:
     dna = BatterDNA(
-        vs_pace=gen_attr(base + 5, 10),
-        vs_bounce=gen_attr(base, 12),
-        vs_spin=gen_attr(base, 12),
-        vs_deception=gen_attr(base - 5, 15),
-        off_side=gen_attr(base, 12),
-        leg_side=gen_attr(base, 12),
-        power=gen_attr(base - 5, 15),
+        vs_pace=gen_attr(base + 5, 10, rng=rng),
+        vs_bounce=gen_attr(base, 12, rng=rng),
+        vs_spin=gen_attr(base, 12, rng=rng),
+        vs_deception=gen_attr(base - 5, 15, rng=rng),
+        off_side=gen_attr(base, 12, rng=rng),
+        leg_side=gen_attr(base, 12, rng=rng),
+        power=gen_attr(base - 5, 15, rng=rng),
     )
-    apply_weaknesses(dna)
+    apply_weaknesses(dna, rng=rng)
     return Player(name=name, role="batsman", batting_dna=dna, tier=tier)
 
 
-def generate_bowler(name: str, base: int, bowling_type: str, tier: str = "good") -> Player:
+def generate_bowler(name: str, base: int, bowling_type: str, tier: str = "good",
+                    rng=random) -> Player:
     # Weak batting DNA
     bat_dna = BatterDNA(
-        vs_pace=gen_attr(28, 10), vs_bounce=gen_attr(25, 10),
-        vs_spin=gen_attr(25, 10), vs_deception=gen_attr(22, 10),
-        off_side=gen_attr(25, 10), leg_side=gen_attr(28, 10),
-        power=gen_attr(25, 10),
+        vs_pace=gen_attr(28, 10, rng=rng), vs_bounce=gen_attr(25, 10, rng=rng),
+        vs_spin=gen_attr(25, 10, rng=rng), vs_deception=gen_attr(22, 10, rng=rng),
+        off_side=gen_attr(25, 10, rng=rng), leg_side=gen_attr(28, 10, rng=rng),
+        power=gen_attr(25, 10, rng=rng),
     )
 
     if bowling_type in ("pace", "medium"):
         speed_base = {"pace": 142, "medium": 132}[bowling_type]
         bowl_dna = PacerDNA(
-            speed=clamp(speed_base + random.randint(-6, 6), 120, 155),
-            swing=gen_attr(base, 15),
-            bounce=gen_attr(base, 15),
-            control=gen_attr(base + 5, 10),
+            speed=clamp(speed_base + rng.randint(-6, 6), 120, 155),
+            swing=gen_attr(base, 15, rng=rng),
+            bounce=gen_attr(base, 15, rng=rng),
+            control=gen_attr(base + 5, 10, rng=rng),
         )
     else:
         bowl_dna = SpinnerDNA(
-            turn=gen_attr(base + 5, 12),
-            flight=gen_attr(base, 15),
-            variation=gen_attr(base, 15),
-            control=gen_attr(base + 5, 10),
+            turn=gen_attr(base + 5, 12, rng=rng),
+            flight=gen_attr(base, 15, rng=rng),
+            variation=gen_attr(base, 15, rng=rng),
+            control=gen_attr(base + 5, 10, rng=rng),
         )
 
     return Player(name=name, role="bowler", batting_dna=bat_dna,
                   bowler_dna=bowl_dna, bowling_type=bowling_type, tier=tier)
 
 
-def generate_allrounder(name: str, base: int, bowling_type: str, tier: str = "good") -> Player:
+def generate_allrounder(name: str, base: int, bowling_type: str, tier: str = "good",
+                        rng=random) -> Player:
     dna = BatterDNA(
-        vs_pace=gen_attr(base, 12), vs_bounce=gen_attr(base - 3, 12),
-        vs_spin=gen_attr(base - 3, 12), vs_deception=gen_attr(base - 5, 12),
-        off_side=gen_attr(base - 2, 12), leg_side=gen_attr(base - 2, 12),
-        power=gen_attr(base - 5, 15),
+        vs_pace=gen_attr(base, 12, rng=rng), vs_bounce=gen_attr(base - 3, 12, rng=rng),
+        vs_spin=gen_attr(base - 3, 12, rng=rng), vs_deception=gen_attr(base - 5, 12, rng=rng),
+        off_side=gen_attr(base - 2, 12, rng=rng), leg_side=gen_attr(base - 2, 12, rng=rng),
+        power=gen_attr(base - 5, 15, rng=rng),
     )
-    apply_weaknesses(dna, num_weaknesses=1)
+    apply_weaknesses(dna, num_weaknesses=1, rng=rng)
 
     if bowling_type in ("pace", "medium"):
         speed_base = {"pace": 138, "medium": 130}[bowling_type]
         bowl_dna = PacerDNA(
-            speed=clamp(speed_base + random.randint(-5, 5), 120, 150),
-            swing=gen_attr(base - 5, 12),
-            bounce=gen_attr(base - 5, 12),
-            control=gen_attr(base, 10),
+            speed=clamp(speed_base + rng.randint(-5, 5), 120, 150),
+            swing=gen_attr(base - 5, 12, rng=rng),
+            bounce=gen_attr(base - 5, 12, rng=rng),
+            control=gen_attr(base, 10, rng=rng),
         )
     else:
         bowl_dna = SpinnerDNA(
-            turn=gen_attr(base, 12),
-            flight=gen_attr(base - 5, 12),
-            variation=gen_attr(base - 5, 12),
-            control=gen_attr(base, 10),
+            turn=gen_attr(base, 12, rng=rng),
+            flight=gen_attr(base - 5, 12, rng=rng),
+            variation=gen_attr(base - 5, 12, rng=rng),
+            control=gen_attr(base, 10, rng=rng),
         )
 
     return Player(name=name, role="all_rounder", batting_dna=dna,
                   bowler_dna=bowl_dna, bowling_type=bowling_type, tier=tier)
 
 
-def generate_wk(name: str, base: int, tier: str = "good") -> Player:
+def generate_wk(name: str, base: int, tier: str = "good", rng=random) -> Player:
     dna = BatterDNA(
-        vs_pace=gen_attr(base, 12), vs_bounce=gen_attr(base - 3, 12),
-        vs_spin=gen_attr(base + 2, 12), vs_deception=gen_attr(base - 2, 12),
-        off_side=gen_attr(base, 12), leg_side=gen_attr(base + 3, 12),
-        power=gen_attr(base - 5, 15),
+        vs_pace=gen_attr(base, 12, rng=rng), vs_bounce=gen_attr(base - 3, 12, rng=rng),
+        vs_spin=gen_attr(base + 2, 12, rng=rng), vs_deception=gen_attr(base - 2, 12, rng=rng),
+        off_side=gen_attr(base, 12, rng=rng), leg_side=gen_attr(base + 3, 12, rng=rng),
+        power=gen_attr(base - 5, 15, rng=rng),
     )
-    apply_weaknesses(dna, num_weaknesses=1)
+    apply_weaknesses(dna, num_weaknesses=1, rng=rng)
     return Player(name=name, role="wicket_keeper", batting_dna=dna, tier=tier)
 
 
-def generate_team(tier: str = "good", name_prefix: str = "A") -> List[Player]:
+def generate_team(tier: str = "good", name_prefix: str = "A", rng=random) -> List[Player]:
     """Generate a realistic T20 team (4 bat + 1 WK + 2 AR + 4 bowlers)."""
     base = {"elite": 82, "star": 75, "good": 67, "solid": 60}[tier]
     return [
-        generate_batsman(f"{name_prefix}-Opener1", base + 5, tier),
-        generate_batsman(f"{name_prefix}-Opener2", base + 3, tier),
-        generate_batsman(f"{name_prefix}-No3", base + 4, tier),
-        generate_wk(f"{name_prefix}-WK4", base - 2, tier),
-        generate_batsman(f"{name_prefix}-Bat5", base, tier),
-        generate_allrounder(f"{name_prefix}-AR6", base - 3, "medium", tier),
-        generate_allrounder(f"{name_prefix}-AR7", base - 5, "off_spin", tier),
-        generate_bowler(f"{name_prefix}-Pace8", base + 2, "pace", tier),
-        generate_bowler(f"{name_prefix}-Pace9", base, "pace", tier),
-        generate_bowler(f"{name_prefix}-Spin10", base - 2, "leg_spin", tier),
-        generate_bowler(f"{name_prefix}-Spin11", base + 1, "off_spin", tier),
+        generate_batsman(f"{name_prefix}-Opener1", base + 5, tier, rng=rng),
+        generate_batsman(f"{name_prefix}-Opener2", base + 3, tier, rng=rng),
+        generate_batsman(f"{name_prefix}-No3", base + 4, tier, rng=rng),
+        generate_wk(f"{name_prefix}-WK4", base - 2, tier, rng=rng),
+        generate_batsman(f"{name_prefix}-Bat5", base, tier, rng=rng),
+        generate_allrounder(f"{name_prefix}-AR6", base - 3, "medium", tier, rng=rng),
+        generate_allrounder(f"{name_prefix}-AR7", base - 5, "off_spin", tier, rng=rng),
+        generate_bowler(f"{name_prefix}-Pace8", base + 2, "pace", tier, rng=rng),
+        generate_bowler(f"{name_prefix}-Pace9", base, "pace", tier, rng=rng),
+        generate_bowler(f"{name_prefix}-Spin10", base - 2, "leg_spin", tier, rng=rng),
+        generate_bowler(f"{name_prefix}-Spin11", base + 1, "off_spin", tier, rng=rng),
     ]
 
 
@@ -539,15 +619,16 @@ def get_repertoire(player: Player) -> List[Delivery]:
     return []
 
 
-def choose_random_delivery(repertoire: List[Delivery]) -> Delivery:
-    return random.choice(repertoire)
+def choose_random_delivery(repertoire: List[Delivery], rng=random) -> Delivery:
+    return rng.choice(repertoire)
 
 
-def choose_optimal_delivery(repertoire: List[Delivery], batter: Player) -> Delivery:
+def choose_optimal_delivery(repertoire: List[Delivery], batter: Player,
+                            rng=random) -> Delivery:
     """Captain picks smartly 60% of the time, random 40%.
     When smart, picks from top 3 with weighted random."""
-    if random.random() < 0.45:
-        return random.choice(repertoire)
+    if rng.random() < 0.45:
+        return rng.choice(repertoire)
 
     scored = []
     for d in repertoire:
@@ -560,7 +641,7 @@ def choose_optimal_delivery(repertoire: List[Delivery], batter: Player) -> Deliv
     top_n = scored[:3]
     deliveries = [s[0] for s in top_n]
     weights = [3, 2, 1][:len(deliveries)]
-    return random.choices(deliveries, weights=weights)[0]
+    return rng.choices(deliveries, weights=weights)[0]
 
 
 # ================================================================
@@ -568,11 +649,24 @@ def choose_optimal_delivery(repertoire: List[Delivery], batter: Player) -> Deliv
 # ================================================================
 
 def execution_check(bowler: Player, delivery: Delivery, pitch: PitchDNA,
-                    fatigue: float, overs: int) -> str:
+                    fatigue: float, overs: int, rng=random) -> str:
     """Check if bowler lands the intended delivery."""
     control = bowler.bowler_dna.control * fatigue
-    roll = random.gauss(control, 8)
+    roll = rng.gauss(control, EXEC_SIGMA)
+    return classify_execution(roll, execution_target(delivery, overs))
+
+
+def execution_probability(bowler: Player, delivery: Delivery,
+                          fatigue: float, overs: int) -> float:
+    """Exact chance that execution_check returns "executed":
+    P(gauss(control, EXEC_SIGMA) >= target)."""
+    control = bowler.bowler_dna.control * fatigue
+    target = execution_target(delivery, overs)
+    return 0.5 * math.erfc((target - control) / (EXEC_SIGMA * math.sqrt(2)))
 
+
+def execution_target(delivery: Delivery, overs: int) -> int:
+    """Control roll a bowler needs to land this delivery in the current phase."""
     target = delivery.exec_difficulty
     # Phase modifier: new ball makes swing easier, old ball makes yorkers easier
     if overs < 6:
@@ -585,17 +679,28 @@ def execution_check(bowler: Player, delivery: Delivery, pitch: PitchDNA,
             target -= 4
         elif delivery.name == "bouncer":
             target += 3
+    return target
+
 
+# Execution rolls are gauss(control, EXEC_SIGMA); missing the target by more
+# than BAD_MISS_BY is a bad miss. A miss hands the batter a uniform bonus.
+EXEC_SIGMA = 8
+BAD_MISS_BY = 15
+MISS_BONUS = {"slight_miss": (4, 10), "bad_miss": (12, 18)}
+
+
+def classify_execution(roll: float, target: float) -> str:
     if roll >= target:
         return "executed"
     miss = target - roll
-    if miss > 15:
+    if miss > BAD_MISS_BY:
         return "bad_miss"
     return "slight_miss"
 
 
 def bowler_attack_rating(bowler: Player, delivery: Delivery, pitch: PitchDNA,
-                         overs: int, fatigue: float, is_second: bool) -> float:
+                         overs: int, fatigue: float, is_second: bool,
+                         ball_age: Dict[str, float] = None) -> float:
     """Calculate how dangerous this delivery is."""
     rating = 0.0
     dna = bowler.bowler_dna
@@ -609,7 +714,10 @@ def bowler_attack_rating(bowler: Player, delivery: Delivery, pitch: PitchDNA,
             pa = min(100, pa * get_deterioration_mod(pitch, True))
 
         effective = base_stat * (0.5 + pa * 0.01)
-        effective *= ball_age_modifier(overs, stat_name)
+        if ball_age is not None:
+            effective *= ball_age.get(stat_name, 1.0)
+        else:
+            effective *= ball_age_modifier(overs, stat_name)
         effective *= fatigue
         effective = min(120, effective)   # Allow deteriorated pitches to push beyond normal max
 
@@ -636,123 +744,140 @@ def tactical_bonus(batter: Player, delivery: Delivery) -> float:
     return max(-3.0, min(3.0, raw))
 
 
-def calculate_margin(attack: float, skill: float, tac_bonus: float,
-                     approach: str, sigma: float) -> float:
-    """Gaussian roll to determine margin.
-    Stats are compressed before this call so gaps are narrower.
-    Approach modifies sigma (variance) with small mean shifts.
-    Higher sigma = more extreme outcomes on BOTH sides."""
-    approach_mods = {
-        "survive":  (0.70, +3),     # Very tight variance, safe buffer
-        "rotate":   (0.90, +1.5),   # Slightly safe, standard play
-        "push":     (1.08, 0),      # More variance, neutral mean
-        "all_out":  (1.25, 0),      # High variance, neutral mean
-    }
-    sigma_mult, base_shift = approach_mods.get(approach, (0.90, +1))
-    adjusted_sigma = sigma * sigma_mult
+# Batting approach → (sigma multiplier, mean shift) for the Gaussian margin roll.
+# Stats are compressed before the roll so gaps are narrower; approach modifies
+# sigma (variance) with small mean shifts. Higher sigma = more extreme outcomes
+# on BOTH sides.
+APPROACH_MODS = {
+    "survive":  (0.70, +3),     # Very tight variance, safe buffer
+    "rotate":   (0.90, +1.5),   # Slightly safe, standard play
+    "push":     (1.08, 0),      # More variance, neutral mean
+    "all_out":  (1.25, 0),      # High variance, neutral mean
+}
 
-    batter_performance = random.gauss(skill + base_shift, adjusted_sigma)
-    difficulty = attack + tac_bonus
 
-    return batter_performance - difficulty
+# Contact bands, worst to best: a margin of at least CONTACT_FLOORS[i] earns
+# CONTACT_LADDER[i + 1]. Calibrated for compressed stat ranges (~28-73
+# effective); with sigma 10-14 they produce realistic T20 outcomes.
+# resolve_contact and outcome_table both read these.
+CONTACT_LADDER = ("clean_beat", "edge", "beaten", "defended", "decent", "good", "perfect")
+CONTACT_FLOORS = (-18, -12, -5, 5, 15, 25)
+CONTACT_BANDS = tuple(zip(CONTACT_LADDER, (-math.inf,) + CONTACT_FLOORS,
+                          CONTACT_FLOORS + (math.inf,)))
 
 
 def resolve_contact(margin: float) -> str:
-    """Map margin to contact quality.
-    Thresholds calibrated for compressed stat ranges (~28-73 effective).
-    With sigma 10-14, these produce realistic T20 outcomes."""
-    if margin >= 25:
-        return "perfect"
-    if margin >= 15:
-        return "good"
-    if margin >= 5:
-        return "decent"
-    if margin >= -5:
-        return "defended"
-    if margin >= -12:
-        return "beaten"
-    if margin >= -18:
-        return "edge"
-    return "clean_beat"
-
-
-def resolve_runs(contact: str, power: int, margin: float,
-                 pitch: PitchDNA, approach: str = "rotate") -> Tuple[int, bool, bool]:
+    """Map margin to contact quality (see CONTACT_FLOORS)."""
+    return CONTACT_LADDER[bisect_right(CONTACT_FLOORS, margin)]
+
+
+# Approach-specific run conversion: aggressive modes look for boundaries
+# and run harder; defensive modes block and rotate.
+BOUNDARY_MOD = {"survive": -0.18, "rotate": 0, "push": +0.10, "all_out": +0.22}
+SIX_MOD = {"survive": -0.10, "rotate": 0, "push": +0.05, "all_out": +0.15}
+RUN_CHOICES = {
+    # contact: (aggressive [push/all_out], survive, default)
+    "good":     ((2, 2, 3, 3), (2, 2, 3), (2, 2, 3)),
+    "decent":   ((1, 1, 2, 2, 2, 3), (0, 1, 1, 1, 1), (1, 1, 1, 2, 2)),
+    "defended": ((0, 0, 1, 1, 1, 1), (0, 0, 0, 0, 1), (0, 0, 0, 1, 1, 1)),
+}
+
+
+@dataclass
+class RunProfile:
+    """Run-conversion chances for one (power, approach) pair."""
+    perfect_six: float
+    good_boundary: float
+    good_six: float
+    decent_boundary: float
+    good_runs: Tuple[int, ...]
+    decent_runs: Tuple[int, ...]
+    defended_runs: Tuple[int, ...]
+
+
+@lru_cache(maxsize=None)
+def run_profile(power: int, approach: str = "rotate") -> RunProfile:
+    """Precompute the boundary/six chances resolve_runs rolls against."""
+    bmod = BOUNDARY_MOD.get(approach, 0)
+    smod = SIX_MOD.get(approach, 0)
+    slot = 0 if approach in ("push", "all_out") else 1 if approach == "survive" else 2
+    return RunProfile(
+        perfect_six=clamp(power / 160 + smod, 0.05, 0.75),
+        good_boundary=clamp(0.55 + power / 400 + bmod, 0.20, 0.90),
+        good_six=clamp(power / 250 + smod, 0.02, 0.50),
+        decent_boundary=clamp(0.08 + power / 800 + max(0, bmod * 0.5), 0.02, 0.25),
+        good_runs=RUN_CHOICES["good"][slot],
+        decent_runs=RUN_CHOICES["decent"][slot],
+        defended_runs=RUN_CHOICES["defended"][slot],
+    )
+
+
+def resolve_runs(contact: str, profile: RunProfile, rng=random) -> Tuple[int, bool, bool]:
     """
     Determine runs from contact quality.
-    Approach affects run conversion: aggressive modes look for boundaries
-    and run harder; defensive modes block and rotate.
     Returns (runs, is_boundary, is_six).
     """
-    # Approach-specific adjustments
-    boundary_mod = {"survive": -0.18, "rotate": 0, "push": +0.10, "all_out": +0.22}
-    six_mod = {"survive": -0.10, "rotate": 0, "push": +0.05, "all_out": +0.15}
-    bmod = boundary_mod.get(approach, 0)
-    smod = six_mod.get(approach, 0)
-
     if contact == "perfect":
-        six_chance = clamp(power / 160 + smod, 0.05, 0.75)
-        if random.random() < six_chance:
+        if rng.random() < profile.perfect_six:
             return 6, True, True
         return 4, True, False
 
     if contact == "good":
-        boundary_chance = clamp(0.55 + power / 400 + bmod, 0.20, 0.90)
-        if random.random() < boundary_chance:
-            six_chance = clamp(power / 250 + smod, 0.02, 0.50)
-            if random.random() < six_chance:
+        if rng.random() < profile.good_boundary:
+            if rng.random() < profile.good_six:
                 return 6, True, True
             return 4, True, False
-        if approach in ("push", "all_out"):
-            return random.choice([2, 2, 3, 3]), False, False
-        return random.choice([2, 2, 3]), False, False
+        return rng.choice(profile.good_runs), False, False
 
     if contact == "decent":
-        boundary_chance = clamp(0.08 + power / 800 + max(0, bmod * 0.5), 0.02, 0.25)
-        if random.random() < boundary_chance:
+        if rng.random() < profile.decent_boundary:
             return 4, True, False
-        if approach in ("push", "all_out"):
-            return random.choice([1, 1, 2, 2, 2, 3]), False, False
-        elif approach == "survive":
-            return random.choice([0, 1, 1, 1, 1]), False, False
-        return random.choice([1, 1, 1, 2, 2]), False, False
+        return rng.choice(profile.decent_runs), False, False
 
     if contact == "defended":
-        if approach in ("push", "all_out"):
-            return random.choice([0, 0, 1, 1, 1, 1]), False, False
-        elif approach == "survive":
-            return random.choice([0, 0, 0, 0, 1]), False, False
-        return random.choice([0, 0, 0, 1, 1, 1]), False, False
+        return rng.choice(profile.defended_runs), False, False
 
     # beaten, edge, clean_beat handled elsewhere
     return 0, False, False
 
 
-def resolve_edge(pitch: PitchDNA, catch_modifier: float = 0.0) -> Tuple[bool, str, int]:
-    """Resolve edge: returns (is_wicket, dismissal_type, runs)."""
+EDGE_DISMISSALS = ["caught_behind", "caught"]
+EDGE_CUM_WEIGHTS = list(accumulate([0.55, 0.45]))
+EDGE_SURVIVAL_RUNS = (0, 0, 0, 1)
+
+
+def edge_catch_chance(pitch: PitchDNA, catch_modifier: float = 0.0) -> float:
     carry = pitch.carry / 100
     catch_chance = 0.25 * carry + catch_modifier
-    catch_chance = max(0.05, min(0.50, catch_chance))
+    return max(0.05, min(0.50, catch_chance))
 
-    if random.random() < catch_chance:
-        dismissal = random.choices(
-            ["caught_behind", "caught"],
-            weights=[0.55, 0.45]
-        )[0]
+
+def resolve_edge(catch_chance: float, rng=random) -> Tuple[bool, str, int]:
+    """Resolve edge: returns (is_wicket, dismissal_type, runs)."""
+    if rng.random() < catch_chance:
+        dismissal = rng.choices(EDGE_DISMISSALS, cum_weights=EDGE_CUM_WEIGHTS)[0]
         return True, dismissal, 0
     # Survived
-    return False, "", random.choice([0, 0, 0, 1])
+    return False, "", rng.choice(EDGE_SURVIVAL_RUNS)
+
+
+# Clean-beat wicket chance: CLEAN_BEAT_BASE at the edge/clean-beat boundary,
+# rising CLEAN_BEAT_SLOPE per point of margin beyond it, capped at CLEAN_BEAT_CAP
+CLEAN_BEAT_BASE = 0.55
+CLEAN_BEAT_SLOPE = 0.025
+CLEAN_BEAT_CAP = 0.95
 
 
-def resolve_clean_beat(margin: float, delivery: Delivery) -> Tuple[bool, str]:
-    """Resolve clean beat: returns (is_wicket, dismissal_type)."""
+def resolve_clean_beat(margin: float, types: List[str],
+                       cum_weights: List[float], rng=random) -> Tuple[bool, str]:
+    """Resolve clean beat: returns (is_wicket, dismissal_type).
+    types/cum_weights come from the delivery's dismissal_weights."""
     margin_abs = abs(margin)
-    wicket_chance = min(0.95, 0.55 + (margin_abs - 18) * 0.025)
+    wicket_chance = min(CLEAN_BEAT_CAP,
+                        CLEAN_BEAT_BASE + (margin_abs + CONTACT_FLOORS[0]) * CLEAN_BEAT_SLOPE)
 
-    if random.random() < wicket_chance:
-        types = list(delivery.dismissal_weights.keys())
-        weights = list(delivery.dismissal_weights.values())
-        dismissal = random.choices(types, weights=weights)[0]
+    if rng.random() < wicket_chance:
+        dismissal = rng.choices(types, cum_weights=cum_weights)[0]
         return True, dismissal
     return False, ""
 
@@ -773,88 +898,129 @@ def safety_net(innings: InningsState) -> float:
     return 0
 
 
-def simulate_ball(bowler: Player, batter: Player, delivery: Delivery,
-                  innings: InningsState, approach: str = "rotate",
-                  catch_mod: float = 0.0) -> BallResult:
-    """Full pipeline: execution → matchup → compression → Gaussian roll → outcome."""
+@dataclass
+class BallSetup:
+    """Everything simulate_ball derives before its first random draw.
+
+    It is fixed for a given (bowler, batter, delivery, innings state, approach),
+    so a run of balls can share one setup and only re-roll the dice. Outcome
+    chances are resolved here too, so rolling a ball is draws and comparisons."""
+    delivery: Delivery
+    runs: RunProfile
+    catch_chance: float
+    jaffa_rate: float
+    exec_control: float
+    exec_target: int
+    base_skill: float
+    tail_floor: bool
+    settled: float
+    safety: float
+    difficulty: float
+    mean_shift: float
+    sigma: float
+
+
+def prepare_ball(bowler: Player, batter: Player, delivery: Delivery,
+                 innings: InningsState, approach: str = "rotate",
+                 catch_mod: float = 0.0,
+                 over_ctx: OverContext = None,
+                 balls_faced: int = None) -> BallSetup:
+    """Matchup → compression: all the deterministic work of simulate_ball.
+    balls_faced defaults to the innings' balls_faced entry for the batter."""
     overs = innings.overs
-    fatigue = get_fatigue(innings.bowler_overs_count.get(bowler.name, 0))
-    sigma = get_sigma(overs)
+    if over_ctx is None:
+        over_ctx = make_over_context(innings, bowler)
+    fatigue = over_ctx.fatigue
+    bf = innings.balls_faced.get(batter.name, 0) if balls_faced is None else balls_faced
+
+    # Bowler attack (raw 0-100), compressed; tactical bonus stays on the
+    # compressed scale (max ±7.5)
+    attack = over_ctx.attack.get(delivery.name)
+    if attack is None:
+        attack = compress(bowler_attack_rating(bowler, delivery, innings.pitch, overs,
+                                               fatigue, innings.is_second_innings,
+                                               over_ctx.ball_age))
+        over_ctx.attack[delivery.name] = attack
+    sigma_mult, base_shift = APPROACH_MODS.get(approach, (0.90, +1))
+
+    return BallSetup(
+        delivery=delivery,
+        runs=run_profile(batter.batting_dna.power, approach),
+        catch_chance=edge_catch_chance(innings.pitch, catch_mod),
+        # Base 0.5%, rises after 20 balls faced — specifically limits long innings
+        jaffa_rate=0.005 + max(0, bf - 20) * 0.0028,
+        exec_control=bowler.bowler_dna.control * fatigue,
+        exec_target=execution_target(delivery, overs),
+        base_skill=batter_skill_rating(batter, delivery),
+        # Tail-ender floor: only for genuinely weak batters (avg DNA < 40)
+        # This protects tail-enders while allowing weakness exploitation for good batters
+        tail_floor=batter.batting_dna.avg() < 40,
+        settled=get_settled_modifier(bf),
+        safety=safety_net(innings),
+        difficulty=attack + tactical_bonus(batter, delivery),
+        mean_shift=base_shift,
+        sigma=over_ctx.sigma * sigma_mult,
+    )
+
+
+TAIL_FLOOR_SKILL = 63
+
+
+def skill_mean(setup: BallSetup, batter_bonus: float) -> float:
+    """Centre of the Gaussian roll before the bowler's difficulty is taken off:
+    batter skill (raw 0-100) plus any miss bonus, tail-ender floor, settled
+    modifier and safety net, compressed, plus the approach's mean shift."""
+    raw_skill = setup.base_skill + batter_bonus
+    if setup.tail_floor:
+        raw_skill = max(raw_skill, TAIL_FLOOR_SKILL)
+    raw_skill += setup.settled
+    raw_skill += setup.safety
+    return compress(raw_skill) + setup.mean_shift
 
-    result = BallResult(delivery_name=delivery.name)
+
+def roll_ball(setup: BallSetup, rng=random) -> BallResult:
+    """Roll one ball from a prepared setup: jaffa → execution → Gaussian roll → outcome."""
+    result = BallResult(delivery_name=setup.delivery.name)
 
     # Step 0: Unplayable delivery (jaffa) — increases with balls faced
     # Models: perfect yorkers, unreadable googlies, freak run-outs, etc.
-    # Base 0.5%, rises after 20 balls faced — specifically limits long innings
-    bf = innings.balls_faced.get(batter.name, 0)
-    jaffa_rate = 0.005 + max(0, bf - 20) * 0.0028
-    if random.random() < jaffa_rate:
+    if rng.random() < setup.jaffa_rate:
         result.is_wicket = True
         result.contact_quality = "clean_beat"
-        types = list(delivery.dismissal_weights.keys())
-        weights = list(delivery.dismissal_weights.values())
-        result.dismissal_type = random.choices(types, weights=weights)[0]
+        delivery = setup.delivery
+        result.dismissal_type = rng.choices(delivery.dismissal_types,
+                                               cum_weights=delivery.dismissal_cum_weights)[0]
         return result
 
     # Step 1: Execution check
-    exec_result = execution_check(bowler, delivery, innings.pitch, fatigue, overs)
+    exec_result = classify_execution(rng.gauss(setup.exec_control, EXEC_SIGMA), setup.exec_target)
     result.execution = exec_result
 
-    if exec_result == "bad_miss":
-        batter_bonus = random.uniform(12, 18)
-    elif exec_result == "slight_miss":
-        batter_bonus = random.uniform(4, 10)
-    else:
-        batter_bonus = 0
-
-    # Step 2: Bowler attack (raw 0-100)
-    raw_attack = bowler_attack_rating(bowler, delivery, innings.pitch, overs,
-                                      fatigue, innings.is_second_innings)
-
-    # Step 3: Batter skill (raw 0-100)
-    raw_skill = batter_skill_rating(batter, delivery) + batter_bonus
-
-    # Tail-ender floor: only for genuinely weak batters (avg DNA < 40)
-    # This protects tail-enders while allowing weakness exploitation for good batters
-    if batter.batting_dna.avg() < 40:
-        raw_skill = max(raw_skill, 63)
-
-    # Settled modifier (applied before compression)
-    bf = innings.balls_faced.get(batter.name, 0)
-    raw_skill += get_settled_modifier(bf)
-
-    # Safety net
-    raw_skill += safety_net(innings)
+    bonus_range = MISS_BONUS.get(exec_result)
+    batter_bonus = rng.uniform(*bonus_range) if bonus_range else 0
 
-    # Step 4: COMPRESS both ratings to narrow the effective range
-    compressed_skill = compress(raw_skill)
-    compressed_attack = compress(raw_attack)
+    # Steps 2-3: Gaussian margin around the batter's compressed skill
+    margin = rng.gauss(skill_mean(setup, batter_bonus), setup.sigma) - setup.difficulty
 
-    # Step 5: Tactical bonus (stays on compressed scale, max ±7.5)
-    tac = tactical_bonus(batter, delivery)
-
-    # Step 6: Gaussian margin
-    margin = calculate_margin(compressed_attack, compressed_skill, tac, approach, sigma)
-
-    # Step 7: Resolve
+    # Step 4: Resolve
     contact = resolve_contact(margin)
     result.contact_quality = contact
 
     if contact in ("perfect", "good", "decent", "defended"):
-        runs, is_boundary, is_six = resolve_runs(contact, batter.batting_dna.power,
-                                                  margin, innings.pitch, approach)
+        runs, is_boundary, is_six = resolve_runs(contact, setup.runs, rng)
         result.runs = runs
         result.is_boundary = is_boundary
         result.is_six = is_six
     elif contact == "beaten":
         result.runs = 0
     elif contact == "edge":
-        is_w, dism, runs = resolve_edge(innings.pitch, catch_mod)
+        is_w, dism, runs = resolve_edge(setup.catch_chance, rng)
         result.is_wicket = is_w
         result.dismissal_type = dism
         result.runs = runs
     elif contact == "clean_beat":
-        is_w, dism = resolve_clean_beat(margin, delivery)
+        is_w, dism = resolve_clean_beat(margin, setup.delivery.dismissal_types,
+                                        setup.delivery.dismissal_cum_weights, rng)
         result.is_wicket = is_w
         result.dismissal_type = dism
         result.runs = 0
@@ -862,11 +1028,176 @@ def simulate_ball(bowler: Player, batter: Player, delivery: Delivery,
     return result
 
 
+def simulate_ball(bowler: Player, batter: Player, delivery: Delivery,
+                  innings: InningsState, approach: str = "rotate",
+                  catch_mod: float = 0.0,
+                  over_ctx: OverContext = None, rng=random,
+                  balls_faced: int = None) -> BallResult:
+    """Full pipeline: execution → matchup → compression → Gaussian roll → outcome.
+    Pass over_ctx to reuse per-over constants instead of deriving them per ball,
+    and balls_faced to skip the innings' per-batter lookup.
+    rng is any random.Random-compatible source (defaults to the module RNG)."""
+    return roll_ball(prepare_ball(bowler, batter, delivery, innings,
+                                  approach, catch_mod, over_ctx, balls_faced), rng)
+
+
+def contact_distribution(mean: float, sigma: float) -> Tuple[Dict[str, float], float]:
+    """For margin ~ N(mean, sigma): probability of each contact band, and the
+    probability of a clean beat that resolve_clean_beat turns into a wicket."""
+    nd = NormalDist(mean, sigma)
+    probs = {name: nd.cdf(hi) - nd.cdf(lo) for name, lo, hi in CONTACT_BANDS}
+    # resolve_clean_beat's chance is linear in margin from the band's top
+    # down to where it reaches the cap, and flat beyond; integrate it against
+    # the normal density in closed form
+    top = CONTACT_FLOORS[0]
+    cap_at = top - (CLEAN_BEAT_CAP - CLEAN_BEAT_BASE) / CLEAN_BEAT_SLOPE
+    intercept = CLEAN_BEAT_BASE + top * CLEAN_BEAT_SLOPE  # chance = intercept - slope * margin
+    ramp_mass = nd.cdf(top) - nd.cdf(cap_at)
+    ramp_mean = mean * ramp_mass - sigma ** 2 * (nd.pdf(top) - nd.pdf(cap_at))
+    clean_wicket = (CLEAN_BEAT_CAP * nd.cdf(cap_at) + intercept * ramp_mass
+                    - CLEAN_BEAT_SLOPE * ramp_mean)
+    return probs, clean_wicket
+
+
+def outcome_table(setup: BallSetup, bonus_steps: int = 48) -> Tuple[List[tuple], List[float]]:
+    """Per-ball outcome distribution of roll_ball for a prepared setup.
+
+    Returns (outcomes, cum_weights) where each outcome is a
+    (runs, is_wicket, is_boundary, is_six, contact, dismissal) tuple, ready for
+    random.choices. Everything is closed-form except the uniform batter bonus
+    after a missed execution, which is integrated with a midpoint rule. The
+    bands, ramp and miss constants are the ones roll_ball uses, and category 12
+    checks the two against each other."""
+    delivery = setup.delivery
+    dismissal_total = sum(delivery.dismissal_weights.values())
+    dismissal_share = [(d, w / dismissal_total) for d, w in delivery.dismissal_weights.items()]
+
+    def mean_margin(batter_bonus):
+        return skill_mean(setup, batter_bonus) - setup.difficulty
+
+    # Execution branches (see classify_execution) as (weight, mean margin)
+    roll = NormalDist(setup.exec_control, EXEC_SIGMA)
+    p_executed = 1 - roll.cdf(setup.exec_target)
+    p_bad = roll.cdf(setup.exec_target - BAD_MISS_BY)
+    branches = [(p_executed, mean_margin(0))]
+    for p_branch, (lo, hi) in ((1 - p_executed - p_bad, MISS_BONUS["slight_miss"]),
+                               (p_bad, MISS_BONUS["bad_miss"])):
+        step = (hi - lo) / bonus_steps
+        branches += [(p_branch / bonus_steps, mean_margin(lo + (k + 0.5) * step))
+                     for k in range(bonus_steps)]
+
+    contact_p = dict.fromkeys(CONTACT_TYPES, 0.0)
+    clean_wicket = 0.0
+    for weight, mean in branches:
+        probs, wkt = contact_distribution(mean, setup.sigma)
+        for name, p in probs.items():
+            contact_p[name] += weight * p
+        clean_wicket += weight * wkt
+
+    table = Counter()
+    jaffa = setup.jaffa_rate
+    for d, share in dismissal_share:
+        table[(0, True, False, False, "clean_beat", d)] += jaffa * share
+    live = 1 - jaffa
+    prof = setup.runs
+
+    p = live * contact_p["perfect"]
+    table[(6, False, True, True, "perfect", "")] += p * prof.perfect_six
+    table[(4, False, True, False, "perfect", "")] += p * (1 - prof.perfect_six)
+    p = live * contact_p["good"]
+    table[(6, False, True, True, "good", "")] += p * prof.good_boundary * prof.good_six
+    table[(4, False, True, False, "good", "")] += p * prof.good_boundary * (1 - prof.good_six)
+    for r in prof.good_runs:
+        table[(r, False, False, False, "good", "")] += p * (1 - prof.good_boundary) / len(prof.good_runs)
+    p = live * contact_p["decent"]
+    table[(4, False, True, False, "decent", "")] += p * prof.decent_boundary
+    for r in prof.decent_runs:
+        table[(r, False, False, False, "decent", "")] += p * (1 - prof.decent_boundary) / len(prof.decent_runs)
+    p = live * contact_p["defended"]
+    for r in prof.defended_runs:
+        table[(r, False, False, False, "defended", "")] += p / len(prof.defended_runs)
+    table[(0, False, False, False, "beaten", "")] += live * contact_p["beaten"]
+    p = live * contact_p["edge"]
+    edge_total = EDGE_CUM_WEIGHTS[-1]
+    prev = 0.0
+    for d, cum in zip(EDGE_DISMISSALS, EDGE_CUM_WEIGHTS):
+        table[(0, True, False, False, "edge", d)] += p * setup.catch_chance * (cum - prev) / edge_total
+        prev = cum
+    for r in EDGE_SURVIVAL_RUNS:
+        table[(r, False, False, False, "edge", "")] += p * (1 - setup.catch_chance) / len(EDGE_SURVIVAL_RUNS)
+    for d, share in dismissal_share:
+        table[(0, True, False, False, "clean_beat", d)] += live * clean_wicket * share
+    table[(0, False, False, False, "clean_beat", "")] += live * (contact_p["clean_beat"] - clean_wicket)
+
+    # Wickets first, then by runs: inverse-CDF draws from two tables on the
+    # same uniforms are then monotonically coupled (common random numbers)
+    ordered = sorted(table.items(), key=lambda item: (not item[0][1], item[0][0]))
+    return [o for o, _ in ordered], list(accumulate(p for _, p in ordered))
+
+
+@dataclass
+class BallBatch:
+    """Per-ball outcomes of simulate_balls, one parallel list per field."""
+    runs: List[int] = field(default_factory=list)
+    is_wicket: List[bool] = field(default_factory=list)
+    is_boundary: List[bool] = field(default_factory=list)
+    is_six: List[bool] = field(default_factory=list)
+    contact: List[str] = field(default_factory=list)
+    dismissal: List[str] = field(default_factory=list)
+
+
+def draw_balls(setup: BallSetup, n: int, rng=random) -> BallBatch:
+    """Draw n balls for a prepared setup in one random.choices call over its
+    outcome_table, instead of rolling and branching per ball. simulate_balls and
+    MatchupBatch.run come through here and run_balls_extended samples the same
+    table, so category 12's table-vs-roll_ball check covers every batch path."""
+    outcomes, cum_weights = outcome_table(setup)
+    return BallBatch(*map(list, zip(*rng.choices(outcomes, cum_weights=cum_weights, k=n))))
+
+
+def simulate_balls(bowler: Player, batter: Player, delivery: Delivery,
+                   innings: InningsState, approach: str = "rotate",
+                   n: int = 1000, catch_mod: float = 0.0, rng=random,
+                   balls_faced: int = None) -> BallBatch:
+    """Simulate n balls of a fixed matchup against an unchanging innings state.
+    The setup is derived once and all n balls are drawn from its outcome table."""
+    setup = prepare_ball(bowler, batter, delivery, innings, approach, catch_mod,
+                         balls_faced=balls_faced)
+    return draw_balls(setup, n, rng)
+
+
+class MatchupBatch:
+    """Declarative batch of fixed-matchup ball runs.
+
+    add() queues a (batter, bowler, delivery, pitch, approach, n) spec against
+    a settled batter and returns its index; run() prepares every setup up
+    front, then rolls all specs in one pass and returns a BallBatch per spec,
+    in the order they were added. A spec added with its own rng rolls from it
+    instead of run()'s; give two specs equally seeded random.Random instances
+    to compare them on common random numbers."""
+
+    def __init__(self, settled_balls: int = 15):
+        self.settled_balls = settled_balls
+        self.specs = []
+
+    def add(self, batter: Player, bowler: Player, delivery: Delivery,
+            pitch: PitchDNA = None, approach: str = "rotate", n: int = 1000,
+            rng=None) -> int:
+        innings = InningsState(pitch=pitch or PITCHES["balanced"])
+        setup = prepare_ball(bowler, batter, delivery, innings, approach,
+                             balls_faced=self.settled_balls)
+        self.specs.append((setup, n, rng))
+        return len(self.specs) - 1
+
+    def run(self, rng=random) -> List[BallBatch]:
+        return [draw_balls(setup, n, spec_rng or rng) for setup, n, spec_rng in self.specs]
+
+
 # ================================================================
 # 8. MATCH SIMULATION
 # ================================================================
 
-def select_bowler(innings: InningsState) -> Player:
+def select_bowler(innings: InningsState, rng=random) -> Player:
     """Auto-select bowler (weighted by skill, respects limits)."""
     bowlers = [p for p in innings.bowling_team if p.bowler_dna is not None]
     available = []
@@ -884,7 +1215,7 @@ def select_bowler(innings: InningsState) -> Player:
         available = bowlers
 
     weights = [b.bowler_dna.avg() for b in available]
-    return random.choices(available, weights=weights)[0]
+    return rng.choices(available, weights=weights)[0]
 
 
 def get_approach_for_situation(innings: InningsState) -> str:
@@ -918,7 +1249,8 @@ def get_approach_for_situation(innings: InningsState) -> str:
 def simulate_innings(batting_team: List[Player], bowling_team: List[Player],
                      pitch: PitchDNA, target: int = None,
                      is_second: bool = False,
-                     delivery_strategy: str = "random") -> InningsState:
+                     delivery_strategy: str = "random",
+                     rng=random) -> InningsState:
     """Simulate a full T20 innings."""
     innings = InningsState(
         batting_team=batting_team,
@@ -932,59 +1264,63 @@ def simulate_innings(batting_team: List[Player], bowling_team: List[Player],
     for i in range(2):
         p = batting_team[i]
         innings.batter_records[p.name] = BatterInningsRecord(player_name=p.name)
-        innings.balls_faced[p.name] = 0
 
     while not innings.is_complete:
         # Select bowler for this over
-        bowler = select_bowler(innings)
+        bowler = select_bowler(innings, rng)
         innings.last_bowler_name = bowler.name
-        repertoire = get_repertoire(bowler)
+        repertoire = bowler.repertoire
 
         if bowler.name not in innings.bowler_records:
             innings.bowler_records[bowler.name] = BowlerSpellRecord(player_name=bowler.name)
 
         spell = innings.bowler_records[bowler.name]
+        innings.over_starts.append(len(innings.ball_log))
+        over_ctx = make_over_context(innings, bowler)
+        # Higher base wide rate: control 85 → ~2.5%, control 50 → ~4.5%
+        wide_chance = max(0.015, 0.06 - bowler.bowler_dna.control * over_ctx.fatigue * 0.0004)
         balls_this_over = 0
         wickets_this_over = 0
 
+        # Batter records are rebound only when the striker changes
+        # (rotation or wicket), not looked up by name every ball.
+        brec = innings.batter_records[batting_team[innings.striker_idx].name]
+        brec_non = innings.batter_records[batting_team[innings.non_striker_idx].name]
+
         while balls_this_over < 6 and not innings.is_complete:
             striker = batting_team[innings.striker_idx]
 
             # Check extras (wider range for realistic extras count)
-            extra_roll = random.random()
-            fatigue = get_fatigue(innings.bowler_overs_count.get(bowler.name, 0))
-            eff_ctrl = bowler.bowler_dna.control * fatigue
-            # Higher base wide rate: control 85 → ~2.5%, control 50 → ~4.5%
-            wide_chance = max(0.015, 0.06 - eff_ctrl * 0.0004)
+            extra_roll = rng.random()
 
             if extra_roll < wide_chance:
                 innings.total_runs += 1
                 innings.extras += 1
                 spell.runs += 1
-                innings.all_results.append(BallResult(runs=1, is_wide=True))
+                innings.ball_log.append(ball_code(1, is_extra=True))
                 continue
 
             if extra_roll < wide_chance + 0.008:  # 0.8% no-ball chance
-                nb_runs = random.choices([0, 1, 2, 4, 6], weights=[30, 30, 10, 20, 10])[0]
+                nb_runs = rng.choices([0, 1, 2, 4, 6], weights=[30, 30, 10, 20, 10])[0]
                 innings.total_runs += nb_runs + 1
                 innings.extras += 1
                 spell.runs += nb_runs + 1
-                innings.all_results.append(BallResult(runs=nb_runs + 1, is_no_ball=True,
-                                                      is_boundary=(nb_runs >= 4),
-                                                      is_six=(nb_runs == 6)))
+                innings.ball_log.append(ball_code(nb_runs + 1, is_boundary=(nb_runs >= 4),
+                                                  is_six=(nb_runs == 6), is_extra=True))
                 continue
 
             # Choose delivery
             if delivery_strategy == "optimal":
-                delivery = choose_optimal_delivery(repertoire, striker)
+                delivery = choose_optimal_delivery(repertoire, striker, rng)
             else:
-                delivery = choose_random_delivery(repertoire)
+                delivery = choose_random_delivery(repertoire, rng)
 
             # Determine batting approach
             approach = get_approach_for_situation(innings)
 
             # Simulate ball
-            result = simulate_ball(bowler, striker, delivery, innings, approach)
+            result = simulate_ball(bowler, striker, delivery, innings, approach,
+                                   over_ctx=over_ctx, rng=rng, balls_faced=brec.balls)
 
             # Cap: max 3 wickets per over
             if result.is_wicket and wickets_this_over >= 3:
@@ -997,7 +1333,6 @@ def simulate_innings(batting_team: List[Player], bowling_team: List[Player],
             innings.balls += 1
 
             # Update batter record
-            brec = innings.batter_records[striker.name]
             brec.balls += 1
             brec.runs += result.runs
             if result.is_boundary and not result.is_six:
@@ -1005,8 +1340,6 @@ def simulate_innings(batting_team: List[Player], bowling_team: List[Player],
             if result.is_six:
                 brec.sixes += 1
 
-            innings.balls_faced[striker.name] = innings.balls_faced.get(striker.name, 0) + 1
-
             # Update bowler record
             spell.runs += result.runs
             if result.runs == 0 and not result.is_wicket:
@@ -1015,12 +1348,15 @@ def simulate_innings(batting_team: List[Player], bowling_team: List[Player],
             # Update innings totals
             innings.total_runs += result.runs
             innings.partnership_runs += result.runs
-            innings.all_results.append(result)
+            innings.ball_log.append(ball_code(result.runs, result.is_wicket,
+                                              result.is_boundary, result.is_six))
+            innings.contact_counts[CONTACT_IDX[result.contact_quality]] += 1
 
             # Handle wicket
             if result.is_wicket:
                 wickets_this_over += 1
                 innings.wickets += 1
+                innings.dismissal_counts[DISMISSAL_IDX[result.dismissal_type]] += 1
                 brec.is_out = True
                 brec.dismissal = result.dismissal_type
                 spell.wickets += 1
@@ -1030,13 +1366,14 @@ def simulate_innings(batting_team: List[Player], bowling_team: List[Player],
                 if innings.next_batter_idx < len(batting_team):
                     innings.striker_idx = innings.next_batter_idx
                     next_p = batting_team[innings.striker_idx]
-                    innings.batter_records[next_p.name] = BatterInningsRecord(player_name=next_p.name)
-                    innings.balls_faced[next_p.name] = 0
+                    brec = BatterInningsRecord(player_name=next_p.name)
+                    innings.batter_records[next_p.name] = brec
                     innings.next_batter_idx += 1
 
             # Rotate strike on odd runs
             elif result.runs % 2 == 1:
                 innings.striker_idx, innings.non_striker_idx = innings.non_striker_idx, innings.striker_idx
+                brec, brec_non = brec_non, brec
 
             # End of over bookkeeping
             if innings.balls >= 6:
@@ -1055,17 +1392,18 @@ def simulate_innings(batting_team: List[Player], bowling_team: List[Player],
 def simulate_match(team1: List[Player], team2: List[Player],
                    pitch: PitchDNA = None,
                    delivery_strategy_1: str = "random",
-                   delivery_strategy_2: str = "random") -> dict:
+                   delivery_strategy_2: str = "random",
+                   rng=random) -> dict:
     """Simulate a full T20 match. Team1 bats first."""
     if pitch is None:
         pitch = PITCHES["balanced"]
 
     inn1 = simulate_innings(team1, team2, pitch,
-                            delivery_strategy=delivery_strategy_2)
+                            delivery_strategy=delivery_strategy_2, rng=rng)
     target = inn1.total_runs + 1
     inn2 = simulate_innings(team2, team1, pitch,
                             target=target, is_second=True,
-                            delivery_strategy=delivery_strategy_1)
+                            delivery_strategy=delivery_strategy_1, rng=rng)
 
     if inn2.total_runs >= target:
         winner = "team2"
@@ -1089,51 +1427,65 @@ def simulate_match(team1: List[Player], team2: List[Player],
 # 9. STATISTICS HELPERS
 # ================================================================
 
-def innings_stats(inn: InningsState) -> dict:
-    """Extract key stats from an innings."""
-    total_legal = sum(1 for r in inn.all_results if not r.is_wide and not r.is_no_ball)
-    dots = sum(1 for r in inn.all_results if r.runs == 0 and not r.is_wicket
-               and not r.is_wide and not r.is_no_ball)
-    boundaries = sum(1 for r in inn.all_results if r.is_boundary)
-    sixes = sum(1 for r in inn.all_results if r.is_six)
-    fours = boundaries - sixes
+def mean(xs) -> float:
+    """Float mean; statistics.mean is exact-rational and much slower."""
+    return sum(xs) / len(xs)
 
-    boundary_runs = sum(r.runs for r in inn.all_results if r.is_boundary)
-
-    dismissals = [r.dismissal_type for r in inn.all_results if r.is_wicket]
-
-    contacts = Counter(r.contact_quality for r in inn.all_results
-                       if not r.is_wide and not r.is_no_ball)
-
-    # Phase scoring
-    phase_runs = {"powerplay": 0, "middle": 0, "death": 0}
-    phase_balls = {"powerplay": 0, "middle": 0, "death": 0}
-    ball_idx = 0
-    over_count = 0
-    balls_in_over = 0
-    for r in inn.all_results:
-        if r.is_wide or r.is_no_ball:
-            if over_count < 6:
-                phase_runs["powerplay"] += r.runs
-            elif over_count < 16:
-                phase_runs["middle"] += r.runs
-            else:
-                phase_runs["death"] += r.runs
-            continue
 
-        if over_count < 6:
-            phase = "powerplay"
-        elif over_count < 16:
-            phase = "middle"
-        else:
-            phase = "death"
+def stdev(xs) -> float:
+    """Sample standard deviation (n - 1), float arithmetic like mean()."""
+    m = mean(xs)
+    return math.sqrt(sum((x - m) ** 2 for x in xs) / (len(xs) - 1))
 
-        phase_runs[phase] += r.runs
-        phase_balls[phase] += 1
-        balls_in_over += 1
-        if balls_in_over >= 6:
-            over_count += 1
-            balls_in_over = 0
+
+def sum_counts(vectors) -> List[int]:
+    """Element-wise sum of equal-length count vectors."""
+    return [sum(col) for col in zip(*vectors)]
+
+
+def named_counts(names, counts) -> Dict[str, int]:
+    """Count vector → {name: count} for the non-zero entries (for printing)."""
+    return {name: c for name, c in zip(names, counts) if c}
+
+
+def innings_stats(inn: InningsState) -> dict:
+    """Extract key stats from an innings by counting its packed ball log.
+    Each phase slice collapses to a Counter of a few dozen distinct codes,
+    so aggregation never touches individual balls in Python.
+    Dismissal and contact tallies are kept by simulate_innings as balls land."""
+    total_legal = 0
+    dots = 0
+    boundaries = 0
+    sixes = 0
+    boundary_runs = 0
+
+    # Phase scoring: phases start at overs 0, 6 and 16
+    log = inn.ball_log
+    starts = inn.over_starts + [len(log)] * (17 - len(inn.over_starts))
+    phase_bounds = {"powerplay": (0, starts[6]),
+                    "middle": (starts[6], starts[16]),
+                    "death": (starts[16], len(log))}
+    phase_runs = {}
+    phase_balls = {}
+    for phase, (lo, hi) in phase_bounds.items():
+        p_runs = p_balls = 0
+        for code, n in Counter(log[lo:hi]).items():
+            runs = code & BALL_RUNS
+            p_runs += runs * n
+            if code & BALL_BOUNDARY:
+                boundaries += n
+                boundary_runs += runs * n
+                if code & BALL_SIX:
+                    sixes += n
+            if code & BALL_EXTRA:
+                continue
+            p_balls += n
+            if runs == 0 and not code & BALL_WICKET:
+                dots += n
+        phase_runs[phase] = p_runs
+        phase_balls[phase] = p_balls
+        total_legal += p_balls
+    fours = boundaries - sixes
 
     # Individual scores
     individual_scores = [br.runs for br in inn.batter_records.values()]
@@ -1153,8 +1505,8 @@ def innings_stats(inn: InningsState) -> dict:
         "boundary_runs": boundary_runs,
         "boundary_run_pct": (boundary_runs / inn.total_runs * 100) if inn.total_runs > 0 else 0,
         "extras": inn.extras,
-        "dismissals": Counter(dismissals),
-        "contacts": contacts,
+        "dismissal_counts": list(inn.dismissal_counts),
+        "contact_counts": list(inn.contact_counts),
         "phase_runs": phase_runs,
         "phase_balls": phase_balls,
         "fifties": fifties,
@@ -1163,11 +1515,92 @@ def innings_stats(inn: InningsState) -> dict:
     }
 
 
+def simulate_match_with_stats(team1: List[Player], team2: List[Player],
+                              pitch: PitchDNA = None, **kwargs) -> dict:
+    """simulate_match plus result["stats"] = {"inn1": ..., "inn2": ...}, computed
+    once so every consumer reuses the same innings_stats instead of re-walking."""
+    result = simulate_match(team1, team2, pitch, **kwargs)
+    result["stats"] = {"inn1": innings_stats(result["inn1"]),
+                       "inn2": innings_stats(result["inn2"])}
+    return result
+
+
+def innings_row(s: dict) -> tuple:
+    """Flatten the per-innings values category 1 aggregates into a fixed-order row:
+    runs, wickets, dot_pct, boundary_run_pct, extras, boundaries, sixes, fours,
+    pp_runs, mid_runs, mid_balls, death_runs, death_balls, fifties, hundreds."""
+    pr, pb = s["phase_runs"], s["phase_balls"]
+    return (s["runs"], s["wickets"], s["dot_pct"], s["boundary_run_pct"], s["extras"],
+            s["boundaries"], s["sixes"], s["fours"], pr["powerplay"],
+            pr["middle"], pb["middle"], pr["death"], pb["death"],
+            s["fifties"], s["hundreds"])
+
+
+# ================================================================
+# 9b. PARALLEL MATCH RUNNER
+# ================================================================
+
+def _play_match(task: tuple) -> dict:
+    """Pool worker: simulate one match between two freshly generated 'good' teams.
+
+    task = (seed, prefix1, prefix2, pitch_name, strategy_1, strategy_2).
+    Each task owns a random.Random(seed), so a match replays identically
+    whichever worker runs it. Returns the simulate_match_with_stats result
+    minus the InningsState objects, so only small dicts travel back to the
+    parent process.
+    """
+    seed, prefix1, prefix2, pitch_name, strategy_1, strategy_2 = task
+    rng = random.Random(seed)
+    t1 = generate_team("good", prefix1, rng)
+    t2 = generate_team("good", prefix2, rng)
+    result = simulate_match_with_stats(t1, t2, PITCHES[pitch_name],
+                                       delivery_strategy_1=strategy_1,
+                                       delivery_strategy_2=strategy_2,
+                                       rng=rng)
+    del result["inn1"], result["inn2"]
+    return result
+
+
+def match_task(prefix1: str, prefix2: str, pitch_name: str = "balanced",
+               strategy_1: str = "random", strategy_2: str = "random") -> tuple:
+    """Build a _play_match task, seeding it from the parent's RNG for reproducibility."""
+    return (random.getrandbits(32), prefix1, prefix2, pitch_name, strategy_1, strategy_2)
+
+
+def run_matches(tasks: List[tuple], workers: int = None, pool=None) -> List[dict]:
+    """Simulate independent matches across a process pool (order preserved).
+    An existing pool is used as-is; otherwise one of `workers` processes is
+    opened for the call. workers=1 runs in-process, which is handy for
+    debugging and profiling."""
+    if pool is not None:
+        return pool.map(_play_match, tasks, chunksize=8)
+    if workers == 1:
+        return [_play_match(t) for t in tasks]
+    with multiprocessing.Pool(workers) as pool:
+        return pool.map(_play_match, tasks, chunksize=8)
+
+
+def captured(fn, *args, **kwargs) -> Tuple[str, dict]:
+    """Run a category with its printed report captured: (report, results)."""
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        results = fn(*args, **kwargs)
+    return buf.getvalue(), results
+
+
+def _run_category(task: tuple) -> Tuple[str, dict]:
+    """Pool worker: task = (seed, category_fn, args). The category draws from
+    its own random.Random(seed), so it is reproducible on its own and never
+    replays the stream the worker inherited from the parent."""
+    seed, fn, args = task
+    return captured(fn, *args, rng=random.Random(seed))
+
+
 # ================================================================
 # 10. TEST CATEGORIES
 # ================================================================
 
-def run_category_1(num_matches: int = 200) -> dict:
+def run_category_1(num_matches: int = 200, workers: int = None, pool=None) -> dict:
     """Category 1: Aggregate Realism."""
     print(f"\nCATEGORY 1: AGGREGATE REALISM ({num_matches} matches)")
     print("-" * 60)
@@ -1175,53 +1608,35 @@ def run_category_1(num_matches: int = 200) -> dict:
     all_innings_stats = []
     all_match_results = []
 
-    for i in range(num_matches):
-        t1 = generate_team("good", f"T1_{i}")
-        t2 = generate_team("good", f"T2_{i}")
-        pitch = random.choice(list(PITCHES.values()))
-        result = simulate_match(t1, t2, pitch)
+    pitch_names = list(PITCHES)
+    tasks = [match_task(f"T1_{i}", f"T2_{i}", random.choice(pitch_names))
+             for i in range(num_matches)]
+    for result in run_matches(tasks, workers, pool):
         all_match_results.append(result)
+        all_innings_stats.append(result["stats"]["inn1"])
+        all_innings_stats.append(result["stats"]["inn2"])
+
+    # Aggregate: one pass turns the per-innings dicts into columns
+    (scores, wickets, dot_pcts, boundary_run_pcts, extras_list,
+     boundaries_list, sixes_list, fours_list, pp_scores,
+     mid_runs, mid_balls, death_runs, death_balls,
+     fifties, hundreds) = zip(*map(innings_row, all_innings_stats))
 
-        for inn_key in ("inn1", "inn2"):
-            stats = innings_stats(result[inn_key])
-            all_innings_stats.append(stats)
-
-    # Aggregate
-    scores = [s["runs"] for s in all_innings_stats]
-    wickets = [s["wickets"] for s in all_innings_stats]
-    dot_pcts = [s["dot_pct"] for s in all_innings_stats]
-    boundary_run_pcts = [s["boundary_run_pct"] for s in all_innings_stats]
-    extras_list = [s["extras"] for s in all_innings_stats]
-    boundaries_list = [s["boundaries"] for s in all_innings_stats]
-    sixes_list = [s["sixes"] for s in all_innings_stats]
-    fours_list = [s["fours"] for s in all_innings_stats]
-
-    pp_scores = [s["phase_runs"]["powerplay"] for s in all_innings_stats]
-    mid_rr = []
-    death_rr = []
-    for s in all_innings_stats:
-        mb = s["phase_balls"]["middle"]
-        if mb > 0:
-            mid_rr.append(s["phase_runs"]["middle"] / mb * 6)
-        db = s["phase_balls"]["death"]
-        if db > 0:
-            death_rr.append(s["phase_runs"]["death"] / db * 6)
-
-    fifties_per_match = [(all_innings_stats[i * 2]["fifties"] + all_innings_stats[i * 2 + 1]["fifties"])
-                         for i in range(num_matches)]
-    hundreds_per_match = [(all_innings_stats[i * 2]["hundreds"] + all_innings_stats[i * 2 + 1]["hundreds"])
-                          for i in range(num_matches)]
+    mid_rr = [r / b * 6 for r, b in zip(mid_runs, mid_balls) if b > 0]
+    death_rr = [r / b * 6 for r, b in zip(death_runs, death_balls) if b > 0]
+
+    # Innings are stored in match order (inn1, inn2), so pair them up per match
+    fifties_per_match = [a + b for a, b in zip(fifties[0::2], fifties[1::2])]
+    hundreds_per_match = [a + b for a, b in zip(hundreds[0::2], hundreds[1::2])]
 
     # All dismissal types
-    all_dismissals = Counter()
-    for s in all_innings_stats:
-        all_dismissals.update(s["dismissals"])
+    all_dismissals = named_counts(
+        DISMISSAL_TYPES, sum_counts(s["dismissal_counts"] for s in all_innings_stats))
     total_dismissals = sum(all_dismissals.values())
 
     # Contact distribution
-    all_contacts = Counter()
-    for s in all_innings_stats:
-        all_contacts.update(s["contacts"])
+    all_contacts = named_counts(
+        CONTACT_TYPES, sum_counts(s["contact_counts"] for s in all_innings_stats))
     total_contacts = sum(all_contacts.values())
 
     results = {}
@@ -1261,7 +1676,7 @@ def run_category_1(num_matches: int = 200) -> dict:
 
     # Contact distribution
     print(f"\n  Contact quality distribution ({total_contacts} balls):")
-    for ctype in ["perfect", "good", "decent", "defended", "beaten", "edge", "clean_beat"]:
+    for ctype in CONTACT_TYPES:
         ct = all_contacts.get(ctype, 0)
         pct = ct / total_contacts * 100 if total_contacts > 0 else 0
         print(f"    {ctype:15s} {pct:5.1f}%")
@@ -1269,34 +1684,22 @@ def run_category_1(num_matches: int = 200) -> dict:
     return results
 
 
-def run_category_2(num_balls: int = 1000) -> dict:
+def run_category_2(num_balls: int = 1000, rng=random) -> dict:
     """Category 2: Matchup Validation — specific player pairings."""
     print(f"\nCATEGORY 2: MATCHUP VALIDATION ({num_balls} balls per test)")
     print("-" * 60)
 
     results = {}
-    pitch = PITCHES["balanced"]
-
-    def run_balls(batter, bowler, delivery, approach="rotate", n=None):
-        n = n or num_balls
-        runs_total = 0
-        wickets = 0
-        boundaries = 0
-        dummy_innings = InningsState(pitch=pitch)
-        dummy_innings.balls_faced[batter.name] = 15   # Assume settled
-
-        for _ in range(n):
-            r = simulate_ball(bowler, batter, delivery, dummy_innings, approach)
-            runs_total += r.runs
-            if r.is_wicket:
-                wickets += 1
-            if r.is_boundary:
-                boundaries += 1
-
-        sr = (runs_total / n) * 100
-        wkt_pct = (wickets / n) * 100
-        bnd_pct = (boundaries / n) * 100
-        return {"sr": sr, "wkt_pct": wkt_pct, "bnd_pct": bnd_pct,
+    dust_bowl, green_top = PITCHES["dust_bowl"], PITCHES["green_seamer"]
+    matchups = MatchupBatch()
+
+    def summarise(batch: BallBatch) -> dict:
+        n = len(batch.runs)
+        runs_total = sum(batch.runs)
+        wickets = sum(batch.is_wicket)
+        boundaries = sum(batch.is_boundary)
+        return {"sr": runs_total / n * 100, "wkt_pct": wickets / n * 100,
+                "bnd_pct": boundaries / n * 100,
                 "runs": runs_total, "wickets": wickets}
 
     # Test 2.1: Elite batter vs Average bowler
@@ -1305,55 +1708,28 @@ def run_category_2(num_balls: int = 1000) -> dict:
                          bowler_dna=PacerDNA(speed=135, swing=55, bounce=50, control=62),
                          bowling_type="pace")
     d21 = PACER_DELIVERIES["good_length"]
-    r21 = run_balls(elite_bat, avg_bowler, d21)
-
-    passed = r21["sr"] > 140 and r21["wkt_pct"] < 4
-    results["2.1 Elite bat vs Avg bowler"] = passed
-    status = "[OK]" if passed else "[FAIL]"
-    print(f"  {status} 2.1 Elite bat vs Avg bowler:   SR={r21['sr']:.1f}  Wkt%={r21['wkt_pct']:.1f}%  "
-          f"(want: SR>140, Wkt<4%)")
+    i21 = matchups.add(elite_bat, avg_bowler, d21, n=num_balls)
 
     # Test 2.2: Average batter vs Elite bowler
     avg_bat = Player("AvgBat", "batsman", BatterDNA(58, 55, 56, 52, 55, 57, 50))
     elite_bowler = Player("ElitePacer", "bowler",
                            bowler_dna=PacerDNA(speed=148, swing=82, bounce=78, control=88),
                            bowling_type="pace")
-    r22 = run_balls(avg_bat, elite_bowler, d21)
-
-    passed = r22["sr"] < 115 and r22["wkt_pct"] > 5
-    results["2.2 Avg bat vs Elite bowler"] = passed
-    status = "[OK]" if passed else "[FAIL]"
-    print(f"  {status} 2.2 Avg bat vs Elite bowler:   SR={r22['sr']:.1f}  Wkt%={r22['wkt_pct']:.1f}%  "
-          f"(want: SR<115, Wkt>5%)")
+    i22 = matchups.add(avg_bat, elite_bowler, d21, n=num_balls)
 
     # Test 2.3: Weakness exploitation — bouncer vs weak vs_bounce
     weak_bounce_bat = Player("WeakBounce", "batsman", BatterDNA(75, 30, 75, 70, 72, 74, 65))
     strong_pacer = Player("BounceKing", "bowler",
                           bowler_dna=PacerDNA(speed=142, swing=70, bounce=82, control=72),
                           bowling_type="pace")
-
     bouncer = PACER_DELIVERIES["bouncer"]
-    r23_exploit = run_balls(weak_bounce_bat, strong_pacer, bouncer)
-    r23_baseline = run_balls(weak_bounce_bat, strong_pacer, d21)
-
-    wkt_ratio = r23_exploit["wkt_pct"] / max(0.1, r23_baseline["wkt_pct"])
-    passed = wkt_ratio >= 1.3
-    results["2.3 Weakness exploitation"] = passed
-    status = "[OK]" if passed else "[FAIL]"
-    print(f"  {status} 2.3 Weakness exploit (bouncer vs low vs_bounce):  "
-          f"Exploit Wkt={r23_exploit['wkt_pct']:.1f}% vs Baseline={r23_baseline['wkt_pct']:.1f}%  "
-          f"Ratio={wkt_ratio:.2f}x (want: >=1.3x)")
+    i23_exploit = matchups.add(weak_bounce_bat, strong_pacer, bouncer, n=num_balls)
+    i23_baseline = matchups.add(weak_bounce_bat, strong_pacer, d21, n=num_balls)
 
     # Test 2.4: Strength attack — bouncer vs strong vs_bounce
     strong_bounce_bat = Player("StrongBounce", "batsman", BatterDNA(75, 90, 75, 70, 72, 74, 70))
     # Use the same strong_pacer from 2.3 (bounce=82, from generated bowler)
-    r24 = run_balls(strong_bounce_bat, strong_pacer, bouncer)
-
-    passed = r24["sr"] > 130
-    results["2.4 Strength attack"] = passed
-    status = "[OK]" if passed else "[FAIL]"
-    print(f"  {status} 2.4 Strength attack (bouncer vs high vs_bounce):  "
-          f"SR={r24['sr']:.1f}  Wkt%={r24['wkt_pct']:.1f}% (want: SR>130)")
+    i24 = matchups.add(strong_bounce_bat, strong_pacer, bouncer, n=num_balls)
 
     # Test 2.5: Tactical bonus measurable
     # Same batter with a clear weakness, test optimal vs random delivery
@@ -1361,20 +1737,10 @@ def run_category_2(num_balls: int = 1000) -> dict:
     test_spinner = Player("TrickSpin", "bowler",
                            bowler_dna=SpinnerDNA(turn=75, flight=65, variation=78, control=72),
                            bowling_type="leg_spin")
-
     arm_ball = SPINNER_DELIVERIES["arm_ball"]   # Tests vs_deception (weakness=30)
     stock = SPINNER_DELIVERIES["stock_ball"]     # Tests vs_spin (72, no weakness)
-
-    r25_exploit = run_balls(weakness_bat, test_spinner, arm_ball)
-    r25_neutral = run_balls(weakness_bat, test_spinner, stock)
-
-    wkt_diff = r25_exploit["wkt_pct"] - r25_neutral["wkt_pct"]
-    passed = wkt_diff > 1.5
-    results["2.5 Tactical bonus measurable"] = passed
-    status = "[OK]" if passed else "[FAIL]"
-    print(f"  {status} 2.5 Tactical bonus (exploit weakness vs neutral):  "
-          f"Exploit={r25_exploit['wkt_pct']:.1f}% vs Neutral={r25_neutral['wkt_pct']:.1f}%  "
-          f"Diff={wkt_diff:.1f}pp (want: >1.5pp)")
+    i25_exploit = matchups.add(weakness_bat, test_spinner, arm_ball, n=num_balls)
+    i25_neutral = matchups.add(weakness_bat, test_spinner, stock, n=num_balls)
 
     # Test 2.6: Spinner on dust bowl vs green top
     test_spin2 = Player("SpinTest", "bowler",
@@ -1382,25 +1748,76 @@ def run_category_2(num_balls: int = 1000) -> dict:
                          bowling_type="off_spin")
     test_bat2 = Player("AvgBat2", "batsman", BatterDNA(65, 60, 58, 55, 62, 63, 55))
     stock2 = SPINNER_DELIVERIES["stock_ball"]
+    # Pitch comparisons (2.6, 2.7) replay one seeded stream on both pitches
+    # (common random numbers), so the difference isn't swamped by noise
+    crn_seed = rng.getrandbits(32)
+    i26_dust = matchups.add(test_bat2, test_spin2, stock2, dust_bowl, n=num_balls,
+                            rng=random.Random(crn_seed))
+    i26_green = matchups.add(test_bat2, test_spin2, stock2, green_top, n=num_balls,
+                             rng=random.Random(crn_seed))
 
-    dummy_dust = InningsState(pitch=PITCHES["dust_bowl"])
-    dummy_dust.balls_faced[test_bat2.name] = 15
-    dummy_green = InningsState(pitch=PITCHES["green_seamer"])
-    dummy_green.balls_faced[test_bat2.name] = 15
+    # Test 2.7: Pacer on green top vs dust bowl
+    test_pacer = Player("PaceTest", "bowler",
+                         bowler_dna=PacerDNA(speed=140, swing=68, bounce=65, control=70),
+                         bowling_type="pace")
+    gl = PACER_DELIVERIES["good_length"]
+    crn_seed = rng.getrandbits(32)
+    i27_green = matchups.add(test_bat2, test_pacer, gl, green_top, n=num_balls,
+                             rng=random.Random(crn_seed))
+    i27_dust = matchups.add(test_bat2, test_pacer, gl, dust_bowl, n=num_balls,
+                            rng=random.Random(crn_seed))
 
-    dust_runs, dust_wkts = 0, 0
-    green_runs, green_wkts = 0, 0
-    for _ in range(num_balls):
-        r = simulate_ball(test_spin2, test_bat2, stock2, dummy_dust)
-        dust_runs += r.runs
-        dust_wkts += 1 if r.is_wicket else 0
-    for _ in range(num_balls):
-        r = simulate_ball(test_spin2, test_bat2, stock2, dummy_green)
-        green_runs += r.runs
-        green_wkts += 1 if r.is_wicket else 0
+    # Test 2.8: Tail-ender viability
+    tail = Player("Tailender", "bowler", BatterDNA(28, 25, 22, 20, 25, 28, 20))
+    avg_bowl2 = Player("AvgBowl2", "bowler",
+                        bowler_dna=PacerDNA(speed=137, swing=65, bounce=58, control=68),
+                        bowling_type="pace")
+    i28 = matchups.add(tail, avg_bowl2, d21, n=num_balls)
+
+    r = [summarise(batch) for batch in matchups.run(rng)]
+
+    r21 = r[i21]
+    passed = r21["sr"] > 140 and r21["wkt_pct"] < 4
+    results["2.1 Elite bat vs Avg bowler"] = passed
+    status = "[OK]" if passed else "[FAIL]"
+    print(f"  {status} 2.1 Elite bat vs Avg bowler:   SR={r21['sr']:.1f}  Wkt%={r21['wkt_pct']:.1f}%  "
+          f"(want: SR>140, Wkt<4%)")
 
-    dust_econ = dust_runs / num_balls * 6
-    green_econ = green_runs / num_balls * 6
+    r22 = r[i22]
+    passed = r22["sr"] < 115 and r22["wkt_pct"] > 5
+    results["2.2 Avg bat vs Elite bowler"] = passed
+    status = "[OK]" if passed else "[FAIL]"
+    print(f"  {status} 2.2 Avg bat vs Elite bowler:   SR={r22['sr']:.1f}  Wkt%={r22['wkt_pct']:.1f}%  "
+          f"(want: SR<115, Wkt>5%)")
+
+    r23_exploit, r23_baseline = r[i23_exploit], r[i23_baseline]
+    wkt_ratio = r23_exploit["wkt_pct"] / max(0.1, r23_baseline["wkt_pct"])
+    passed = wkt_ratio >= 1.3
+    results["2.3 Weakness exploitation"] = passed
+    status = "[OK]" if passed else "[FAIL]"
+    print(f"  {status} 2.3 Weakness exploit (bouncer vs low vs_bounce):  "
+          f"Exploit Wkt={r23_exploit['wkt_pct']:.1f}% vs Baseline={r23_baseline['wkt_pct']:.1f}%  "
+          f"Ratio={wkt_ratio:.2f}x (want: >=1.3x)")
+
+    r24 = r[i24]
+    passed = r24["sr"] > 130
+    results["2.4 Strength attack"] = passed
+    status = "[OK]" if passed else "[FAIL]"
+    print(f"  {status} 2.4 Strength attack (bouncer vs high vs_bounce):  "
+          f"SR={r24['sr']:.1f}  Wkt%={r24['wkt_pct']:.1f}% (want: SR>130)")
+
+    r25_exploit, r25_neutral = r[i25_exploit], r[i25_neutral]
+    wkt_diff = r25_exploit["wkt_pct"] - r25_neutral["wkt_pct"]
+    passed = wkt_diff > 1.5
+    results["2.5 Tactical bonus measurable"] = passed
+    status = "[OK]" if passed else "[FAIL]"
+    print(f"  {status} 2.5 Tactical bonus (exploit weakness vs neutral):  "
+          f"Exploit={r25_exploit['wkt_pct']:.1f}% vs Neutral={r25_neutral['wkt_pct']:.1f}%  "
+          f"Diff={wkt_diff:.1f}pp (want: >1.5pp)")
+
+    dust_wkts, green_wkts = r[i26_dust]["wickets"], r[i26_green]["wickets"]
+    dust_econ = r[i26_dust]["runs"] / num_balls * 6
+    green_econ = r[i26_green]["runs"] / num_balls * 6
 
     passed = dust_econ < green_econ and dust_wkts > green_wkts
     results["2.6 Spinner pitch impact"] = passed
@@ -1408,30 +1825,9 @@ def run_category_2(num_balls: int = 1000) -> dict:
     print(f"  {status} 2.6 Spinner pitch impact:  Dust Bowl econ={dust_econ:.1f} wkts={dust_wkts}  "
           f"vs Green Top econ={green_econ:.1f} wkts={green_wkts}")
 
-    # Test 2.7: Pacer on green top vs dust bowl
-    test_pacer = Player("PaceTest", "bowler",
-                         bowler_dna=PacerDNA(speed=140, swing=68, bounce=65, control=70),
-                         bowling_type="pace")
-    gl = PACER_DELIVERIES["good_length"]
-
-    dummy_green2 = InningsState(pitch=PITCHES["green_seamer"])
-    dummy_green2.balls_faced[test_bat2.name] = 15
-    dummy_dust2 = InningsState(pitch=PITCHES["dust_bowl"])
-    dummy_dust2.balls_faced[test_bat2.name] = 15
-
-    green_r, green_w = 0, 0
-    dust_r, dust_w = 0, 0
-    for _ in range(num_balls):
-        r = simulate_ball(test_pacer, test_bat2, gl, dummy_green2)
-        green_r += r.runs
-        green_w += 1 if r.is_wicket else 0
-    for _ in range(num_balls):
-        r = simulate_ball(test_pacer, test_bat2, gl, dummy_dust2)
-        dust_r += r.runs
-        dust_w += 1 if r.is_wicket else 0
-
-    g_econ = green_r / num_balls * 6
-    d_econ = dust_r / num_balls * 6
+    green_w, dust_w = r[i27_green]["wickets"], r[i27_dust]["wickets"]
+    g_econ = r[i27_green]["runs"] / num_balls * 6
+    d_econ = r[i27_dust]["runs"] / num_balls * 6
 
     passed = g_econ < d_econ
     results["2.7 Pacer pitch impact"] = passed
@@ -1439,13 +1835,7 @@ def run_category_2(num_balls: int = 1000) -> dict:
     print(f"  {status} 2.7 Pacer pitch impact:  Green Top econ={g_econ:.1f} wkts={green_w}  "
           f"vs Dust Bowl econ={d_econ:.1f} wkts={dust_w}")
 
-    # Test 2.8: Tail-ender viability
-    tail = Player("Tailender", "bowler", BatterDNA(28, 25, 22, 20, 25, 28, 20))
-    avg_bowl2 = Player("AvgBowl2", "bowler",
-                        bowler_dna=PacerDNA(speed=137, swing=65, bounce=58, control=68),
-                        bowling_type="pace")
-    r28 = run_balls(tail, avg_bowl2, d21)
-
+    r28 = r[i28]
     passed = 50 < r28["sr"] < 100 and r28["wkt_pct"] > 5
     results["2.8 Tail-ender viability"] = passed
     status = "[OK]" if passed else "[FAIL]"
@@ -1455,7 +1845,7 @@ def run_category_2(num_balls: int = 1000) -> dict:
     return results
 
 
-def run_category_3(num_balls: int = 800) -> dict:
+def run_category_3(num_balls: int = 800, rng=random) -> dict:
     """Category 3: Tactical System Validation."""
     print(f"\nCATEGORY 3: TACTICAL SYSTEM VALIDATION ({num_balls} balls per test)")
     print("-" * 60)
@@ -1471,18 +1861,11 @@ def run_category_3(num_balls: int = 800) -> dict:
                      bowler_dna=PacerDNA(speed=140, swing=65, bounce=60, control=50),
                      bowling_type="pace")
 
+    # Control, fatigue and phase are fixed here, so use the exact rate
+    # instead of sampling execution_check num_balls times
     yorker = PACER_DELIVERIES["yorker"]
-    hi_exec, lo_exec = 0, 0
-    for _ in range(num_balls):
-        r = execution_check(hi_ctrl, yorker, pitch, 1.0, 10)
-        if r == "executed":
-            hi_exec += 1
-        r = execution_check(lo_ctrl, yorker, pitch, 1.0, 10)
-        if r == "executed":
-            lo_exec += 1
-
-    hi_pct = hi_exec / num_balls * 100
-    lo_pct = lo_exec / num_balls * 100
+    hi_pct = execution_probability(hi_ctrl, yorker, 1.0, 10) * 100
+    lo_pct = execution_probability(lo_ctrl, yorker, 1.0, 10) * 100
 
     passed = hi_pct > lo_pct + 15
     results["3.1 Execution check"] = passed
@@ -1497,19 +1880,17 @@ def run_category_3(num_balls: int = 800) -> dict:
     test_batter = Player("FatBat", "batsman", BatterDNA(65, 62, 63, 60, 64, 63, 58))
     gl = PACER_DELIVERIES["good_length"]
 
+    # simulate_ball only reads the innings, so one state object serves every ball
     fresh_runs, tired_runs = 0, 0
+    dummy = InningsState(pitch=pitch)
+    dummy.bowler_overs_count[test_bowler.name] = 0   # Fresh
     for _ in range(num_balls):
-        dummy = InningsState(pitch=pitch)
-        dummy.balls_faced[test_batter.name] = 15
-        dummy.bowler_overs_count[test_bowler.name] = 0   # Fresh
-        r = simulate_ball(test_bowler, test_batter, gl, dummy)
+        r = simulate_ball(test_bowler, test_batter, gl, dummy, balls_faced=15, rng=rng)
         fresh_runs += r.runs
 
+    dummy.bowler_overs_count[test_bowler.name] = 4   # Tired
     for _ in range(num_balls):
-        dummy = InningsState(pitch=pitch)
-        dummy.balls_faced[test_batter.name] = 15
-        dummy.bowler_overs_count[test_bowler.name] = 4   # Tired
-        r = simulate_ball(test_bowler, test_batter, gl, dummy)
+        r = simulate_ball(test_bowler, test_batter, gl, dummy, balls_faced=15, rng=rng)
         tired_runs += r.runs
 
     fresh_econ = fresh_runs / num_balls * 6
@@ -1529,18 +1910,15 @@ def run_category_3(num_balls: int = 800) -> dict:
     test_bat3 = Player("SwingBat", "batsman", BatterDNA(65, 62, 63, 60, 64, 63, 58))
 
     early_wkts, late_wkts = 0, 0
+    dummy = InningsState(pitch=pitch)
+    dummy.overs = 2   # Early (new ball)
     for _ in range(num_balls):
-        dummy = InningsState(pitch=pitch)
-        dummy.overs = 2   # Early (new ball)
-        dummy.balls_faced[test_bat3.name] = 15
-        r = simulate_ball(swing_bowler, test_bat3, outsw, dummy)
+        r = simulate_ball(swing_bowler, test_bat3, outsw, dummy, balls_faced=15, rng=rng)
         early_wkts += 1 if r.is_wicket else 0
 
+    dummy.overs = 17   # Late (old ball)
     for _ in range(num_balls):
-        dummy = InningsState(pitch=pitch)
-        dummy.overs = 17   # Late (old ball)
-        dummy.balls_faced[test_bat3.name] = 15
-        r = simulate_ball(swing_bowler, test_bat3, outsw, dummy)
+        r = simulate_ball(swing_bowler, test_bat3, outsw, dummy, balls_faced=15, rng=rng)
         late_wkts += 1 if r.is_wicket else 0
 
     passed = early_wkts > late_wkts
@@ -1558,16 +1936,14 @@ def run_category_3(num_balls: int = 800) -> dict:
     dust = PITCHES["dust_bowl"]
 
     first_wkts, second_wkts = 0, 0
+    dummy = InningsState(pitch=dust, is_second_innings=False)
     for _ in range(num_balls):
-        dummy = InningsState(pitch=dust, is_second_innings=False)
-        dummy.balls_faced[det_bat.name] = 15
-        r = simulate_ball(spin_bowler, det_bat, stock, dummy)
+        r = simulate_ball(spin_bowler, det_bat, stock, dummy, balls_faced=15, rng=rng)
         first_wkts += 1 if r.is_wicket else 0
 
+    dummy.is_second_innings = True
     for _ in range(num_balls):
-        dummy = InningsState(pitch=dust, is_second_innings=True)
-        dummy.balls_faced[det_bat.name] = 15
-        r = simulate_ball(spin_bowler, det_bat, stock, dummy)
+        r = simulate_ball(spin_bowler, det_bat, stock, dummy, balls_faced=15, rng=rng)
         second_wkts += 1 if r.is_wicket else 0
 
     passed = second_wkts > first_wkts
@@ -1586,15 +1962,15 @@ def run_category_3(num_balls: int = 800) -> dict:
     approaches = ["survive", "rotate", "push", "all_out"]
     app_results = {}
 
+    dummy = InningsState(pitch=pitch)
+    # Common random numbers: every approach replays the same seeded stream,
+    # so approaches are compared on paired draws rather than independent ones
+    crn_seed = rng.getrandbits(32)
     for app in approaches:
-        app_runs, app_wkts = 0, 0
-        for _ in range(num_balls):
-            dummy = InningsState(pitch=pitch)
-            dummy.balls_faced[app_bat.name] = 15
-            r = simulate_ball(app_bowl, app_bat, app_d, dummy, approach=app)
-            app_runs += r.runs
-            app_wkts += 1 if r.is_wicket else 0
-        app_results[app] = {"sr": app_runs / num_balls * 100, "wkt_pct": app_wkts / num_balls * 100}
+        batch = simulate_balls(app_bowl, app_bat, app_d, dummy, app, num_balls,
+                               rng=random.Random(crn_seed), balls_faced=15)
+        app_results[app] = {"sr": sum(batch.runs) / num_balls * 100,
+                            "wkt_pct": sum(batch.is_wicket) / num_balls * 100}
 
     sr_monotonic = (app_results["survive"]["sr"] <= app_results["rotate"]["sr"]
                     <= app_results["push"]["sr"] <= app_results["all_out"]["sr"])
@@ -1620,7 +1996,7 @@ def run_category_3(num_balls: int = 800) -> dict:
     return results
 
 
-def run_category_4(num_matches: int = 100) -> dict:
+def run_category_4(num_matches: int = 100, workers: int = None, pool=None) -> dict:
     """Category 4: Edge Cases & Sanity Checks."""
     print(f"\nCATEGORY 4: EDGE CASES & SANITY ({num_matches} matches)")
     print("-" * 60)
@@ -1628,25 +2004,18 @@ def run_category_4(num_matches: int = 100) -> dict:
     results = {}
 
     # Test 4.1: No all-out-in-5-overs epidemic
-    early_allouts = 0
-    total_innings = 0
-    all_scores = []
-    t1_wins = 0
-
-    for i in range(num_matches):
-        t1 = generate_team("good", f"E1_{i}")
-        t2 = generate_team("good", f"E2_{i}")
-        pitch = PITCHES["balanced"]
-        result = simulate_match(t1, t2, pitch)
-
-        for inn in (result["inn1"], result["inn2"]):
-            total_innings += 1
-            all_scores.append(inn.total_runs)
-            if inn.wickets >= 10 and inn.overs <= 10:
-                early_allouts += 1
-
-        if result["winner"] == "team1":
-            t1_wins += 1
+    # 4.1-4.3 and 4.6 all want equal 'good' teams on a balanced pitch, so
+    # they share one batch of matches instead of simulating it twice
+    tasks = [match_task(f"E1_{i}", f"E2_{i}") for i in range(num_matches)]
+    equal_matches = run_matches(tasks, workers, pool)
+
+    # Column views over every innings, reduced with builtins
+    all_scores, all_wickets, all_overs = zip(*(
+        (s["runs"], s["wickets"], int(s["overs"]))
+        for result in equal_matches for s in result["stats"].values()))
+    total_innings = len(all_scores)
+    early_allouts = sum(w >= 10 and o <= 10 for w, o in zip(all_wickets, all_overs))
+    t1_wins = sum(result["winner"] == "team1" for result in equal_matches)
 
     early_pct = early_allouts / total_innings * 100
     passed = early_pct < 5
@@ -1670,10 +2039,8 @@ def run_category_4(num_matches: int = 100) -> dict:
 
     # Test 4.4: Deteriorating pitch favors batting first
     dust_t1_wins = 0
-    for i in range(num_matches):
-        t1 = generate_team("good", f"D1_{i}")
-        t2 = generate_team("good", f"D2_{i}")
-        result = simulate_match(t1, t2, PITCHES["dust_bowl"])
+    tasks = [match_task(f"D1_{i}", f"D2_{i}", "dust_bowl") for i in range(num_matches)]
+    for result in run_matches(tasks, workers, pool):
         if result["winner"] == "team1":
             dust_t1_wins += 1
 
@@ -1685,14 +2052,10 @@ def run_category_4(num_matches: int = 100) -> dict:
 
     # Test 4.5: Captain advantage — optimal vs random delivery
     opt_wins = 0
-    for i in range(num_matches):
-        t1 = generate_team("good", f"O1_{i}")
-        t2 = generate_team("good", f"O2_{i}")
-        pitch = PITCHES["balanced"]
-        # t1 bowls with optimal strategy, t2 bowls random
-        result = simulate_match(t1, t2, pitch,
-                                delivery_strategy_1="optimal",
-                                delivery_strategy_2="random")
+    # t1 bowls with optimal strategy, t2 bowls random
+    tasks = [match_task(f"O1_{i}", f"O2_{i}", "balanced", "optimal", "random")
+             for i in range(num_matches)]
+    for result in run_matches(tasks, workers, pool):
         # t1 bats first. When bowling (2nd innings), t1 uses optimal.
         # When t2 bowls (1st innings), t2 uses random.
         # So t1 has optimal bowling in 2nd innings, t2 has random bowling in 1st innings.
@@ -1707,15 +2070,10 @@ def run_category_4(num_matches: int = 100) -> dict:
     print(f"  {status} 4.5 Captain advantage (optimal bowling):  Wins={opt_pct:.1f}%  (want: 55-80%)")
 
     # Test 4.6: Variety of dismissal types
-    all_dismissals = Counter()
-    for i in range(num_matches):
-        t1 = generate_team("good", f"V1_{i}")
-        t2 = generate_team("good", f"V2_{i}")
-        result = simulate_match(t1, t2, PITCHES["balanced"])
-        for inn in (result["inn1"], result["inn2"]):
-            for r in inn.all_results:
-                if r.is_wicket and r.dismissal_type:
-                    all_dismissals[r.dismissal_type] += 1
+    all_dismissals = named_counts(DISMISSAL_TYPES, sum_counts(
+        s["dismissal_counts"]
+        for result in equal_matches
+        for s in result["stats"].values()))
 
     total_d = sum(all_dismissals.values())
     caught_pct = (all_dismissals.get("caught", 0) + all_dismissals.get("caught_behind", 0) + all_dismissals.get("top_edge", 0)) / total_d * 100 if total_d > 0 else 0
@@ -1727,7 +2085,7 @@ def run_category_4(num_matches: int = 100) -> dict:
     status = "[OK]" if has_variety else "[FAIL]"
     print(f"  {status} 4.6 Dismissal variety:  Types={len(all_dismissals)}  "
           f"Caught(all)={caught_pct:.1f}%  Bowled={bowled_pct:.1f}%  LBW={lbw_pct:.1f}%")
-    print(f"       Full breakdown: {dict(all_dismissals)}")
+    print(f"       Full breakdown: {all_dismissals}")
 
     return results
 
@@ -1737,37 +2095,35 @@ def run_category_4(num_matches: int = 100) -> dict:
 # ================================================================
 
 def run_balls_extended(batter, bowler, delivery, pitch=None, approach="rotate",
-                       n=3000, overs=10, settled_balls=15):
-    """Run n balls and track extended stats: sixes, dismissal types, contacts."""
+                       n=3000, overs=10, settled_balls=15, rng=random):
+    """Run n balls and track extended stats: sixes, dismissal types, contacts.
+    Balls are drawn in one random.choices call from the setup's outcome_table,
+    then aggregated over the few dozen distinct outcomes. Dismissal and
+    contact tallies are count vectors indexed like DISMISSAL_TYPES and
+    CONTACT_TYPES, as in innings stats."""
     if pitch is None:
         pitch = PITCHES["balanced"]
-    runs_total = 0
-    wickets = 0
-    boundaries = 0
-    sixes = 0
-    fours = 0
-    dismissal_types = Counter()
-    contacts = Counter()
 
     dummy_innings = InningsState(pitch=pitch)
     dummy_innings.overs = overs
-    dummy_innings.balls_faced[batter.name] = settled_balls
 
-    for _ in range(n):
-        r = simulate_ball(bowler, batter, delivery, dummy_innings, approach)
-        runs_total += r.runs
-        if r.is_wicket:
-            wickets += 1
-            if r.dismissal_type:
-                dismissal_types[r.dismissal_type] += 1
-        if r.is_boundary:
-            boundaries += 1
-        if r.is_six:
-            sixes += 1
-        if r.is_boundary and not r.is_six:
-            fours += 1
-        if r.contact_quality:
-            contacts[r.contact_quality] += 1
+    setup = prepare_ball(bowler, batter, delivery, dummy_innings, approach,
+                         balls_faced=settled_balls)
+    outcomes, cum_weights = outcome_table(setup)
+    counts = Counter(rng.choices(outcomes, cum_weights=cum_weights, k=n))
+
+    runs_total = wickets = boundaries = sixes = 0
+    dismissal_counts = [0] * len(DISMISSAL_TYPES)
+    contact_counts = [0] * len(CONTACT_TYPES)
+    for (runs, is_wicket, is_boundary, is_six, contact, dismissal), c in counts.items():
+        runs_total += runs * c
+        boundaries += is_boundary * c
+        sixes += is_six * c
+        contact_counts[CONTACT_IDX[contact]] += c
+        if is_wicket:
+            wickets += c
+            dismissal_counts[DISMISSAL_IDX[dismissal]] += c
+    fours = boundaries - sixes
 
     sr = (runs_total / n) * 100
     wkt_pct = (wickets / n) * 100
@@ -1776,7 +2132,7 @@ def run_balls_extended(batter, bowler, delivery, pitch=None, approach="rotate",
         "sr": sr, "wkt_pct": wkt_pct, "bnd_pct": bnd_pct,
         "runs": runs_total, "wickets": wickets,
         "boundaries": boundaries, "sixes": sixes, "fours": fours,
-        "dismissal_types": dismissal_types, "contacts": contacts,
+        "dismissal_counts": dismissal_counts, "contact_counts": contact_counts,
     }
 
 
@@ -1784,7 +2140,46 @@ def run_balls_extended(batter, bowler, delivery, pitch=None, approach="rotate",
 # 10c. CATEGORIES 5-11: GRANULAR MATCHUP VALIDATION
 # ================================================================
 
-def run_category_5(num_balls: int = 3000) -> dict:
+def wicket_diff_sequential(batter, bowler, exploit, baseline, min_diff, max_balls=3000,
+                           block=500, z=2.58, pitch=None, rng=random):
+    """Sample exploit vs baseline deliveries in blocks of balls until the
+    wicket-% difference is decided against min_diff (pp), or max_balls is hit.
+
+    Both deliveries draw from equally seeded streams (common random numbers),
+    so ball i of each is paired. After each block a z-level paired Wald
+    interval on the difference, built from the discordant pairs (a wicket for
+    one delivery only, +1/+2 adjusted so an early block with none can't
+    collapse it), must clear min_diff on one side to stop early. Returns
+    (exploit_wkt_pct, baseline_wkt_pct, balls) with balls being the
+    per-delivery count actually simulated."""
+    innings = InningsState(pitch=pitch or PITCHES["balanced"])
+    innings.overs = 10
+    (exploit_outcomes, exploit_cum), (baseline_outcomes, baseline_cum) = (
+        outcome_table(prepare_ball(bowler, batter, d, innings, balls_faced=15))
+        for d in (exploit, baseline))
+    seed = rng.getrandbits(32)
+    exploit_rng, baseline_rng = random.Random(seed), random.Random(seed)
+
+    n = both = 0
+    exploit_only = baseline_only = 0
+    while n < max_balls:
+        k = min(block, max_balls - n)
+        pairs = Counter((a[1], b[1]) for a, b in zip(
+            exploit_rng.choices(exploit_outcomes, cum_weights=exploit_cum, k=k),
+            baseline_rng.choices(baseline_outcomes, cum_weights=baseline_cum, k=k)))
+        both += pairs[True, True]
+        exploit_only += pairs[True, False]
+        baseline_only += pairs[False, True]
+        n += k
+        diff = (exploit_only - baseline_only) / n
+        discordant = (exploit_only + baseline_only + 1) / (n + 2)
+        se = 100 * math.sqrt(max(discordant - diff * diff, 0.0) / n)
+        if diff * 100 - z * se > min_diff or diff * 100 + z * se < min_diff:
+            break
+    return (both + exploit_only) / n * 100, (both + baseline_only) / n * 100, n
+
+
+def run_category_5(num_balls: int = 3000, rng=random) -> dict:
     """Category 5: Weakness Exploitation Matrix — each batter weakness tested."""
     print(f"\nCATEGORY 5: WEAKNESS EXPLOITATION MATRIX ({num_balls} balls per test)")
     print("-" * 60)
@@ -1814,37 +2209,36 @@ def run_category_5(num_balls: int = 3000) -> dict:
         ("5.6", "leg_side", 25, "inswinger", "outswinger", pace_bowler, 0.5),
     ]
 
+    # Build each batter (one weakness) and resolve deliveries up front, so
+    # the test loop below only simulates and reports
+    cases = []
     for test_id, weak_stat, weak_val, exploit_name, baseline_name, bowler, min_diff in tests:
-        # Create batter with one weakness
-        stats = dict(base_stats)
-        stats[weak_stat] = weak_val
         batter = Player(f"Weak{weak_stat}", "batsman",
-                        BatterDNA(**stats))
-
-        # Get deliveries
-        if isinstance(bowler.bowler_dna, PacerDNA):
-            exploit_d = PACER_DELIVERIES[exploit_name]
-            baseline_d = PACER_DELIVERIES[baseline_name]
-        else:
-            exploit_d = SPINNER_DELIVERIES[exploit_name]
-            baseline_d = SPINNER_DELIVERIES[baseline_name]
-
-        r_exploit = run_balls_extended(batter, bowler, exploit_d, n=num_balls)
-        r_baseline = run_balls_extended(batter, bowler, baseline_d, n=num_balls)
-
-        diff = r_exploit["wkt_pct"] - r_baseline["wkt_pct"]
+                        BatterDNA(**{**base_stats, weak_stat: weak_val}))
+        deliveries = PACER_DELIVERIES if bowler.is_pacer else SPINNER_DELIVERIES
+        cases.append((test_id, weak_stat, weak_val, batter, bowler,
+                      exploit_name, deliveries[exploit_name],
+                      baseline_name, deliveries[baseline_name], min_diff))
+
+    for (test_id, weak_stat, weak_val, batter, bowler,
+         exploit_name, exploit_d, baseline_name, baseline_d, min_diff) in cases:
+        # num_balls is the budget; clear-cut cases stop after a block or two
+        exploit_wkt, baseline_wkt, balls = wicket_diff_sequential(
+            batter, bowler, exploit_d, baseline_d, min_diff, max_balls=num_balls, rng=rng)
+
+        diff = exploit_wkt - baseline_wkt
         passed = diff >= min_diff
         results[f"{test_id} Weakness {weak_stat}"] = passed
         status = "[OK]" if passed else "[FAIL]"
         print(f"  {status} {test_id} Low {weak_stat} ({weak_val}):  "
-              f"Exploit({exploit_name}) Wkt%={r_exploit['wkt_pct']:.1f}%  "
-              f"Baseline({baseline_name}) Wkt%={r_baseline['wkt_pct']:.1f}%  "
-              f"Diff={diff:.1f}pp (want: ≥{min_diff}pp)")
+              f"Exploit({exploit_name}) Wkt%={exploit_wkt:.1f}%  "
+              f"Baseline({baseline_name}) Wkt%={baseline_wkt:.1f}%  "
+              f"Diff={diff:.1f}pp (want: ≥{min_diff}pp, {balls} balls)")
 
     return results
 
 
-def run_category_6(num_balls: int = 3000) -> dict:
+def run_category_6(num_balls: int = 3000, rng=random) -> dict:
     """Category 6: Batter Strength Domination — high vs moderate stats."""
     print(f"\nCATEGORY 6: BATTER STRENGTH DOMINATION ({num_balls} balls per test)")
     print("-" * 60)
@@ -1869,19 +2263,23 @@ def run_category_6(num_balls: int = 3000) -> dict:
         ("6.4", "vs_deception", 90, 50, "arm_ball", spin_bowler, 15, "spin"),
     ]
 
-    for test_id, stat, high_val, mod_val, del_name, bowler, min_sr_delta, del_set in skill_tests:
-        high_stats = dict(base)
-        high_stats[stat] = high_val
-        mod_stats = dict(base)
-        mod_stats[stat] = mod_val
-
-        high_bat = Player(f"High{stat}", "batsman", BatterDNA(**high_stats))
-        mod_bat = Player(f"Mod{stat}", "batsman", BatterDNA(**mod_stats))
-
-        delivery = PACER_DELIVERIES[del_name] if del_set == "pace" else SPINNER_DELIVERIES[del_name]
+    # Build the high/moderate batter pair and resolve the delivery up front
+    cases = [
+        (test_id, stat, high_val, mod_val, bowler, min_sr_delta,
+         Player(f"High{stat}", "batsman", BatterDNA(**{**base, stat: high_val})),
+         Player(f"Mod{stat}", "batsman", BatterDNA(**{**base, stat: mod_val})),
+         PACER_DELIVERIES[del_name] if del_set == "pace" else SPINNER_DELIVERIES[del_name])
+        for test_id, stat, high_val, mod_val, del_name, bowler, min_sr_delta, del_set in skill_tests
+    ]
 
-        r_high = run_balls_extended(high_bat, bowler, delivery, n=num_balls)
-        r_mod = run_balls_extended(mod_bat, bowler, delivery, n=num_balls)
+    # Each high/moderate pair replays one seed (common random numbers), so the
+    # SR and Wkt% comparisons are paired rather than independent
+    for test_id, stat, high_val, mod_val, bowler, min_sr_delta, high_bat, mod_bat, delivery in cases:
+        crn_seed = rng.getrandbits(32)
+        r_high = run_balls_extended(high_bat, bowler, delivery, n=num_balls,
+                                    rng=random.Random(crn_seed))
+        r_mod = run_balls_extended(mod_bat, bowler, delivery, n=num_balls,
+                                   rng=random.Random(crn_seed))
 
         sr_delta = r_high["sr"] - r_mod["sr"]
         wkt_lower = r_high["wkt_pct"] < r_mod["wkt_pct"]
@@ -1900,8 +2298,11 @@ def run_category_6(num_balls: int = 3000) -> dict:
                          BatterDNA(70, 70, 70, 70, 70, 70, 30))
 
     delivery = PACER_DELIVERIES["good_length"]
-    r_hipow = run_balls_extended(high_pow_bat, pace_bowler, delivery, n=num_balls)
-    r_lopow = run_balls_extended(low_pow_bat, pace_bowler, delivery, n=num_balls)
+    crn_seed = rng.getrandbits(32)
+    r_hipow = run_balls_extended(high_pow_bat, pace_bowler, delivery, n=num_balls,
+                                 rng=random.Random(crn_seed))
+    r_lopow = run_balls_extended(low_pow_bat, pace_bowler, delivery, n=num_balls,
+                                 rng=random.Random(crn_seed))
 
     six_ratio = r_hipow["sixes"] / max(1, r_lopow["sixes"])
     passed = six_ratio >= 1.5
@@ -1914,7 +2315,7 @@ def run_category_6(num_balls: int = 3000) -> dict:
     return results
 
 
-def run_category_7(num_balls: int = 3000) -> dict:
+def run_category_7(num_balls: int = 3000, rng=random) -> dict:
     """Category 7: Equal Skill Matchups — balanced results for same-tier players."""
     print(f"\nCATEGORY 7: EQUAL SKILL MATCHUPS ({num_balls} balls per test)")
     print("-" * 60)
@@ -1943,7 +2344,7 @@ def run_category_7(num_balls: int = 3000) -> dict:
     ]
 
     for test_id, label, batter, bowler, delivery in matchups:
-        r = run_balls_extended(batter, bowler, delivery, n=num_balls)
+        r = run_balls_extended(batter, bowler, delivery, n=num_balls, rng=rng)
         # Isolated ball tests inherently favor batters (no progressive jaffa, always settled)
         # so SR is higher and Wkt% lower than match-level averages
         sr_ok = 120 <= r["sr"] <= 310
@@ -1957,7 +2358,7 @@ def run_category_7(num_balls: int = 3000) -> dict:
     return results
 
 
-def run_category_8(num_balls: int = 3000) -> dict:
+def run_category_8(num_balls: int = 3000, rng=random) -> dict:
     """Category 8: All Pitch Variations — each pitch favors its type."""
     print(f"\nCATEGORY 8: ALL PITCH VARIATIONS ({num_balls} balls per test)")
     print("-" * 60)
@@ -1982,10 +2383,17 @@ def run_category_8(num_balls: int = 3000) -> dict:
     pitch_bouncer_results = {}
     pitch_batter_sr = {}
 
+    # One seed per matchup, replayed on every pitch. run_balls_extended draws
+    # by inverse CDF, so each pitch sees the same uniforms (common random
+    # numbers) and the cross-pitch comparisons below are paired.
+    pace_seed, spin_seed, bnc_seed = (rng.getrandbits(32) for _ in range(3))
     for pname, pitch in PITCHES.items():
-        r_pace = run_balls_extended(test_batter, test_pacer, gl, pitch=pitch, n=num_balls)
-        r_spin = run_balls_extended(test_batter, test_spinner, stock, pitch=pitch, n=num_balls)
-        r_bnc = run_balls_extended(test_batter, test_pacer, bouncer, pitch=pitch, n=num_balls)
+        r_pace = run_balls_extended(test_batter, test_pacer, gl, pitch=pitch, n=num_balls,
+                                    rng=random.Random(pace_seed))
+        r_spin = run_balls_extended(test_batter, test_spinner, stock, pitch=pitch, n=num_balls,
+                                    rng=random.Random(spin_seed))
+        r_bnc = run_balls_extended(test_batter, test_pacer, bouncer, pitch=pitch, n=num_balls,
+                                   rng=random.Random(bnc_seed))
         pitch_pacer_results[pname] = r_pace
         pitch_spinner_results[pname] = r_spin
         pitch_bouncer_results[pname] = r_bnc
@@ -2055,7 +2463,7 @@ def run_category_8(num_balls: int = 3000) -> dict:
     return results
 
 
-def run_category_9(num_balls: int = 3000) -> dict:
+def run_category_9(num_balls: int = 3000, rng=random) -> dict:
     """Category 9: Bowler Type Comparisons."""
     print(f"\nCATEGORY 9: BOWLER TYPE COMPARISONS ({num_balls} balls per test)")
     print("-" * 60)
@@ -2072,8 +2480,11 @@ def run_category_9(num_balls: int = 3000) -> dict:
                     bowling_type="medium")
 
     gl = PACER_DELIVERIES["good_length"]
-    r_express = run_balls_extended(test_batter, express, gl, n=num_balls)
-    r_medium = run_balls_extended(test_batter, medium, gl, n=num_balls)
+    crn_seed = rng.getrandbits(32)
+    r_express = run_balls_extended(test_batter, express, gl, n=num_balls,
+                                   rng=random.Random(crn_seed))
+    r_medium = run_balls_extended(test_batter, medium, gl, n=num_balls,
+                                  rng=random.Random(crn_seed))
 
     # Express should be more effective: lower SR or higher Wkt%
     express_better = (r_express["sr"] < r_medium["sr"]) or (r_express["wkt_pct"] > r_medium["wkt_pct"])
@@ -2094,23 +2505,24 @@ def run_category_9(num_balls: int = 3000) -> dict:
     outsw = PACER_DELIVERIES["outswinger"]
     bnc = PACER_DELIVERIES["bouncer"]
 
-    r_swing = run_balls_extended(test_batter, swing_pacer, outsw, n=num_balls)
-    r_bounce = run_balls_extended(test_batter, bounce_pacer, bnc, n=num_balls)
+    r_swing = run_balls_extended(test_batter, swing_pacer, outsw, n=num_balls, rng=rng)
+    r_bounce = run_balls_extended(test_batter, bounce_pacer, bnc, n=num_balls, rng=rng)
 
-    swing_total = sum(r_swing["dismissal_types"].values())
-    bounce_total = sum(r_bounce["dismissal_types"].values())
+    swing_total = r_swing["wickets"]
+    bounce_total = r_bounce["wickets"]
 
-    swing_cb_pct = (r_swing["dismissal_types"].get("caught_behind", 0) / max(1, swing_total)) * 100
-    bounce_caught_pct = ((r_bounce["dismissal_types"].get("caught", 0) +
-                          r_bounce["dismissal_types"].get("top_edge", 0)) / max(1, bounce_total)) * 100
+    swing_dis, bounce_dis = r_swing["dismissal_counts"], r_bounce["dismissal_counts"]
+    swing_cb_pct = (swing_dis[DISMISSAL_IDX["caught_behind"]] / max(1, swing_total)) * 100
+    bounce_caught_pct = ((bounce_dis[DISMISSAL_IDX["caught"]] +
+                          bounce_dis[DISMISSAL_IDX["top_edge"]]) / max(1, bounce_total)) * 100
 
     # Swing should have more caught_behind, bounce should have more caught/top_edge
     passed = swing_cb_pct > 20 and bounce_caught_pct > 40
     results["9.2 Swing vs bounce dismissals"] = passed
     status = "[OK]" if passed else "[FAIL]"
     print(f"  {status} 9.2 Swing vs Bounce dismissal profiles:")
-    print(f"       Swing caught_behind={swing_cb_pct:.1f}%  ({dict(r_swing['dismissal_types'])})")
-    print(f"       Bounce caught+top_edge={bounce_caught_pct:.1f}%  ({dict(r_bounce['dismissal_types'])})")
+    print(f"       Swing caught_behind={swing_cb_pct:.1f}%  ({named_counts(DISMISSAL_TYPES, swing_dis)})")
+    print(f"       Bounce caught+top_edge={bounce_caught_pct:.1f}%  ({named_counts(DISMISSAL_TYPES, bounce_dis)})")
 
     # Test 9.3: Off-spin vs leg-spin — both effective, possibly different characteristics
     off_spinner = Player("Offie", "bowler",
@@ -2121,8 +2533,8 @@ def run_category_9(num_balls: int = 3000) -> dict:
                          bowling_type="leg_spin")
 
     stock = SPINNER_DELIVERIES["stock_ball"]
-    r_off = run_balls_extended(test_batter, off_spinner, stock, n=num_balls)
-    r_leg = run_balls_extended(test_batter, leg_spinner, stock, n=num_balls)
+    r_off = run_balls_extended(test_batter, off_spinner, stock, n=num_balls, rng=rng)
+    r_leg = run_balls_extended(test_batter, leg_spinner, stock, n=num_balls, rng=rng)
 
     # Both should be reasonably effective in isolated ball tests
     both_effective = (r_off["wkt_pct"] > 0.5 and r_leg["wkt_pct"] > 0.5 and
@@ -2137,7 +2549,7 @@ def run_category_9(num_balls: int = 3000) -> dict:
     return results
 
 
-def run_category_10(num_balls: int = 3000) -> dict:
+def run_category_10(num_balls: int = 3000, rng=random) -> dict:
     """Category 10: Power Hitting mechanics."""
     print(f"\nCATEGORY 10: POWER HITTING ({num_balls} balls per test)")
     print("-" * 60)
@@ -2154,8 +2566,10 @@ def run_category_10(num_balls: int = 3000) -> dict:
     low_pow = Player("LowPow", "batsman",
                      BatterDNA(70, 70, 70, 70, 70, 70, 30))
 
-    r_hi = run_balls_extended(high_pow, bowler, gl, n=num_balls)
-    r_lo = run_balls_extended(low_pow, bowler, gl, n=num_balls)
+    # Paired on one seed (common random numbers) like the Category 6 pairs
+    crn_seed = rng.getrandbits(32)
+    r_hi = run_balls_extended(high_pow, bowler, gl, n=num_balls, rng=random.Random(crn_seed))
+    r_lo = run_balls_extended(low_pow, bowler, gl, n=num_balls, rng=random.Random(crn_seed))
 
     # Test 10.1: Six count ratio
     six_ratio = r_hi["sixes"] / max(1, r_lo["sixes"])
@@ -2179,7 +2593,7 @@ def run_category_10(num_balls: int = 3000) -> dict:
     return results
 
 
-def run_category_11(num_balls: int = 5000) -> dict:
+def run_category_11(num_balls: int = 5000, rng=random) -> dict:
     """Category 11: Delivery Dismissal Patterns — characteristic dismissals."""
     print(f"\nCATEGORY 11: DELIVERY DISMISSAL PATTERNS ({num_balls} balls per test)")
     print("-" * 60)
@@ -2213,16 +2627,18 @@ def run_category_11(num_balls: int = 5000) -> dict:
          ["bowled", "lbw"], 40, "spin"),
     ]
 
-    for test_id, del_name, bowler, expected_types, min_pct, del_set in delivery_tests:
-        delivery = PACER_DELIVERIES[del_name] if del_set == "pace" else SPINNER_DELIVERIES[del_name]
-        r = run_balls_extended(test_batter, bowler, delivery, n=num_balls)
+    cases = [
+        (test_id, del_name, bowler, expected_types, min_pct,
+         PACER_DELIVERIES[del_name] if del_set == "pace" else SPINNER_DELIVERIES[del_name])
+        for test_id, del_name, bowler, expected_types, min_pct, del_set in delivery_tests
+    ]
 
-        total_wkts = sum(r["dismissal_types"].values())
-        if total_wkts > 0:
-            expected_count = sum(r["dismissal_types"].get(t, 0) for t in expected_types)
-            actual_pct = expected_count / total_wkts * 100
-        else:
-            actual_pct = 0
+    for test_id, del_name, bowler, expected_types, min_pct, delivery in cases:
+        r = run_balls_extended(test_batter, bowler, delivery, n=num_balls, rng=rng)
+
+        total_wkts = r["wickets"]
+        expected_count = sum(r["dismissal_counts"][DISMISSAL_IDX[t]] for t in expected_types)
+        actual_pct = expected_count / max(1, total_wkts) * 100
 
         passed = actual_pct >= min_pct and total_wkts >= 30
         results[f"{test_id} {del_name} dismissals"] = passed
@@ -2230,7 +2646,89 @@ def run_category_11(num_balls: int = 5000) -> dict:
         types_str = "+".join(expected_types)
         print(f"  {status} {test_id} {del_name}:  {types_str}={actual_pct:.1f}%  "
               f"({total_wkts} wkts)  (want: ≥{min_pct}%)")
-        print(f"       Breakdown: {dict(r['dismissal_types'])}")
+        print(f"       Breakdown: {named_counts(DISMISSAL_TYPES, r['dismissal_counts'])}")
+
+    return results
+
+
+def table_deviations(setup: BallSetup, n: int, rng=random) -> Dict[str, float]:
+    """Roll n balls through roll_ball and return, per statistic, the z-score
+    of the observed total against the setup's outcome_table. The validation
+    categories sample from the table, so this is what ties them to the real
+    per-ball engine. Statistics cover each contact type's share, wickets and
+    runs, each dismissal type, boundaries, sixes and total runs."""
+    outcomes, cum_weights = outcome_table(setup)
+    total = cum_weights[-1]
+    expected = {o: (b - a) / total for o, a, b in zip(outcomes, [0.0] + cum_weights, cum_weights)}
+    observed = Counter()
+    for _ in range(n):
+        r = roll_ball(setup, rng)
+        observed[(r.runs, r.is_wicket, r.is_boundary, r.is_six,
+                  r.contact_quality, r.dismissal_type)] += 1
+
+    # statistic name -> value of that statistic for one ball's outcome
+    stats = {"runs": lambda o: o[0], "boundary": lambda o: o[2], "six": lambda o: o[3]}
+    for c in CONTACT_TYPES:
+        stats[c] = lambda o, c=c: o[4] == c
+        stats[f"{c} wickets"] = lambda o, c=c: o[4] == c and o[1]
+        stats[f"{c} runs"] = lambda o, c=c: o[0] if o[4] == c else 0
+    for d in DISMISSAL_TYPES:
+        stats[d] = lambda o, d=d: o[1] and o[5] == d
+
+    z = {}
+    for name, f in stats.items():
+        mean = sum(f(o) * p for o, p in expected.items())
+        var = sum(f(o) ** 2 * p for o, p in expected.items()) - mean ** 2
+        diff = sum(f(o) * c for o, c in observed.items()) - n * mean
+        if var > 1e-12:
+            z[name] = diff / math.sqrt(n * var)
+        else:  # the table rules this out entirely, so any occurrence is a mismatch
+            z[name] = 0.0 if abs(diff) < 1e-6 * n else math.inf
+    return z
+
+
+def run_category_12(num_balls: int = 50000, rng=random) -> dict:
+    """Category 12: Outcome Table Consistency — outcome_table vs roll_ball."""
+    print(f"\nCATEGORY 12: OUTCOME TABLE CONSISTENCY ({num_balls} balls per test)")
+    print("-" * 60)
+
+    results = {}
+    max_z = 4.5  # dozens of statistics per test; keeps false alarms near 0.1%
+
+    avg_bat = Player("TblAvgBat", "batsman", BatterDNA(60, 58, 57, 55, 58, 58, 55))
+    elite_bat = Player("TblEliteBat", "batsman", BatterDNA(85, 82, 83, 78, 84, 80, 88))
+    tail_bat = Player("TblTail", "bowler", BatterDNA(34, 30, 32, 28, 33, 31, 30))
+    pacer = Player("TblPacer", "bowler",
+                   bowler_dna=PacerDNA(speed=142, swing=70, bounce=72, control=70),
+                   bowling_type="pace")
+    spinner = Player("TblSpin", "bowler",
+                     bowler_dna=SpinnerDNA(turn=74, flight=70, variation=72, control=68),
+                     bowling_type="leg_spin")
+
+    cases = [
+        # (test_id, label, batter, bowler, delivery, pitch, approach, overs, balls_faced)
+        ("12.1", "good_length, rotate", avg_bat, pacer, PACER_DELIVERIES["good_length"],
+         "balanced", "rotate", 10, 15),
+        ("12.2", "tail-ender vs spin, survive", tail_bat, spinner, SPINNER_DELIVERIES["stock_ball"],
+         "dust_bowl", "survive", 18, 3),
+        ("12.3", "elite all_out vs yorker", elite_bat, pacer, PACER_DELIVERIES["yorker"],
+         "flat_deck", "all_out", 17, 30),
+        ("12.4", "long innings vs bouncer, push", avg_bat, pacer, PACER_DELIVERIES["bouncer"],
+         "green_seamer", "push", 3, 60),
+    ]
+
+    for test_id, label, batter, bowler, delivery, pitch, approach, overs, balls_faced in cases:
+        innings = InningsState(pitch=PITCHES[pitch])
+        innings.overs = overs
+        setup = prepare_ball(bowler, batter, delivery, innings, approach,
+                             balls_faced=balls_faced)
+        z = table_deviations(setup, num_balls, rng)
+        worst = max(z, key=lambda k: abs(z[k]))
+        passed = abs(z[worst]) < max_z
+        results[f"{test_id} Table matches roll_ball ({label})"] = passed
+        status = "[OK]" if passed else "[FAIL]"
+        print(f"  {status} {test_id} {label}:  worst |z|={abs(z[worst]):.2f} ({worst})  "
+              f"(want: <{max_z})")
 
     return results
 
@@ -2239,8 +2737,29 @@ def run_category_11(num_balls: int = 5000) -> dict:
 # 11. MAIN
 # ================================================================
 
+SMOKE_BALL_DIVISOR = 10
+
+
 def main():
-    num_matches = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    flags = {a for a in sys.argv[1:] if a.startswith("--")}
+    unknown = flags - {"--smoke", "--full"}
+    if unknown:
+        error = f"unknown option(s): {', '.join(sorted(unknown))}"
+    elif len(flags) > 1:
+        error = "--smoke and --full are mutually exclusive"
+    else:
+        error = None
+    if error:
+        print(f"error: {error}\nusage: {sys.argv[0]} [num_matches] [--smoke | --full]",
+              file=sys.stderr)
+        return 2
+    smoke = "--smoke" in flags
+    num_matches = int(args[0]) if args else (10 if smoke else 100)
+    ball_divisor = SMOKE_BALL_DIVISOR if smoke else 1
+    # Block-buffer stdout even on a terminal: the report is hundreds of short
+    # lines, and line buffering would flush on every one of them
+    sys.stdout.reconfigure(line_buffering=False)
 
     print("=" * 60)
     print("MATCH ENGINE v2 POC — SIMULATION RESULTS")
@@ -2270,38 +2789,42 @@ def main():
         print(f"    speed={bd.speed}kph swing={bd.swing} bounce={bd.bounce} control={bd.control}")
     else:
         print(f"    turn={bd.turn} flight={bd.flight} variation={bd.variation} control={bd.control}")
-    print(f"    repertoire: {[d.name for d in get_repertoire(bowler)]}")
-
-    # Run all categories
-    r1 = run_category_1(num_matches)
-    r2 = run_category_2(2000)
-    r3 = run_category_3(1500)
-    r4 = run_category_4(num_matches)
-    r5 = run_category_5(3000)
-    r6 = run_category_6(3000)
-    r7 = run_category_7(3000)
-    r8 = run_category_8(3000)
-    r9 = run_category_9(3000)
-    r10 = run_category_10(3000)
-    r11 = run_category_11(5000)
-
-    # Final summary
-    all_results = {}
-    all_results.update(r1)
-    all_results.update(r2)
-    all_results.update(r3)
-    all_results.update(r4)
-    all_results.update(r5)
-    all_results.update(r6)
-    all_results.update(r7)
-    all_results.update(r8)
-    all_results.update(r9)
-    all_results.update(r10)
-    all_results.update(r11)
-
-    passed = sum(1 for v in all_results.values() if v)
+    print(f"    repertoire: {[d.name for d in bowler.repertoire]}")
+
+    # Run all categories. Ball-level categories are independent, so they
+    # run across a process pool while the match-level ones (1 and 4) run
+    # here and fan their matches out to the same pool, keeping the machine
+    # at one worker per core; reports print in category order.
+    ball_categories = {
+        2: (run_category_2, 2000), 3: (run_category_3, 1500),
+        5: (run_category_5, 3000), 6: (run_category_6, 3000),
+        7: (run_category_7, 3000), 8: (run_category_8, 3000),
+        9: (run_category_9, 3000), 10: (run_category_10, 3000),
+        11: (run_category_11, 5000), 12: (run_category_12, 50000),
+    }
+    tasks = [(random.getrandbits(32), fn, (n // ball_divisor,))
+             for fn, n in ball_categories.values()]
+    sys.stdout.flush()
+    with multiprocessing.Pool() as pool:
+        pending = pool.map_async(_run_category, tasks)
+        reports = {1: captured(run_category_1, num_matches, pool=pool),
+                   4: captured(run_category_4, num_matches, pool=pool)}
+        reports.update(zip(ball_categories, pending.get()))
+
+    # Final summary. ChainMap views the per-category results without copying
+    # them; it iterates its maps last-to-first, so they go in reversed to keep
+    # failures listed in category order.
+    for cat in sorted(reports):
+        sys.stdout.write(reports[cat][0])
+    all_results = ChainMap(*[reports[cat][1] for cat in sorted(reports, reverse=True)])
+
+    passed = 0
+    failed_tests = []
+    for k, v in all_results.items():
+        passed += bool(v)
+        if not v:
+            failed_tests.append(k)
     total = len(all_results)
-    failed_tests = [k for k, v in all_results.items() if not v]
 
     print("\n" + "=" * 60)
     print(f"FINAL SUMMARY: {passed}/{total} tests passed")
@@ -2314,8 +2837,11 @@ def main():
     else:
         print("\nAll tests passed!")
 
+    if smoke and failed_tests:
+        print("\n(--smoke: thresholds are sized for full runs, so these don't fail the run)")
+
     print()
-    return 0 if passed == total else 1
+    return 0 if passed == total or smoke else 1
 
 
 if __name__ == "__main__":
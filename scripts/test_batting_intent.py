@@ -7,46 +7,56 @@ Tests that:
 - Accumulators are in between
 """
 import sys
-import json
+import os
+import math
+import random
+import multiprocessing
+from functools import lru_cache
 sys.path.insert(0, '/Users/rsumit123/work/willow-leather-api')
 
-from app.engine.match_engine import MatchEngine, BatterState, BowlerState
-from app.models.player import Player, PlayerRole, BowlingType, BattingStyle
-from statistics import mean, stdev
+from app.engine.match_engine import MatchEngine, BatterState, BowlerState, PlayerLite
+from app.models.player import PlayerRole, BowlingType
 
 NUM_SIMULATIONS = 25  # Per intent type
 
 
+class Running:
+    """One-pass mean/stdev/min/max (Welford), so no per-sample list is kept"""
+    __slots__ = ("n", "mean", "M2", "mn", "mx")
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.M2 = 0.0
+        self.mn = math.inf
+        self.mx = -math.inf
+
+    def push(self, x):
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.M2 += delta * (x - self.mean)
+        self.mn = min(self.mn, x)
+        self.mx = max(self.mx, x)
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.M2 / (self.n - 1)) if self.n > 1 else 0
+
+
 def create_player(player_id: int, name: str, role: PlayerRole, batting: int, bowling: int,
-                  power: int = 50, batting_intent: str = "accumulator") -> Player:
+                  power: int = 50, batting_intent: str = "accumulator") -> PlayerLite:
     """Create a player with specific batting_intent"""
-    player = Player(
+    return PlayerLite(
+        id=player_id,
         name=name,
-        age=25,
-        nationality="India",
-        is_overseas=False,
         role=role,
-        batting_style=BattingStyle.RIGHT_HANDED,
         bowling_type=BowlingType.PACE if role in [PlayerRole.BOWLER, PlayerRole.ALL_ROUNDER] else BowlingType.MEDIUM,
         batting=batting,
         bowling=bowling,
-        fielding=60,
-        fitness=70,
         power=power,
-        technique=60,
-        running=60,
-        pace_or_spin=60,
-        accuracy=60,
-        variation=50,
-        temperament=60,
-        consistency=60,
-        form=1.0,
-        traits=json.dumps([]),
         batting_intent=batting_intent,
-        base_price=5000000,
     )
-    player.id = player_id
-    return player
 
 
 def create_team_with_intent(start_id: int, batting_intent: str) -> list:
@@ -111,62 +121,83 @@ def create_neutral_bowling_team(start_id: int) -> list:
     return players
 
 
-def run_intent_simulations():
-    """Run simulations for each batting intent type"""
-    intents = ["anchor", "accumulator", "aggressive", "power_hitter"]
-    results = {}
-
-    bowling_team = create_neutral_bowling_team(start_id=100)
+# Deterministic and immutable (PlayerLite), so one copy serves every matchup
+_NEUTRAL_BOWLING_TEAM = tuple(create_neutral_bowling_team(start_id=100))
 
-    for intent in intents:
-        print(f"\n{'='*60}")
-        print(f"Testing {intent.upper()} intent ({NUM_SIMULATIONS} innings)")
-        print('='*60)
 
-        scores = []
-        wickets = []
-        boundaries = []
-        sixes = []
+@lru_cache(maxsize=None)
+def _intent_matchup(intent: str) -> tuple:
+    """(batting_team, bowling_team) for an intent, built once per process.
+    The engine only reads players, so every innings can share them."""
+    return (tuple(create_team_with_intent(start_id=1, batting_intent=intent)),
+            _NEUTRAL_BOWLING_TEAM)
 
-        for i in range(NUM_SIMULATIONS):
-            batting_team = create_team_with_intent(start_id=1, batting_intent=intent)
 
-            engine = MatchEngine()
-            innings = engine.setup_innings(batting_team, bowling_team)
+def _simulate_one_innings(task: tuple) -> tuple:
+    """Pool worker: task = (seed, intent). Plays one full innings against the
+    neutral bowling team and returns (runs, wickets, fours, sixes)."""
+    seed, intent = task
+    batting_team, bowling_team = _intent_matchup(intent)
 
-            # Simulate full innings with balanced aggression
-            while not innings.is_innings_complete:
-                engine.simulate_over(innings, "balanced")
+    engine = MatchEngine(rng=random.Random(seed))
+    innings = engine.setup_innings(list(batting_team), list(bowling_team))
 
-            # Collect stats
-            runs = innings.total_runs
-            wkts = innings.wickets
-            fours = sum(bi.fours for bi in innings.batter_innings.values())
-            six_count = sum(bi.sixes for bi in innings.batter_innings.values())
+    # Simulate full innings with balanced aggression
+    while not innings.is_innings_complete:
+        engine.simulate_over(innings, "balanced")
 
-            scores.append(runs)
-            wickets.append(wkts)
-            boundaries.append(fours + six_count)
-            sixes.append(six_count)
+    return innings.total_runs, innings.wickets, innings.total_fours, innings.total_sixes
 
-            print(f"  Innings {i+1}: {runs}/{wkts} (4s: {fours}, 6s: {six_count})")
 
-        results[intent] = {
-            "avg_score": mean(scores),
-            "score_stdev": stdev(scores) if len(scores) > 1 else 0,
-            "avg_wickets": mean(wickets),
-            "avg_boundaries": mean(boundaries),
-            "avg_sixes": mean(sixes),
-            "min_score": min(scores),
-            "max_score": max(scores),
-        }
+def run_intent_simulations():
+    """Run simulations for each batting intent type"""
+    intents = ["anchor", "accumulator", "aggressive", "power_hitter"]
+    results = {}
 
-        print(f"\n  Summary:")
-        print(f"    Avg Score: {results[intent]['avg_score']:.1f} ± {results[intent]['score_stdev']:.1f}")
-        print(f"    Avg Wickets: {results[intent]['avg_wickets']:.1f}")
-        print(f"    Avg Boundaries: {results[intent]['avg_boundaries']:.1f}")
-        print(f"    Avg Sixes: {results[intent]['avg_sixes']:.1f}")
-        print(f"    Score Range: {results[intent]['min_score']} - {results[intent]['max_score']}")
+    # Innings are independent, so they run across a process pool; each task
+    # carries its own seed so workers never replay each other's stream
+    cpus = os.cpu_count() or 1
+    chunksize = max(1, NUM_SIMULATIONS // (4 * cpus))
+
+    with multiprocessing.Pool(processes=cpus) as pool:
+        for intent in intents:
+            print(f"\n{'='*60}")
+            print(f"Testing {intent.upper()} intent ({NUM_SIMULATIONS} innings)")
+            print('='*60)
+
+            scores = Running()
+            wickets = Running()
+            boundaries = Running()
+            sixes = Running()
+
+            tasks = [(random.getrandbits(32), intent) for _ in range(NUM_SIMULATIONS)]
+            lines = []  # written as one block rather than a write per innings
+            for i, (runs, wkts, fours, six_count) in enumerate(
+                    pool.imap(_simulate_one_innings, tasks, chunksize=chunksize)):
+                scores.push(runs)
+                wickets.push(wkts)
+                boundaries.push(fours + six_count)
+                sixes.push(six_count)
+
+                lines.append(f"  Innings {i+1}: {runs}/{wkts} (4s: {fours}, 6s: {six_count})")
+            print("\n".join(lines))
+
+            results[intent] = {
+                "avg_score": scores.mean,
+                "score_stdev": scores.stdev,
+                "avg_wickets": wickets.mean,
+                "avg_boundaries": boundaries.mean,
+                "avg_sixes": sixes.mean,
+                "min_score": scores.mn,
+                "max_score": scores.mx,
+            }
+
+            print(f"\n  Summary:")
+            print(f"    Avg Score: {results[intent]['avg_score']:.1f} ± {results[intent]['score_stdev']:.1f}")
+            print(f"    Avg Wickets: {results[intent]['avg_wickets']:.1f}")
+            print(f"    Avg Boundaries: {results[intent]['avg_boundaries']:.1f}")
+            print(f"    Avg Sixes: {results[intent]['avg_sixes']:.1f}")
+            print(f"    Score Range: {results[intent]['min_score']} - {results[intent]['max_score']}")
 
     return results
 
@@ -246,38 +277,37 @@ def test_single_ball_variance():
     intents = ["anchor", "accumulator", "aggressive", "power_hitter"]
     num_balls = 500
 
-    bowling_team = create_neutral_bowling_team(start_id=100)
-    bowler = bowling_team[7]  # A bowler from the team
+    bowler = _NEUTRAL_BOWLING_TEAM[7]  # A bowler from the team
 
     results = {}
 
     for intent in intents:
-        batting_team = create_team_with_intent(start_id=1, batting_intent=intent)
+        batting_team, bowling_team = _intent_matchup(intent)
         batter = batting_team[0]  # Top opener
 
-        runs_list = []
+        runs = Running()
         wickets = 0
         boundaries = 0
 
-        for _ in range(num_balls):
-            engine = MatchEngine()
-            innings = engine.setup_innings(batting_team, bowling_team)
-
-            # Fresh state for each ball
-            innings.batter_states[batter.id] = BatterState(player_id=batter.id)
-            innings.bowler_states[bowler.id] = BowlerState(player_id=bowler.id)
+        # Fresh state for the matchup. calculate_ball_outcome only reads the
+        # innings and these states, so one setup serves every ball.
+        engine = MatchEngine()
+        innings = engine.setup_innings(list(batting_team), list(bowling_team))
+        innings.batter_states[batter.id] = BatterState(player_id=batter.id)
+        innings.bowler_states[bowler.id] = BowlerState(player_id=bowler.id)
 
+        for _ in range(num_balls):
             outcome = engine.calculate_ball_outcome(batter, bowler, "balanced", innings)
 
-            runs_list.append(outcome.runs)
+            runs.push(outcome.runs)
             if outcome.is_wicket:
                 wickets += 1
             if outcome.is_boundary:
                 boundaries += 1
 
         results[intent] = {
-            "avg_runs": mean(runs_list),
-            "runs_stdev": stdev(runs_list) if len(runs_list) > 1 else 0,
+            "avg_runs": runs.mean,
+            "runs_stdev": runs.stdev,
             "wicket_rate": wickets / num_balls * 100,
             "boundary_rate": boundaries / num_balls * 100,
         }
@@ -14,13 +14,16 @@ Success Criteria:
 
 import sys
 import os
+import random
+import multiprocessing
+from functools import lru_cache
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.engine.match_engine import MatchEngine
-from app.models.player import Player, PlayerRole, BowlingType, BattingStyle
+from app.engine.match_engine import MatchEngine, PlayerLite
+from app.models.player import PlayerRole, BowlingType
 
 # Create mock players with different skill levels
-def create_team(skill_level: str) -> list[Player]:
+def create_team(skill_level: str) -> list[PlayerLite]:
     """Create a team with given skill level: 'weak', 'balanced', 'strong'"""
     skill_map = {
         'weak': (55, 60),
@@ -48,31 +51,15 @@ def create_team(skill_level: str) -> list[Player]:
         bat_skill = base_bat + (15 if role in [PlayerRole.BATSMAN, PlayerRole.ALL_ROUNDER] else 0)
         bowl_skill = base_bowl + (10 if role in [PlayerRole.BOWLER, PlayerRole.ALL_ROUNDER] else 0)
 
-        player = Player(
+        players.append(PlayerLite(
             id=i + 1,
             name=f"Player_{i+1}",
-            age=25,
-            nationality="Test",
-            is_overseas=False,
             role=role,
-            batting_style=BattingStyle.RIGHT_HANDED,
             bowling_type=bowl_type,
             batting=max(40, min(99, bat_skill)),
             bowling=max(40, min(99, bowl_skill)),
-            fielding=70,
-            fitness=70,
             power=70,
-            technique=70,
-            running=70,
-            pace_or_spin=70,
-            accuracy=70,
-            variation=70,
-            temperament=70,
-            consistency=70,
-            form=1.0,
-            base_price=100000,
-        )
-        players.append(player)
+        ))
 
     return players
 
@@ -88,35 +75,45 @@ SCENARIOS = {
 NUM_MATCHES = 50
 
 
-def run_scenario(scenario_name: str, config: dict) -> dict:
-    """Run matches for a scenario and collect stats"""
-    batting_team = create_team(config["batting"])
-    bowling_team = create_team(config["bowling"])
-    aggression = config["aggression"]
+@lru_cache(maxsize=None)
+def _cached_team(skill_level: str) -> tuple:
+    """create_team, built once per process. The engine only reads players,
+    so every innings of every scenario can share them."""
+    return tuple(create_team(skill_level))
+
+
+def _simulate_one_scenario_innings(task: tuple) -> tuple:
+    """Pool worker: task = (seed, config). Plays one innings of the scenario
+    from its own seed and returns (runs, wickets, balls_faced)."""
+    seed, config = task
+    engine = MatchEngine(rng=random.Random(seed))
+    innings = engine.setup_innings(list(_cached_team(config["batting"])),
+                                   list(_cached_team(config["bowling"])))
+
+    # Simulate innings
+    while not innings.is_innings_complete:
+        engine.simulate_over(innings, config["aggression"])
+
+    return innings.total_runs, innings.wickets, innings.overs * 6 + innings.balls
+
 
+def scenario_stats(innings: list) -> dict:
+    """Collect a scenario's stats from its (runs, wickets, balls_faced) rows"""
     scores = []
     wickets = []
     all_outs = 0
     total_balls = 0
     total_wickets = 0
 
-    for _ in range(NUM_MATCHES):
-        engine = MatchEngine()
-        innings = engine.setup_innings(batting_team, bowling_team)
+    for runs, wkts, balls_faced in innings:
+        scores.append(runs)
+        wickets.append(wkts)
 
-        # Simulate innings
-        while not innings.is_innings_complete:
-            engine.simulate_over(innings, aggression)
-
-        scores.append(innings.total_runs)
-        wickets.append(innings.wickets)
-
-        if innings.wickets >= 10:
+        if wkts >= 10:
             all_outs += 1
 
-        balls_faced = innings.overs * 6 + innings.balls
         total_balls += balls_faced
-        total_wickets += innings.wickets
+        total_wickets += wkts
 
     return {
         "min_score": min(scores),
@@ -125,11 +122,28 @@ def run_scenario(scenario_name: str, config: dict) -> dict:
         "scores_below_50": sum(1 for s in scores if s < 50),
         "scores_above_260": sum(1 for s in scores if s > 260),
         "wicket_rate": (total_wickets / total_balls) * 100 if total_balls > 0 else 0,
-        "all_out_rate": (all_outs / NUM_MATCHES) * 100,
+        "all_out_rate": (all_outs / len(scores)) * 100,
         "avg_wickets": sum(wickets) / len(wickets),
     }
 
 
+def scenario_tasks(config: dict) -> list:
+    """One (seed, config) pool task per match; each innings gets its own seed
+    so workers never replay each other's stream"""
+    return [(random.getrandbits(32), config) for _ in range(NUM_MATCHES)]
+
+
+def _chunksize() -> int:
+    return max(1, NUM_MATCHES // (4 * (os.cpu_count() or 1)))
+
+
+def run_scenario(scenario_name: str, config: dict) -> dict:
+    """Run matches for a scenario and collect stats"""
+    with multiprocessing.Pool() as pool:
+        return scenario_stats(pool.map(_simulate_one_scenario_innings,
+                                       scenario_tasks(config), chunksize=_chunksize()))
+
+
 def main():
     print("=" * 60)
     print("Match Engine Score Range Test")
@@ -139,50 +153,60 @@ def main():
     all_passed = True
     results = {}
 
-    for scenario_name, config in SCENARIOS.items():
-        print(f"\nRunning scenario: {scenario_name}...")
-        stats = run_scenario(scenario_name, config)
-        results[scenario_name] = stats
-
-        # Check pass/fail criteria
-        passed = True
-        issues = []
-
-        if stats["min_score"] < 50:
-            passed = False
-            issues.append(f"Min score {stats['min_score']} < 50")
-
-        if stats["max_score"] > 260:
-            passed = False
-            issues.append(f"Max score {stats['max_score']} > 260")
-
-        if stats["scores_below_50"] > 0:
-            passed = False
-            issues.append(f"{stats['scores_below_50']} scores below 50")
-
-        if stats["scores_above_260"] > 0:
-            passed = False
-            issues.append(f"{stats['scores_above_260']} scores above 260")
-
-        if stats["wicket_rate"] < 2 or stats["wicket_rate"] > 8:
-            issues.append(f"Wicket rate {stats['wicket_rate']:.2f}% outside 2-8% range")
-
-        if stats["all_out_rate"] > 40:
-            issues.append(f"All-out rate {stats['all_out_rate']:.1f}% > 40%")
-
-        status = "PASS" if passed else "FAIL"
-        if not passed:
-            all_passed = False
-
-        print(f"  [{status}] {scenario_name}")
-        print(f"    Score Range: {stats['min_score']}-{stats['max_score']} (avg: {stats['avg_score']:.1f})")
-        print(f"    Wicket Rate: {stats['wicket_rate']:.2f}% per ball")
-        print(f"    All-Out Rate: {stats['all_out_rate']:.1f}%")
-        print(f"    Avg Wickets: {stats['avg_wickets']:.1f}")
-
-        if issues:
-            for issue in issues:
-                print(f"    ! {issue}")
+    # Every scenario's innings are independent, so they are all queued on one
+    # process pool up front (scenarios overlap instead of running back to
+    # back) and reported in scenario order as each one's batch completes
+    with multiprocessing.Pool() as pool:
+        pending = {
+            scenario_name: pool.map_async(_simulate_one_scenario_innings,
+                                          scenario_tasks(config), chunksize=_chunksize())
+            for scenario_name, config in SCENARIOS.items()
+        }
+
+        for scenario_name, batch in pending.items():
+            print(f"\nRunning scenario: {scenario_name}...")
+            stats = scenario_stats(batch.get())
+            results[scenario_name] = stats
+
+            # Check pass/fail criteria
+            passed = True
+            issues = []
+
+            if stats["min_score"] < 50:
+                passed = False
+                issues.append(f"Min score {stats['min_score']} < 50")
+
+            if stats["max_score"] > 260:
+                passed = False
+                issues.append(f"Max score {stats['max_score']} > 260")
+
+            if stats["scores_below_50"] > 0:
+                passed = False
+                issues.append(f"{stats['scores_below_50']} scores below 50")
+
+            if stats["scores_above_260"] > 0:
+                passed = False
+                issues.append(f"{stats['scores_above_260']} scores above 260")
+
+            if stats["wicket_rate"] < 2 or stats["wicket_rate"] > 8:
+                issues.append(f"Wicket rate {stats['wicket_rate']:.2f}% outside 2-8% range")
+
+            if stats["all_out_rate"] > 40:
+                issues.append(f"All-out rate {stats['all_out_rate']:.1f}% > 40%")
+
+            status = "PASS" if passed else "FAIL"
+            if not passed:
+                all_passed = False
+
+            print(f"  [{status}] {scenario_name}")
+            print(f"    Score Range: {stats['min_score']}-{stats['max_score']} (avg: {stats['avg_score']:.1f})")
+            print(f"    Wicket Rate: {stats['wicket_rate']:.2f}% per ball")
+            print(f"    All-Out Rate: {stats['all_out_rate']:.1f}%")
+            print(f"    Avg Wickets: {stats['avg_wickets']:.1f}")
+
+            if issues:
+                for issue in issues:
+                    print(f"    ! {issue}")
 
     print("\n" + "=" * 60)
     if all_passed:
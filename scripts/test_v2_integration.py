@@ -9,8 +9,8 @@ Run: python scripts/test_v2_integration.py [num_matches]
 import sys
 import os
 import random
-from collections import defaultdict
-from statistics import mean
+import multiprocessing
+from statistics import fmean
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -22,12 +22,15 @@ from app.engine.match_engine_v2 import MatchEngineV2
 from app.engine.dna import PITCHES
 
 
-def build_team(players: list[Player]) -> list[Player]:
-    """Build a realistic XI from a pool of players."""
-    wks = [p for p in players if p.role == PlayerRole.WICKET_KEEPER]
-    bats = [p for p in players if p.role == PlayerRole.BATSMAN]
-    ars = [p for p in players if p.role == PlayerRole.ALL_ROUNDER]
-    bowls = [p for p in players if p.role == PlayerRole.BOWLER]
+def build_team(pool: list[int], players: list[Player], roles: list[PlayerRole]) -> list[Player]:
+    """Build a realistic XI from a pool of indices into players.
+    roles[i] is players[i].role, read once up front so team building never
+    goes back through the ORM attribute machinery."""
+    buckets = {PlayerRole.WICKET_KEEPER: [], PlayerRole.BATSMAN: [],
+               PlayerRole.ALL_ROUNDER: [], PlayerRole.BOWLER: []}
+    for i in pool:
+        buckets[roles[i]].append(i)
+    wks, bats, ars, bowls = buckets.values()
 
     team = []
     if wks:
@@ -43,7 +46,52 @@ def build_team(players: list[Player]) -> list[Player]:
     while len(team) < 11 and remaining:
         team.append(remaining.pop(0))
 
-    return team[:11]
+    return [players[i] for i in team[:11]]
+
+
+# Pool workers. SQLAlchemy instances don't pickle, so tasks carry player ids
+# and each worker resolves them against its own copy of the pool.
+_WORKER_PLAYERS: dict = {}
+
+
+def _init_worker():
+    """Pool initializer: load the player pool once per worker process."""
+    session = get_session()
+    _WORKER_PLAYERS.update((p.id, p) for p in session.query(Player).all())
+
+
+def _play_match(task: tuple) -> tuple:
+    """task = (seed, team1_ids, team2_ids, pitch_name or None). Plays one match
+    and returns (runs1, wickets1, runs2, wickets2, balls2, winner)."""
+    seed, team1_ids, team2_ids, pitch_name = task
+    random.seed(seed)  # the v2 engine draws from the module RNG
+    team1 = [_WORKER_PLAYERS[i] for i in team1_ids]
+    team2 = [_WORKER_PLAYERS[i] for i in team2_ids]
+    pitch = PITCHES[pitch_name] if pitch_name else None
+
+    engine = MatchEngineV2()
+    result = engine.simulate_match(team1, team2, pitch=pitch)
+    innings2 = engine.innings2
+    return (result["innings1"]["runs"], result["innings1"]["wickets"],
+            result["innings2"]["runs"], result["innings2"]["wickets"],
+            innings2.overs * 6 + innings2.balls, result["winner"])
+
+
+def _play_overs(task: tuple) -> tuple:
+    """task = (seed, team1_ids, team2_ids, aggression). Plays up to 5 overs on
+    a balanced pitch and returns (runs, legal balls)."""
+    seed, team1_ids, team2_ids, agg = task
+    random.seed(seed)
+    team1 = [_WORKER_PLAYERS[i] for i in team1_ids]
+    team2 = [_WORKER_PLAYERS[i] for i in team2_ids]
+
+    engine = MatchEngineV2()
+    innings = engine.setup_innings(team1, team2, pitch=PITCHES["balanced"])
+    for _ in range(5):
+        if innings.is_innings_complete:
+            break
+        engine.simulate_over(innings, agg)
+    return innings.total_runs, innings.overs * 6 + innings.balls
 
 
 def run_test(name: str, passed: bool, detail: str = ""):
@@ -74,13 +122,18 @@ def main():
     if len(players) < 50:
         print("Generating player pool...")
         new_players = PlayerGenerator.generate_player_pool(100)
-        for p in new_players:
-            session.add(p)
+        # One batched INSERT. return_defaults fills in the new ids, so the
+        # generated objects join the pool as-is instead of being re-queried
+        session.bulk_save_objects(new_players, return_defaults=True)
         session.commit()
-        players = session.query(Player).all()
+        players += new_players
 
     print(f"Player pool: {len(players)} players")
 
+    # Teams are drawn as indices into the pool; roles are read once
+    roles = [p.role for p in players]
+    draw_size = min(100, len(players))
+
     # Check DNA is populated
     dna_count = sum(1 for p in players if p.batting_dna_json is not None)
     bowler_dna_count = sum(1 for p in players if p.bowler_dna_json is not None)
@@ -111,154 +164,151 @@ def main():
         all_total += 1
         all_passed += int(t)
 
-    # =============================================
-    # TEST 2: Match Simulation
-    # =============================================
-    print("\n--- Test Category 2: Match Simulation ---")
-
-    stats = defaultdict(list)
-    engine = MatchEngineV2()
-
-    for i in range(num_matches):
-        random.shuffle(players)
-        team1 = build_team(players[:50])
-        team2 = build_team(players[50:100])
-
-        result = engine.simulate_match(team1, team2)
-
-        stats["scores"].append(result["innings1"]["runs"])
-        stats["scores"].append(result["innings2"]["runs"])
-        stats["wickets"].append(result["innings1"]["wickets"])
-        stats["wickets"].append(result["innings2"]["wickets"])
-        stats["chasing_wins"].append(1 if result["winner"] == "team2" else 0)
-
-    avg_score = mean(stats["scores"])
-    min_score = min(stats["scores"])
-    max_score = max(stats["scores"])
-    avg_wkts = mean(stats["wickets"])
-    chase_pct = mean(stats["chasing_wins"]) * 100
-
-    t = run_test("Average score in T20 range (120-200)",
-                 120 <= avg_score <= 200,
-                 f"avg={avg_score:.1f}")
-    all_total += 1; all_passed += int(t)
-
-    t = run_test("No unrealistic collapses (min > 20)",
-                 min_score > 20,
-                 f"min={min_score}")
-    all_total += 1; all_passed += int(t)
-
-    t = run_test("Max score < 300",
-                 max_score < 300,
-                 f"max={max_score}")
-    all_total += 1; all_passed += int(t)
-
-    t = run_test("Average wickets 4-9",
-                 4 <= avg_wkts <= 9,
-                 f"avg={avg_wkts:.1f}")
-    all_total += 1; all_passed += int(t)
-
-    t = run_test("Chasing win% 30-70%",
-                 30 <= chase_pct <= 70,
-                 f"{chase_pct:.1f}%")
-    all_total += 1; all_passed += int(t)
-
-    # =============================================
-    # TEST 3: Pitch Differentiation
-    # =============================================
-    print("\n--- Test Category 3: Pitch Differentiation ---")
-
-    pitch_scores = {}
-    for pitch_name, pitch in PITCHES.items():
-        p_scores = []
-        for _ in range(30):
-            random.shuffle(players)
-            team1 = build_team(players[:50])
-            team2 = build_team(players[50:100])
-            engine = MatchEngineV2()
-            result = engine.simulate_match(team1, team2, pitch=pitch)
-            p_scores.append(result["innings1"]["runs"])
+    def draw_teams() -> tuple:
+        """Two XIs built from disjoint halves of a random 100-player draw.
+        random.sample picks just the draw, leaving the pool untouched."""
+        drawn = random.sample(range(len(players)), draw_size)
+        return build_team(drawn[:50], players, roles), build_team(drawn[50:], players, roles)
+
+    def matchup() -> tuple:
+        """draw_teams() as player ids for the workers"""
+        team1, team2 = draw_teams()
+        return [p.id for p in team1], [p.id for p in team2]
+
+    # Matches are independent, so Tests 2, 3 and 5 run across a process pool;
+    # each task carries its own seed so workers never replay each other's stream
+    cpus = os.cpu_count() or 1
+
+    def chunksize(n: int) -> int:
+        return max(1, n // (4 * cpus))
+
+    with multiprocessing.Pool(processes=cpus, initializer=_init_worker) as pool:
+        # =============================================
+        # TEST 2: Match Simulation
+        # =============================================
+        print("\n--- Test Category 2: Match Simulation ---")
+
+        tasks = [(random.getrandbits(32), *matchup(), None) for _ in range(num_matches)]
+        rows = list(pool.imap(_play_match, tasks, chunksize=chunksize(len(tasks))))
+
+        # Split the per-match rows into columns once
+        runs1, wkts1, runs2, wkts2, _, winners = zip(*rows)
+        scores = runs1 + runs2
+        wickets = wkts1 + wkts2
+
+        avg_score = fmean(scores)
+        min_score = min(scores)
+        max_score = max(scores)
+        avg_wkts = fmean(wickets)
+        chase_pct = winners.count("team2") / len(winners) * 100
+
+        t = run_test("Average score in T20 range (120-200)",
+                     120 <= avg_score <= 200,
+                     f"avg={avg_score:.1f}")
+        all_total += 1; all_passed += int(t)
+
+        t = run_test("No unrealistic collapses (min > 20)",
+                     min_score > 20,
+                     f"min={min_score}")
+        all_total += 1; all_passed += int(t)
+
+        t = run_test("Max score < 300",
+                     max_score < 300,
+                     f"max={max_score}")
+        all_total += 1; all_passed += int(t)
+
+        t = run_test("Average wickets 4-9",
+                     4 <= avg_wkts <= 9,
+                     f"avg={avg_wkts:.1f}")
+        all_total += 1; all_passed += int(t)
+
+        t = run_test("Chasing win% 30-70%",
+                     30 <= chase_pct <= 70,
+                     f"{chase_pct:.1f}%")
+        all_total += 1; all_passed += int(t)
+
+        # =============================================
+        # TEST 3: Pitch Differentiation
+        # =============================================
+        print("\n--- Test Category 3: Pitch Differentiation ---")
+
+        # Every pitch's matches go to the pool as one batch, so workers never
+        # sit idle waiting for the last match of one pitch before the next
+        tasks = [(random.getrandbits(32), *matchup(), pitch_name)
+                 for pitch_name in PITCHES for _ in range(30)]
+        p_scores = {pitch_name: [] for pitch_name in PITCHES}
+        for task, (runs1, _, runs2, wkts2, balls2, _) in zip(
+                tasks, pool.imap(_play_match, tasks, chunksize=chunksize(len(tasks)))):
+            scores = p_scores[task[3]]
+            scores.append(runs1)
             # Only count 2nd innings if it wasn't a short chase
-            if result["innings2"]["wickets"] == 10 or result["innings2"]["overs"] == "20.0":
-                p_scores.append(result["innings2"]["runs"])
-        pitch_scores[pitch_name] = mean(p_scores)
-
-    # Green seamer should have lower avg score than flat deck
-    t = run_test("Green seamer < flat deck score",
-                 pitch_scores["green_seamer"] < pitch_scores["flat_deck"],
-                 f"green={pitch_scores['green_seamer']:.0f}, flat={pitch_scores['flat_deck']:.0f}")
-    all_total += 1; all_passed += int(t)
-
-    # Dust bowl should have lower score than flat deck
-    t = run_test("Dust bowl < flat deck score",
-                 pitch_scores["dust_bowl"] < pitch_scores["flat_deck"],
-                 f"dust={pitch_scores['dust_bowl']:.0f}, flat={pitch_scores['flat_deck']:.0f}")
-    all_total += 1; all_passed += int(t)
-
-    # =============================================
-    # TEST 4: Commentary & Outcomes
-    # =============================================
-    print("\n--- Test Category 4: Ball Outcomes ---")
-
-    random.shuffle(players)
-    team1 = build_team(players[:50])
-    team2 = build_team(players[50:100])
-    engine = MatchEngineV2()
-    innings = engine.setup_innings(team1, team2, pitch=PITCHES["balanced"])
-    engine.current_innings = innings
-
-    bowler = engine.select_bowler(innings)
-    innings.current_bowler_id = bowler.id
-    outcomes = engine.simulate_over(innings, "balanced")
-
-    has_commentary = all(o.commentary for o in outcomes)
-    t = run_test("All outcomes have commentary",
-                 has_commentary,
-                 f"{len(outcomes)} balls")
-    all_total += 1; all_passed += int(t)
-
-    has_delivery = all(o.delivery_name or o.is_wide or o.is_no_ball for o in outcomes)
-    t = run_test("All legal deliveries have delivery_name",
-                 has_delivery)
-    all_total += 1; all_passed += int(t)
-
-    # =============================================
-    # TEST 5: Aggression modes
-    # =============================================
-    print("\n--- Test Category 5: Aggression Modes ---")
-
-    agg_srs = {}
-    for agg in ["defend", "balanced", "attack"]:
-        runs_total = 0
-        balls_total = 0
-        for _ in range(30):
-            random.shuffle(players)
-            team1 = build_team(players[:50])
-            team2 = build_team(players[50:100])
-            engine = MatchEngineV2()
-            innings = engine.setup_innings(team1, team2, pitch=PITCHES["balanced"])
-
-            # Simulate 5 overs with this aggression
-            for _ in range(5):
-                if innings.is_innings_complete:
-                    break
-                engine.simulate_over(innings, agg)
-
-            runs_total += innings.total_runs
-            balls_total += innings.overs * 6 + innings.balls
-
-        sr = (runs_total / balls_total) * 100 if balls_total > 0 else 0
-        agg_srs[agg] = sr
-
-    t = run_test("Attack SR > Balanced SR",
-                 agg_srs["attack"] > agg_srs["balanced"],
-                 f"attack={agg_srs['attack']:.1f}, balanced={agg_srs['balanced']:.1f}")
-    all_total += 1; all_passed += int(t)
-
-    t = run_test("Balanced SR > Defend SR",
-                 agg_srs["balanced"] > agg_srs["defend"],
-                 f"balanced={agg_srs['balanced']:.1f}, defend={agg_srs['defend']:.1f}")
-    all_total += 1; all_passed += int(t)
+            if wkts2 == 10 or balls2 == 120:
+                scores.append(runs2)
+        pitch_scores = {pitch_name: fmean(scores) for pitch_name, scores in p_scores.items()}
+
+        # Green seamer should have lower avg score than flat deck
+        t = run_test("Green seamer < flat deck score",
+                     pitch_scores["green_seamer"] < pitch_scores["flat_deck"],
+                     f"green={pitch_scores['green_seamer']:.0f}, flat={pitch_scores['flat_deck']:.0f}")
+        all_total += 1; all_passed += int(t)
+
+        # Dust bowl should have lower score than flat deck
+        t = run_test("Dust bowl < flat deck score",
+                     pitch_scores["dust_bowl"] < pitch_scores["flat_deck"],
+                     f"dust={pitch_scores['dust_bowl']:.0f}, flat={pitch_scores['flat_deck']:.0f}")
+        all_total += 1; all_passed += int(t)
+
+        # =============================================
+        # TEST 4: Commentary & Outcomes
+        # =============================================
+        print("\n--- Test Category 4: Ball Outcomes ---")
+
+        team1, team2 = draw_teams()
+        engine = MatchEngineV2()
+        innings = engine.setup_innings(team1, team2, pitch=PITCHES["balanced"])
+        engine.current_innings = innings
+
+        bowler = engine.select_bowler(innings)
+        innings.current_bowler_id = bowler.id
+        outcomes = engine.simulate_over(innings, "balanced")
+
+        has_commentary = all(o.commentary for o in outcomes)
+        t = run_test("All outcomes have commentary",
+                     has_commentary,
+                     f"{len(outcomes)} balls")
+        all_total += 1; all_passed += int(t)
+
+        has_delivery = all(o.delivery_name or o.is_wide or o.is_no_ball for o in outcomes)
+        t = run_test("All legal deliveries have delivery_name",
+                     has_delivery)
+        all_total += 1; all_passed += int(t)
+
+        # =============================================
+        # TEST 5: Aggression modes
+        # =============================================
+        print("\n--- Test Category 5: Aggression Modes ---")
+
+        agg_srs = {}
+        for agg in ["defend", "balanced", "attack"]:
+            runs_total = 0
+            balls_total = 0
+            tasks = [(random.getrandbits(32), *matchup(), agg) for _ in range(30)]
+            for runs, balls in pool.imap(_play_overs, tasks, chunksize=chunksize(len(tasks))):
+                runs_total += runs
+                balls_total += balls
+
+            sr = (runs_total / balls_total) * 100 if balls_total > 0 else 0
+            agg_srs[agg] = sr
+
+        t = run_test("Attack SR > Balanced SR",
+                     agg_srs["attack"] > agg_srs["balanced"],
+                     f"attack={agg_srs['attack']:.1f}, balanced={agg_srs['balanced']:.1f}")
+        all_total += 1; all_passed += int(t)
+
+        t = run_test("Balanced SR > Defend SR",
+                     agg_srs["balanced"] > agg_srs["defend"],
+                     f"balanced={agg_srs['balanced']:.1f}, defend={agg_srs['defend']:.1f}")
+        all_total += 1; all_passed += int(t)
 
     # =============================================
     # SUMMARY
@@ -6,8 +6,11 @@ Run this after generating players to verify distributions are correct.
 Usage:
     python scripts/validate_player_balance.py
 """
+import contextlib
+import io
 import json
-from collections import Counter
+import sys
+from collections import Counter, defaultdict
 from app.generators.player_generator import PlayerGenerator
 from app.models.player import PlayerRole
 
@@ -66,6 +69,9 @@ def validate_distribution():
     players, tier_map = generate_with_tier_tracking()
     print(f"Generated {len(players)} players\n")
 
+    # Parse every player's traits once; all the trait sections below reuse it
+    parsed = [json.loads(p.traits) if p.traits else [] for p in players]
+
     # === BATTING INTENT DISTRIBUTION ===
     print("=" * 50)
     print("BATTING INTENT DISTRIBUTION (Non-Bowlers)")
@@ -99,10 +105,15 @@ def validate_distribution():
     print("TRAIT COUNT DISTRIBUTION")
     print("=" * 50)
 
+    # One pass feeds both the trait-count and the individual-trait tables
     trait_count_dist = Counter()
-    for p in players:
-        traits = json.loads(p.traits) if p.traits else []
+    trait_counts = Counter()
+    traited_players = 0
+    for traits in parsed:
         trait_count_dist[len(traits)] += 1
+        if traits:
+            traited_players += 1
+            trait_counts.update(traits)
 
     total = len(players)
     print(f"\n{'Traits':<10} {'Count':>6} {'Actual%':>8} {'Target%':>8}")
@@ -121,15 +132,6 @@ def validate_distribution():
     print("INDIVIDUAL TRAIT DISTRIBUTION")
     print("=" * 50)
 
-    trait_counts = Counter()
-    traited_players = 0
-    for p in players:
-        traits = json.loads(p.traits) if p.traits else []
-        if traits:
-            traited_players += 1
-            for t in traits:
-                trait_counts[t] += 1
-
     print(f"\nPlayers with traits: {traited_players}/{len(players)} ({traited_players/len(players)*100:.1f}%)")
     print(f"\n{'Trait':<22} {'Count':>6}")
     print("-" * 30)
@@ -148,25 +150,29 @@ def validate_distribution():
 
     expected_rates = {"elite": "~3-5%", "star": "~8-12%", "good": "~12-18%", "solid": "~18-25%"}
 
+    # Invert tier_map once rather than rescanning it for every tier
+    tier_indices = defaultdict(list)
+    for i, t in tier_map.items():
+        tier_indices[t].append(i)
+
     for tier in ["elite", "star", "good", "solid"]:
-        tier_indices = [i for i, t in tier_map.items() if t == tier]
-        tier_players = [players[i] for i in tier_indices]
-        chokers = [p for p in tier_players if "choker" in (p.traits or "")]
-        rate = (len(chokers) / len(tier_players) * 100) if tier_players else 0
+        indices = tier_indices[tier]
+        chokers = [i for i in indices if "choker" in parsed[i]]
+        rate = (len(chokers) / len(indices) * 100) if indices else 0
 
-        print(f"{tier:<10} {len(tier_players):>6} {len(chokers):>8} {rate:>7.1f}% {expected_rates[tier]:>10}")
+        print(f"{tier:<10} {len(indices):>6} {len(chokers):>8} {rate:>7.1f}% {expected_rates[tier]:>10}")
 
     # === SPECIAL COMBOS ===
     print("\n" + "=" * 50)
     print("SPECIAL COMBINATIONS (Auction Highlights)")
     print("=" * 50)
 
-    power_clutch = [p for p in players
-                    if p.batting_intent == "power_hitter" and "clutch" in (p.traits or "")]
-    finisher_batsmen = [p for p in players
-                        if p.role == PlayerRole.BATSMAN and "finisher" in (p.traits or "")]
-    partnership_breakers = [p for p in players
-                            if p.role == PlayerRole.BOWLER and "partnership_breaker" in (p.traits or "")]
+    power_clutch = [p for p, traits in zip(players, parsed)
+                    if p.batting_intent == "power_hitter" and "clutch" in traits]
+    finisher_batsmen = [p for p, traits in zip(players, parsed)
+                        if p.role == PlayerRole.BATSMAN and "finisher" in traits]
+    partnership_breakers = [p for p, traits in zip(players, parsed)
+                            if p.role == PlayerRole.BOWLER and "partnership_breaker" in traits]
 
     print(f"\nPower Hitter + Clutch: {len(power_clutch)} players (should be 0-2)")
     for p in power_clutch:
@@ -180,11 +186,11 @@ def validate_distribution():
     print("ROLE BREAKDOWN")
     print("=" * 50)
 
-    role_counts = Counter(p.role.value for p in players)
+    role_counts = Counter(p.role for p in players)
     print(f"\n{'Role':<15} {'Count':>6}")
     print("-" * 25)
     for role, count in role_counts.most_common():
-        print(f"{role:<15} {count:>6}")
+        print(f"{role.value:<15} {count:>6}")
 
     print("\n" + "=" * 50)
     print("VALIDATION COMPLETE")
@@ -192,4 +198,11 @@ def validate_distribution():
 
 
 if __name__ == "__main__":
-    validate_distribution()
+    # Collect the whole report and write it once instead of per print; the
+    # finally flushes whatever was printed even if validation raises midway
+    buf = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buf):
+            validate_distribution()
+    finally:
+        sys.stdout.write(buf.getvalue())
@@ -0,0 +1,25 @@
+"""
+Shared pytest fixtures.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make the repository root importable however pytest is invoked
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.generators.player_generator import PlayerGenerator
+
+
+@pytest.fixture(scope="session")
+def generated_pool():
+    """One generated 230-player pool, shared read-only by every test."""
+    return tuple(PlayerGenerator.generate_player_pool())
+
+
+@pytest.fixture(scope="session")
+def pool_ovrs(generated_pool):
+    """Overall ratings of the shared pool, in pool order. overall_rating is
+    recomputed on every access, so the column is materialized once here."""
+    return tuple(p.overall_rating for p in generated_pool)
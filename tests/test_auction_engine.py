@@ -2,13 +2,12 @@
 Tests for auction engine fixes.
 """
 import pytest
-import sys
-sys.path.insert(0, '/Users/rsumit123/work/willow-leather-api')
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
-from app.models.player import Player, PlayerRole, BowlingType, BattingStyle
+from app.models.player import PlayerRole, BowlingType, BattingStyle
 from app.models.auction import (
-    Auction, AuctionPlayerEntry, TeamAuctionState,
+    Auction, AuctionPlayerEntry,
     AuctionStatus, AuctionPlayerStatus
 )
 from app.engine.auction_engine import AuctionEngine
@@ -16,34 +15,34 @@ from app.engine.auction_engine import AuctionEngine
 
 def create_mock_player(player_id: int, role: PlayerRole, overall_rating: int = 70, is_overseas: bool = False):
     """Create a mock player for testing."""
-    player = MagicMock(spec=Player)
-    player.id = player_id
-    player.name = f"Player {player_id}"
-    player.role = role
-    player.overall_rating = overall_rating
-    player.is_overseas = is_overseas
-    player.base_price = 5000000
-    player.batting = 60
-    player.bowling = 60
-    player.fielding = 60
-    player.fitness = 60
-    return player
+    return SimpleNamespace(
+        id=player_id,
+        name=f"Player {player_id}",
+        role=role,
+        overall_rating=overall_rating,
+        is_overseas=is_overseas,
+        base_price=5000000,
+        batting=60,
+        bowling=60,
+        fielding=60,
+        fitness=60,
+    )
 
 
 def create_mock_team_state(team_id: int, is_user_team: bool = False):
     """Create a mock team auction state."""
-    state = MagicMock(spec=TeamAuctionState)
-    state.team_id = team_id
-    state.remaining_budget = 900000000  # 90 crore
-    state.total_players = 0
-    state.overseas_players = 0
-    state.batsmen = 0
-    state.bowlers = 0
-    state.all_rounders = 0
-    state.wicket_keepers = 0
-    state.max_bid_possible = 700000000  # 70 crore
-    state.min_players_needed = 18
-    return state
+    return SimpleNamespace(
+        team_id=team_id,
+        remaining_budget=900000000,  # 90 crore
+        total_players=0,
+        overseas_players=0,
+        batsmen=0,
+        bowlers=0,
+        all_rounders=0,
+        wicket_keepers=0,
+        max_bid_possible=700000000,  # 70 crore
+        min_players_needed=18,
+    )
 
 
 class TestSkipCategoryExcludesUserTeam:
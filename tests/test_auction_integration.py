@@ -2,12 +2,12 @@
 Integration tests for auction engine fixes.
 Tests the full flow of skipping categories and category changes.
 """
-import sys
-sys.path.insert(0, '/Users/rsumit123/work/willow-leather-api')
+from collections import Counter
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, func, select
 from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
 from app.database import Base
 from app.models.player import Player, PlayerRole, BowlingType, BattingStyle
@@ -17,43 +17,98 @@ from app.models.auction import (
     AuctionStatus, AuctionPlayerStatus, AuctionCategory
 )
 from app.engine.auction_engine import AuctionEngine
-from app.generators.player_generator import PlayerGenerator
 
 
-@pytest.fixture
-def test_db():
-    """Create an in-memory test database."""
-    engine = create_engine("sqlite:///:memory:")
+# Constructor arguments for the seeded rows, built once at import; every
+# test still gets fresh Team/Player objects from them
+_TEAM_KWARGS = tuple(
+    dict(
+        name=name,
+        short_name=short_name,
+        city="Test City",
+        home_ground="Test Stadium",
+        primary_color="#000000",
+        secondary_color="#FFFFFF",
+        budget=900000000,  # 90 crore
+        remaining_budget=900000000,
+        is_user_team=is_user_team,
+    )
+    for name, short_name, is_user_team in [
+        ("User Team", "USR", True),
+        ("AI Team 1", "AI1", False),
+        ("AI Team 2", "AI2", False),
+        ("AI Team 3", "AI3", False),
+    ]
+)
+
+_PLAYER_KWARGS = tuple(
+    dict(
+        name=f"Player {i}",
+        age=25,
+        nationality="India",
+        is_overseas=i % 4 == 0,  # 25% overseas
+        role=PlayerRole.BATSMAN if i < 10 else PlayerRole.BOWLER,
+        batting_style=BattingStyle.RIGHT_HANDED,
+        bowling_type=BowlingType.NONE if i < 10 else BowlingType.PACE,
+        batting=70 if i < 10 else 30,
+        bowling=30 if i < 10 else 70,
+        fielding=60,
+        fitness=60,
+        power=60,
+        technique=60,
+        running=60,
+        pace_or_spin=60,
+        accuracy=60,
+        variation=50,
+        temperament=60,
+        consistency=60,
+        form=1.0,
+        traits="[]",
+        base_price=5000000,
+    )
+    for i in range(20)
+)
+
+
+@pytest.fixture(scope="session")
+def db_engine():
+    """Create the in-memory database and its schema once per test run."""
+    engine = create_engine("sqlite:///:memory:", poolclass=StaticPool)
+
+    # pysqlite manages BEGIN itself and breaks SAVEPOINT; let SQLAlchemy do it
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     Base.metadata.create_all(engine)
-    session = Session(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def test_db(db_engine):
+    """Session bound to an outer transaction that is rolled back after each
+    test; the fixtures' commits only release savepoints inside it."""
+    connection = db_engine.connect()
+    trans = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint",
+                      expire_on_commit=False)
     yield session
     session.close()
+    trans.rollback()
+    connection.close()
 
 
 @pytest.fixture
 def teams(test_db):
     """Create test teams."""
-    team_data = [
-        {"name": "User Team", "short_name": "USR", "is_user_team": True},
-        {"name": "AI Team 1", "short_name": "AI1", "is_user_team": False},
-        {"name": "AI Team 2", "short_name": "AI2", "is_user_team": False},
-        {"name": "AI Team 3", "short_name": "AI3", "is_user_team": False},
-    ]
-    teams = []
-    for data in team_data:
-        team = Team(
-            name=data["name"],
-            short_name=data["short_name"],
-            city="Test City",
-            home_ground="Test Stadium",
-            primary_color="#000000",
-            secondary_color="#FFFFFF",
-            budget=900000000,  # 90 crore
-            remaining_budget=900000000,
-            is_user_team=data["is_user_team"],
-        )
-        test_db.add(team)
-        teams.append(team)
+    teams = [Team(**kwargs) for kwargs in _TEAM_KWARGS]
+    # One executemany INSERT; return_defaults fills in the ids later fixtures read
+    test_db.bulk_save_objects(teams, return_defaults=True)
     test_db.commit()
     return teams
 
@@ -61,41 +116,15 @@ def teams(test_db):
 @pytest.fixture
 def players(test_db):
     """Create test players."""
-    players = []
-    for i in range(20):
-        player = Player(
-            name=f"Player {i}",
-            age=25,
-            nationality="India",
-            is_overseas=i % 4 == 0,  # 25% overseas
-            role=PlayerRole.BATSMAN if i < 10 else PlayerRole.BOWLER,
-            batting_style=BattingStyle.RIGHT_HANDED,
-            bowling_type=BowlingType.NONE if i < 10 else BowlingType.PACE,
-            batting=70 if i < 10 else 30,
-            bowling=30 if i < 10 else 70,
-            fielding=60,
-            fitness=60,
-            power=60,
-            technique=60,
-            running=60,
-            pace_or_spin=60,
-            accuracy=60,
-            variation=50,
-            temperament=60,
-            consistency=60,
-            form=1.0,
-            traits="[]",
-            base_price=5000000,
-        )
-        test_db.add(player)
-        players.append(player)
+    players = [Player(**kwargs) for kwargs in _PLAYER_KWARGS]
+    test_db.bulk_save_objects(players, return_defaults=True)
     test_db.commit()
     return players
 
 
 @pytest.fixture
-def auction(test_db, teams, players):
-    """Create and initialize an auction."""
+def auction_engine(test_db, teams, players):
+    """Create an auction and return the engine that initialized it."""
     auction = Auction(
         season_id=1,  # Fake season ID
         status=AuctionStatus.NOT_STARTED,
@@ -107,50 +136,66 @@ def auction(test_db, teams, players):
     engine = AuctionEngine(test_db, auction)
     engine.initialize_auction(teams, players)
 
-    return auction
+    return engine
+
+
+@pytest.fixture
+def auction(auction_engine):
+    """The initialized auction."""
+    return auction_engine.auction
 
 
 class TestSkipCategoryIntegration:
     """Integration tests for skip category functionality."""
 
-    def test_skip_category_excludes_user_team_from_purchases(self, test_db, teams, players, auction):
+    def test_skip_category_excludes_user_team_from_purchases(self, test_db, teams, auction_engine):
         """Verify that when user skips a category, no players are assigned to user's team."""
-        engine = AuctionEngine(test_db, auction)
+        engine = auction_engine
+
+        # Get user team's id up front; later reads never touch the ORM object
+        user_team_id = next(t for t in teams if t.is_user_team).id
 
-        # Get user team
-        user_team = next(t for t in teams if t.is_user_team)
+        def team_counts():
+            """Players per team_id, from one grouped query."""
+            return dict(test_db.execute(
+                select(Player.team_id, func.count(Player.id)).group_by(Player.team_id)
+            ).all())
 
-        # Count initial players for user team
-        initial_user_players = test_db.query(Player).filter_by(team_id=user_team.id).count()
-        assert initial_user_players == 0, "User should start with no players"
+        assert user_team_id not in team_counts(), "User should start with no players"
 
         # Skip the batsmen category (user team should be excluded)
-        results = engine.auction_category_ai_only("batsmen", exclude_team_id=user_team.id)
+        results = engine.auction_category_ai_only("batsmen", exclude_team_id=user_team_id)
 
-        # Count players after skipping
-        user_players_after = test_db.query(Player).filter_by(team_id=user_team.id).count()
+        user_players_after = team_counts().get(user_team_id, 0)
 
         # Verify NO players were assigned to user team
         assert user_players_after == 0, \
             f"User team should have 0 players after skip, but has {user_players_after}"
 
+        # Tally AI sales and unsold players in one pass over the results
+        sold_to_ai = unsold = 0
+        for r in results:
+            if not r["is_sold"]:
+                unsold += 1
+            elif r["sold_to_team_id"] != user_team_id:
+                sold_to_ai += 1
+
         # Verify some players were sold to AI teams
-        sold_to_ai = sum(1 for r in results if r["is_sold"] and r["sold_to_team_id"] != user_team.id)
         assert sold_to_ai > 0, "At least some players should be sold to AI teams"
 
         print(f"\nSkip category test results:")
         print(f"  Players auctioned: {len(results)}")
         print(f"  Players sold to AI: {sold_to_ai}")
-        print(f"  Players unsold: {sum(1 for r in results if not r['is_sold'])}")
+        print(f"  Players unsold: {unsold}")
         print(f"  User team players: {user_players_after}")
 
 
 class TestCategoryChangeIntegration:
     """Integration tests for category change detection."""
 
-    def test_auction_tracks_current_category(self, test_db, teams, players, auction):
+    def test_auction_tracks_current_category(self, auction_engine, auction):
         """Verify auction correctly tracks and changes categories."""
-        engine = AuctionEngine(test_db, auction)
+        engine = auction_engine
 
         # Get first player (should be marquee or batsmen depending on OVR)
         first_entry = engine.get_next_player()
@@ -178,23 +223,26 @@ class TestCategoryChangeIntegration:
             engine.start_bidding(entry)
             if auction.current_category not in categories_seen:
                 categories_seen.append(auction.current_category)
-                print(f"  Category changed to: {auction.current_category}")
             engine.finalize_player(entry)
+            if len(categories_seen) >= 2:
+                break  # one observed change is what this test is about
+
+        assert len(categories_seen) >= 2, "Category should change once the first category is exhausted"
 
-        print(f"  Total categories seen: {len(categories_seen)}")
+        print(f"  Category changed to: {categories_seen[1]}")
 
 
 class TestPlayerGenerationIntegration:
     """Integration tests for player generation."""
 
-    def test_generated_pool_suitable_for_auction(self):
+    def test_generated_pool_suitable_for_auction(self, generated_pool, pool_ovrs):
         """Verify generated player pool is suitable for an 8-team auction."""
-        players = PlayerGenerator.generate_player_pool()
+        players = generated_pool
 
         # Basic counts
         total = len(players)
-        indian = sum(1 for p in players if not p.is_overseas)
-        overseas = sum(1 for p in players if p.is_overseas)
+        overseas = sum(p.is_overseas for p in players)
+        indian = total - overseas
 
         print(f"\nGenerated player pool stats:")
         print(f"  Total players: {total}")
@@ -207,7 +255,7 @@ class TestPlayerGenerationIntegration:
         assert indian >= 144, f"Need at least 144 Indian (18 per team), got {indian}"
 
         # Verify OVR distribution
-        ovrs = [p.overall_rating for p in players]
+        ovrs = pool_ovrs
         min_ovr = min(ovrs)
         max_ovr = max(ovrs)
         avg_ovr = sum(ovrs) / len(ovrs)
@@ -219,9 +267,7 @@ class TestPlayerGenerationIntegration:
         assert min_ovr >= 55, f"Minimum OVR should be >= 55, got {min_ovr}"
 
         # Verify role distribution for each team's needs
-        role_counts = {}
-        for p in players:
-            role_counts[p.role] = role_counts.get(p.role, 0) + 1
+        role_counts = Counter(p.role for p in players)
 
         print(f"  Role distribution:")
         for role, count in role_counts.items():
@@ -4,9 +4,12 @@ Pytest tests for match engine score ranges and constraints.
 Run with: pytest tests/test_match_engine_ranges.py -v
 """
 
+import random
+from functools import lru_cache
+
 import pytest
-from app.engine.match_engine import MatchEngine, MatchContext, BatterState, InningsState
-from app.models.player import Player, PlayerRole, BowlingType, BattingStyle
+from app.engine.match_engine import MatchEngine, MatchContext, BatterState, InningsState, PlayerLite
+from app.models.player import PlayerRole, BowlingType
 
 
 def create_mock_player(
@@ -16,37 +19,23 @@ def create_mock_player(
     batting: int = 70,
     bowling: int = 70,
     bowling_type: BowlingType = BowlingType.MEDIUM
-) -> Player:
-    """Create a mock player for testing"""
-    return Player(
+) -> PlayerLite:
+    """Create a mock player for testing; the engine only reads PlayerLite's fields"""
+    return PlayerLite(
         id=id,
         name=name,
-        age=25,
-        nationality="Test",
-        is_overseas=False,
         role=role,
-        batting_style=BattingStyle.RIGHT_HANDED,
         bowling_type=bowling_type,
         batting=batting,
         bowling=bowling,
-        fielding=70,
-        fitness=70,
         power=70,
-        technique=70,
-        running=70,
-        pace_or_spin=70,
-        accuracy=70,
-        variation=70,
-        temperament=70,
-        consistency=70,
-        form=1.0,
-        base_price=100000,
     )
 
 
-def create_test_team(skill_level: int = 70) -> list[Player]:
-    """Create a test team with 11 players"""
-    return [
+@lru_cache(maxsize=None)
+def create_test_team(skill_level: int = 70) -> tuple[PlayerLite, ...]:
+    """Create a test team with 11 players (immutable, so built once per skill level)"""
+    return (
         create_mock_player(1, "Opener1", PlayerRole.BATSMAN, skill_level + 10, skill_level - 20),
         create_mock_player(2, "Opener2", PlayerRole.BATSMAN, skill_level + 5, skill_level - 20),
         create_mock_player(3, "Batter3", PlayerRole.BATSMAN, skill_level + 8, skill_level - 20),
@@ -58,7 +47,7 @@ def create_test_team(skill_level: int = 70) -> list[Player]:
         create_mock_player(9, "Bowler2", PlayerRole.BOWLER, skill_level - 25, skill_level + 8, BowlingType.PACE),
         create_mock_player(10, "Bowler3", PlayerRole.BOWLER, skill_level - 30, skill_level + 5, BowlingType.LEG_SPIN),
         create_mock_player(11, "Bowler4", PlayerRole.BOWLER, skill_level - 35, skill_level + 3, BowlingType.OFF_SPIN),
-    ]
+    )
 
 
 class TestCollapseRemoved:
@@ -93,11 +82,13 @@ class TestMinimumScoreFloor:
         weak_team = create_test_team(50)  # Weak team
         strong_team = create_test_team(90)  # Strong bowling
 
-        num_tests = 30
+        # Seeded so the extremes are reproducible; a few innings cover the guard
+        rng = random.Random(42)
+        num_tests = 5
         min_score = 1000
+        engine = MatchEngine(rng=rng)
 
         for _ in range(num_tests):
-            engine = MatchEngine()
             innings = engine.setup_innings(weak_team, strong_team)
 
             while not innings.is_innings_complete:
@@ -118,11 +109,13 @@ class TestMaximumScoreCeiling:
         strong_team = create_test_team(90)  # Strong batting
         weak_team = create_test_team(50)  # Weak bowling
 
-        num_tests = 30
+        # Seeded so the extremes are reproducible; a few innings cover the guard
+        rng = random.Random(42)
+        num_tests = 5
         max_score = 0
+        engine = MatchEngine(rng=rng)
 
         for _ in range(num_tests):
-            engine = MatchEngine()
             innings = engine.setup_innings(strong_team, weak_team)
 
             while not innings.is_innings_complete:
@@ -189,9 +182,9 @@ class TestWicketRate:
         total_balls = 0
         total_wickets = 0
         num_tests = 20
+        engine = MatchEngine()
 
         for _ in range(num_tests):
-            engine = MatchEngine()
             innings = engine.setup_innings(team1, team2)
 
             while not innings.is_innings_complete:
@@ -2,8 +2,8 @@
 Tests for player generator - verifying all players have 55+ OVR.
 """
 import pytest
-import sys
-sys.path.insert(0, '/Users/rsumit123/work/willow-leather-api')
+from bisect import bisect_right
+from collections import Counter
 
 from app.generators.player_generator import PlayerGenerator
 from app.models.player import PlayerRole
@@ -12,44 +12,41 @@ from app.models.player import PlayerRole
 class TestPlayerGeneratorMinimumOVR:
     """Test that all generated players have minimum 55 OVR."""
 
-    def test_single_player_has_minimum_ovr(self):
+    @pytest.mark.parametrize("tier", ["elite", "star", "good", "solid"])
+    def test_single_player_has_minimum_ovr(self, tier):
         """Verify a single generated player has 55+ OVR."""
-        for tier in ["elite", "star", "good", "solid"]:
-            for _ in range(10):  # Test multiple times per tier
-                player = PlayerGenerator.generate_player(tier=tier)
-                assert player.overall_rating >= 55, \
-                    f"Player {player.name} (tier={tier}) has OVR {player.overall_rating} < 55"
+        for _ in range(10):  # Test multiple times per tier
+            player = PlayerGenerator.generate_player(tier=tier)
+            assert player.overall_rating >= 55, \
+                f"Player {player.name} (tier={tier}) has OVR {player.overall_rating} < 55"
 
-    def test_player_pool_all_above_minimum_ovr(self):
+    def test_player_pool_all_above_minimum_ovr(self, pool_ovrs):
         """Verify all players in generated pool have 55+ OVR."""
-        players = PlayerGenerator.generate_player_pool()
-
-        min_ovr = min(p.overall_rating for p in players)
-        below_55 = [p for p in players if p.overall_rating < 55]
+        min_ovr = min(pool_ovrs)
+        below_55 = [o for o in pool_ovrs if o < 55]
 
         assert len(below_55) == 0, \
             f"Found {len(below_55)} players below 55 OVR. Minimum OVR: {min_ovr}"
 
-    def test_player_pool_size_is_230(self):
+    def test_player_pool_size_is_230(self, generated_pool):
         """Verify player pool has 230 players."""
-        players = PlayerGenerator.generate_player_pool()
+        players = generated_pool
         assert len(players) == 230, f"Expected 230 players, got {len(players)}"
 
-    def test_role_distribution_is_balanced(self):
+    def test_role_distribution_is_balanced(self, generated_pool):
         """Verify player pool has reasonable role distribution."""
-        players = PlayerGenerator.generate_player_pool()
+        players = generated_pool
 
-        role_counts = {role: 0 for role in PlayerRole}
-        for player in players:
-            role_counts[player.role] += 1
+        role_counts = Counter(p.role for p in players)
 
         # Each role should have at least 20 players
-        for role, count in role_counts.items():
+        for role in PlayerRole:
+            count = role_counts[role]
             assert count >= 20, f"Role {role.value} only has {count} players (expected >= 20)"
 
-    def test_overseas_distribution(self):
+    def test_overseas_distribution(self, generated_pool):
         """Verify reasonable overseas player distribution for IPL rules."""
-        players = PlayerGenerator.generate_player_pool()
+        players = generated_pool
 
         overseas = sum(1 for p in players if p.is_overseas)
         indian = len(players) - overseas
@@ -108,11 +105,9 @@ class TestPlayerGeneratorMinimumOVR:
         assert player.overall_rating >= 55, \
             f"After _ensure_minimum_ovr, OVR should be >= 55, got {player.overall_rating}"
 
-    def test_ovr_distribution_is_reasonable(self):
+    def test_ovr_distribution_is_reasonable(self, pool_ovrs):
         """Verify OVR distribution across the player pool."""
-        players = PlayerGenerator.generate_player_pool()
-
-        ovrs = [p.overall_rating for p in players]
+        ovrs = pool_ovrs
         avg_ovr = sum(ovrs) / len(ovrs)
         min_ovr = min(ovrs)
         max_ovr = max(ovrs)
@@ -132,10 +127,12 @@ class TestPlayerGeneratorMinimumOVR:
         print(f"  Max: {max_ovr}")
         print(f"  Avg: {avg_ovr:.1f}")
 
-        # Count by OVR ranges
+        # Count by OVR ranges, bucketing every rating in one pass
         ranges = [(55, 65), (65, 75), (75, 85), (85, 100)]
-        for low, high in ranges:
-            count = sum(1 for o in ovrs if low <= o < high)
+        bounds = [high for _, high in ranges]
+        counts = Counter(bisect_right(bounds, o) for o in ovrs if 55 <= o < 100)
+        for i, (low, high) in enumerate(ranges):
+            count = counts[i]
             pct = count / len(ovrs) * 100
             print(f"  {low}-{high}: {count} ({pct:.1f}%)")
 
@@ -0,0 +1,32 @@
+"""
+Tests for the Player model's cached DNA properties.
+"""
+import json
+
+import pytest
+
+from app.generators.player_generator import PlayerGenerator
+
+
+class TestPlayerDNACache:
+    """Test that DNA is parsed once per JSON value."""
+
+    def test_batting_dna_parsed_once(self):
+        """Repeated reads return the same parsed object."""
+        player = PlayerGenerator.generate_player(tier="good")
+        assert player.batting_dna is player.batting_dna
+
+    def test_new_json_is_reparsed(self):
+        """Assigning new JSON (as training does) invalidates the cached DNA."""
+        player = PlayerGenerator.generate_player(tier="good")
+        dna = player.batting_dna
+        data = dna.to_dict()
+        data["vs_pace"] = min(99, dna.vs_pace + 1)
+        player.batting_dna_json = json.dumps(data)
+
+        assert player.batting_dna is not dna
+        assert player.batting_dna.vs_pace == data["vs_pace"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])